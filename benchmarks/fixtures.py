@@ -0,0 +1,163 @@
+"""
+Fixtures sintéticas dos benchmarks - DDPs, specs, business-rules e catálogos de complexidade
+
+Tudo é gerado em diretórios temporários a partir dos templates do pacote,
+para que os números não dependam de projetos reais.
+"""
+import json
+from pathlib import Path
+
+from rpa_speckit import templates as templates_package
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    # Python < 3.9 fallback
+    from importlib_resources import files as resource_files
+
+
+def read_package_template(name: str) -> str:
+    """
+    Lê um template .md do pacote
+
+    Args:
+        name: Nome do arquivo em rpa_speckit/templates
+
+    Returns:
+        Conteúdo do template
+    """
+    return (resource_files(templates_package) / name).read_text(encoding="utf-8")
+
+
+def make_ddp(path: Path, slides: int) -> Path:
+    """
+    Cria um DDP.pptx com título e corpo de texto em cada slide
+
+    Args:
+        path: Caminho do arquivo a criar
+        slides: Quantidade de slides
+
+    Returns:
+        Caminho do DDP criado
+    """
+    from pptx import Presentation
+
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]
+    for index in range(1, slides + 1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Etapa {index} - Acessar sistema e validar dados"
+        slide.placeholders[1].text = "\n".join(
+            f"Passo {index}.{step}: preencher o campo {step} e clicar em Confirmar" for step in range(1, 6)
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    presentation.save(str(path))
+    return path
+
+
+def make_business_rules(rules: int) -> str:
+    """
+    Gera um business-rules.md com VAL*/COND* (metade de cada) e algumas exceções
+
+    Args:
+        rules: Quantidade total de regras VAL/COND
+
+    Returns:
+        Conteúdo Markdown
+    """
+    lines = ["# Regras de Negócio", "", "## Validações de Entrada", ""]
+    validations = (rules + 1) // 2
+    for number in range(1, validations + 1):
+        lines += [f"### VAL{number:03d}: Validar campo {number}", "",
+                  f"- **Descrição:** Campo {number} deve estar preenchido", "- **Ação:** BusinessRuleException", ""]
+    lines += ["## Condições Especiais", ""]
+    for number in range(1, rules - validations + 1):
+        lines += [f"### COND{number:03d}: Condição {number}", "",
+                  f"- **Quando:** valor {number} acima do limite", "- **Ação:** seguir fluxo alternativo", ""]
+    lines += ["## Business Exceptions", "", "### EXC001: Dados inválidos", "", "- **Tratamento:** BUSINESS ERROR", ""]
+    return "\n".join(lines)
+
+
+def make_tasks(robots: int, process_tasks: int = 5) -> str:
+    """
+    Gera um tasks.md com as três fases e o campo Robô de cada task
+
+    Args:
+        robots: Quantidade de robôs (0 para standalone)
+        process_tasks: Quantidade de Tasks 2.x por robô
+
+    Returns:
+        Conteúdo Markdown
+    """
+    robot_names = [f"robot{index}" for index in range(1, robots + 1)] or ["raiz"]
+    lines = ["# Tasks", ""]
+    phases = [
+        (1, "INIT - Inicialização", 2),
+        (2, "LOOP STATION - Processamento Principal", process_tasks),
+        (3, "END PROCESS - Finalização", 2),
+    ]
+    for phase, title, count in phases:
+        lines += [f"## Fase {phase}: {title}", ""]
+        minor = 0
+        for robot in robot_names:
+            for _ in range(count):
+                minor += 1
+                lines += [f"### Task {phase}.{minor}: Etapa {minor} do {robot}", "",
+                          f"- **Robô:** {robot}", "- **Estimativa:** 2h", ""]
+    return "\n".join(lines)
+
+
+def make_spec_tree(root: Path, robots: int, rules: int = 20) -> Path:
+    """
+    Cria specs/001-bench com N robôs (ou standalone se robots <= 1)
+
+    Args:
+        root: Raiz do projeto sintético
+        robots: Quantidade de robôs
+        rules: Quantidade de regras VAL/COND em cada business-rules.md
+
+    Returns:
+        Diretório da spec (specs/001-bench)
+    """
+    spec_dir = root / "specs" / "001-bench"
+    spec_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {
+        'spec.md': read_package_template("spec-template.md"),
+        'selectors.md': read_package_template("selectors-template.md"),
+        'tests.md': read_package_template("tests-template.md"),
+        'business-rules.md': make_business_rules(rules),
+    }
+    robot_dirs = [spec_dir / f"robot{index}" for index in range(1, robots + 1)] if robots > 1 else [spec_dir]
+    for robot_dir in robot_dirs:
+        robot_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in files.items():
+            (robot_dir / name).write_text(content, encoding="utf-8")
+    (spec_dir / "tasks.md").write_text(make_tasks(robots if robots > 1 else 0), encoding="utf-8")
+    return spec_dir
+
+
+def make_complexity_catalog(systems: int) -> str:
+    """
+    Gera um catálogo no formato de memory/system_complexity.json com N sistemas
+
+    Args:
+        systems: Quantidade total de sistemas
+
+    Returns:
+        JSON do catálogo
+    """
+    categories = ["conhecidos", "portais_governo", "sistemas_legados", "sistemas_customizados"]
+    catalog = {
+        "version": "bench",
+        "multiplicadores_base": {category: 1.0 + index * 0.2 for index, category in enumerate(categories)},
+        "sistemas": {category: {} for category in categories},
+    }
+    for index in range(systems):
+        category = categories[index % len(categories)]
+        catalog["sistemas"][category][f"Sistema {index:05d}"] = {
+            "multiplicador": 1.0 + (index % 9) / 10,
+            "tipo": "ERP",
+            "interface": "Web",
+            "observacao": "Sistema sintético gerado para benchmark",
+        }
+    return json.dumps(catalog, ensure_ascii=False, indent=2)
@@ -0,0 +1,251 @@
+"""
+Benchmarks do T2C SpecKit - mede o próprio toolchain com fixtures sintéticas
+
+Uso:
+    python benchmarks/run.py                       # suíte completa
+    python benchmarks/run.py --quick               # tamanhos menores (CI / verificação rápida)
+    python benchmarks/run.py --only generate       # apenas casos cujo nome contém "generate"
+    python benchmarks/run.py --compare benchmarks/results/0.1.0.json
+
+Cada caso é executado --repeat vezes; o resultado (mínimo, mediana e média em
+segundos) é gravado em JSON em benchmarks/results/<versão>-<datahora>.json (ignorado
+pelo git); baselines para comparação entre versões são gravadas com --output
+benchmarks/results/<versão>.json e versionadas.
+Com --compare, casos mais lentos que o limite (--threshold) em relação ao
+arquivo de referência são listados e o script retorna código 1.
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from rich.console import Console
+
+# Permite executar como script (python benchmarks/run.py) sem instalar o diretório benchmarks
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fixtures  # noqa: E402
+
+import rpa_speckit  # noqa: E402
+from rpa_speckit.commands.init import init_project  # noqa: E402
+from rpa_speckit.utils.ddp_extractor import extract_ddp  # noqa: E402
+from rpa_speckit.utils.framework_generator import T2CFrameworkGenerator  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Nome -> tamanhos (completo, rápido)
+SIZES = {
+    'extract_ddp': ([10, 100, 1000], [10, 100]),
+    'read_validate_specs': ([1, 10, 50], [1, 10]),
+    'generate_custom_files': ([10, 1000, 10000], [10, 1000]),
+    'generate': ([1, 10, 50], [1, 5]),
+    'complexity_catalog': ([10, 1000, 10000], [10, 1000]),
+}
+
+
+def _time(func: Callable[[], object], repeat: int, setup: Callable[[], None] = None) -> Dict:
+    """
+    Executa uma função várias vezes e resume os tempos
+
+    Args:
+        func: Função medida
+        repeat: Quantidade de execuções
+        setup: Preparação executada antes de cada execução (fora da medição)
+
+    Returns:
+        Dicionário com runs, min, median e mean (segundos)
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        'runs': repeat,
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.mean(timings),
+    }
+
+
+def bench_extract_ddp(workdir: Path, slides: int, repeat: int) -> Dict:
+    """Extração de texto de um DDP com N slides"""
+    ddp = fixtures.make_ddp(workdir / f"ddp_{slides}.pptx", slides)
+    return _time(lambda: extract_ddp(str(ddp)), repeat)
+
+
+def bench_read_validate_specs(workdir: Path, robots: int, repeat: int) -> Dict:
+    """Leitura + validação das specs de todos os robôs"""
+    spec_dir = fixtures.make_spec_tree(workdir / f"specs_{robots}", robots)
+
+    def run():
+        generator = T2CFrameworkGenerator(str(spec_dir))
+        generator.detect_structure()
+        for robot_name in generator.robot_list or [None]:
+            specs = generator.read_specs(spec_dir / robot_name if robot_name else None)
+            generator.validate_specs(specs)
+
+    return _time(run, repeat)
+
+
+def bench_generate_custom_files(workdir: Path, rules: int, repeat: int) -> Dict:
+    """Geração de bot.py/T2CProcess/Init/Close com N regras VAL/COND"""
+    spec_dir = fixtures.make_spec_tree(workdir / f"rules_{rules}", 1, rules)
+    generator = T2CFrameworkGenerator(str(spec_dir))
+    generator.specs = generator.read_specs()
+    templates_dir = Path(rpa_speckit.__file__).parent / "templates" / "code"
+
+    def setup():
+        generator.generate_project_structure("bench", workdir / f"out_rules_{rules}")
+
+    return _time(lambda: generator.generate_custom_files(templates_dir), repeat, setup)
+
+
+def bench_generate(workdir: Path, robots: int, repeat: int) -> Dict:
+    """generate() completo (skip_download=True) para N robôs"""
+    spec_dir = fixtures.make_spec_tree(workdir / f"gen_{robots}", robots)
+    output_dir = workdir / f"out_gen_{robots}"
+    return _time(lambda: T2CFrameworkGenerator(str(spec_dir)).generate(output_dir, skip_download=True), repeat)
+
+
+def bench_complexity_catalog(workdir: Path, systems: int, repeat: int) -> Dict:
+    """Leitura do catálogo de complexidade e busca de um sistema pelo nome"""
+    catalog_file = workdir / f"system_complexity_{systems}.json"
+    catalog_file.write_text(fixtures.make_complexity_catalog(systems), encoding="utf-8")
+    target = f"Sistema {systems - 1:05d}"
+
+    def run():
+        catalog = json.loads(catalog_file.read_text(encoding="utf-8"))
+        index = {name: data for category in catalog["sistemas"].values() for name, data in category.items()}
+        return index[target]["multiplicador"]
+
+    return _time(run, repeat)
+
+
+def bench_init_project(workdir: Path, ai_assistant: str, repeat: int) -> Dict:
+    """t2c init (sem prompts) para um AI assistant"""
+    console = Console(file=io.StringIO())
+    counter = iter(range(repeat))
+    return _time(lambda: init_project(str(workdir / f"init_{ai_assistant}_{next(counter)}"), ai_assistant, console), repeat)
+
+
+def bench_cli_startup(workdir: Path, command: str, repeat: int) -> Dict:
+    """Tempo de `t2c <comando> --help` em um processo novo (imports + click)"""
+    args = [sys.executable, "-m", "rpa_speckit.cli"] + command.split() + ["--help"]
+    return _time(lambda: subprocess.run(args, check=True, capture_output=True), repeat)
+
+
+def build_cases(quick: bool) -> List[Dict]:
+    """
+    Monta a lista de casos (nome, parâmetro, função)
+
+    Args:
+        quick: Usar os tamanhos reduzidos
+
+    Returns:
+        Lista de casos
+    """
+    pick = 1 if quick else 0
+    cases = []
+    table = [
+        ('extract_ddp', 'slides', bench_extract_ddp),
+        ('read_validate_specs', 'robots', bench_read_validate_specs),
+        ('generate_custom_files', 'rules', bench_generate_custom_files),
+        ('generate', 'robots', bench_generate),
+        ('complexity_catalog', 'systems', bench_complexity_catalog),
+    ]
+    for name, param, func in table:
+        for size in SIZES[name][pick]:
+            cases.append({'name': f"{name}[{param}={size}]", 'func': func, 'arg': size})
+    for ai_assistant in ("cursor", "vscode-copilot", "vscode-claude", "other"):
+        cases.append({'name': f"init_project[{ai_assistant}]", 'func': bench_init_project, 'arg': ai_assistant})
+    for command in ("", "init", "validate"):
+        cases.append({'name': f"cli_startup[{command or 'root'}]", 'func': bench_cli_startup, 'arg': command})
+    return cases
+
+
+def compare(results: Dict, baseline_file: Path, threshold: float, min_ms: float) -> List[str]:
+    """
+    Compara as medianas com um arquivo de resultados anterior
+
+    Args:
+        results: Resultados atuais
+        baseline_file: JSON de referência
+        threshold: Razão atual/referência a partir da qual é regressão (ex: 1.2)
+        min_ms: Casos abaixo desse tempo (ms) não são considerados (ruído de medição)
+
+    Returns:
+        Lista de regressões formatadas
+    """
+    baseline_data = json.loads(baseline_file.read_text(encoding="utf-8"))
+    baseline = baseline_data['results']
+    regressions = []
+    print(f"\nComparação com {baseline_file} (versão {baseline_data['version']}):")
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        ratio = current['median'] / baseline[name]['median'] if baseline[name]['median'] else float('inf')
+        regression = ratio > threshold and current['median'] * 1000 >= min_ms
+        marker = "  REGRESSÃO" if regression else ""
+        print(f"  {name:<45} {baseline[name]['median'] * 1000:10.1f} ms -> {current['median'] * 1000:10.1f} ms  x{ratio:5.2f}{marker}")
+        if regression:
+            regressions.append(f"{name}: x{ratio:.2f}")
+    return regressions
+
+
+def main():
+    """Executa a suíte e grava o JSON de resultados"""
+    parser = argparse.ArgumentParser(description="Benchmarks do T2C SpecKit")
+    parser.add_argument("--quick", action="store_true", help="Tamanhos reduzidos")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por caso (default: 3)")
+    parser.add_argument("--only", default=None, help="Executa apenas casos cujo nome contém o texto")
+    parser.add_argument("--output", type=Path, default=None, help="Arquivo JSON de saída")
+    parser.add_argument("--compare", type=Path, default=None, help="JSON de referência para detectar regressões")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Razão de regressão (default: 1.2)")
+    parser.add_argument("--min-ms", type=float, default=1.0,
+                        help="Ignora regressões em casos abaixo desse tempo em ms (default: 1.0)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="t2c-bench-") as tmp:
+        workdir = Path(tmp)
+        for case in build_cases(args.quick):
+            if args.only and args.only not in case['name']:
+                continue
+            case_dir = workdir / str(len(results))
+            case_dir.mkdir()
+            results[case['name']] = case['func'](case_dir, case['arg'], args.repeat)
+            print(f"{case['name']:<45} mediana {results[case['name']]['median'] * 1000:10.1f} ms")
+
+    output = args.output or RESULTS_DIR / f"{rpa_speckit.__version__}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'version': rpa_speckit.__version__,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'repeat': args.repeat,
+        'results': results,
+    }, indent=2), encoding="utf-8")
+    print(f"\nResultados gravados em {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold, args.min_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de x{args.threshold}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
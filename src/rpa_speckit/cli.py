@@ -1,6 +1,8 @@
 """
 CLI principal do RPA Spec-Kit
 """
+import json
+
 import click
 from rich.console import Console
 from rich.panel import Panel
@@ -9,6 +11,13 @@ from rich import box
 from rich.align import Align
 
 from rpa_speckit.commands.init import init_project
+from rpa_speckit.commands.validate import validate_project
+from rpa_speckit.commands.extract import extract_command, list_ddps
+from rpa_speckit.commands.watch import watch_project
+from rpa_speckit.commands.diff import diff_spec
+from rpa_speckit.commands.daemon import call_daemon, daemon_status, start_daemon, stop_daemon
+from rpa_speckit.utils.daemon_client import DaemonError
+from rpa_speckit.utils import tracing
 
 console = Console()
 
@@ -99,14 +108,29 @@ def print_banner():
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="t2c")
-def cli():
+@click.option("--trace", "trace_file", type=click.Path(dir_okay=False), default=None,
+              help="Grava spans/contadores de tempo (Chrome Trace JSON, ou JSON lines se .jsonl)")
+@click.pass_context
+def cli(ctx, trace_file):
     """
     T2C SpecKit - Toolkit para Spec-Driven Development de RPA
     
     Crie projetos de automação RPA seguindo o padrão Spec-Driven Development
     com integração completa ao Framework T2C.
     """
-    pass
+    if trace_file:
+        tracing.enable()
+        ctx.call_on_close(lambda: _write_trace(trace_file))
+
+
+def _write_trace(trace_file: str):
+    """Grava o trace ao final do comando (inclusive quando ele falha)"""
+    output = tracing.write(trace_file)
+    # stderr: não mistura com relatórios de máquina (validate --format json)
+    err_console = Console(stderr=True)
+    for entry in tracing.get_tracer().summary()[:5]:
+        err_console.print(f"[dim]{entry['name']:<30} {entry['total_ms']:10.1f} ms ({entry['calls']}x)[/dim]")
+    err_console.print(f"[dim]Trace gravado em {output}[/dim]")
 
 
 @cli.command()
@@ -170,6 +194,171 @@ def init(project_name):
         raise click.Abort()
 
 
+@cli.command()
+@click.argument("path", required=False, default=".")
+@click.option("--format", "output_format", type=click.Choice(["text", "json", "sarif"]), default="text",
+              help="Formato do relatório")
+@click.option("--output", "-o", "output_file", type=click.Path(dir_okay=False), default=None,
+              help="Grava o relatório em arquivo")
+@click.option("--no-cache", is_flag=True, default=False, help="Revalida tudo, ignorando .specify/cache/")
+@click.option("--jobs", "-j", type=int, default=None, help="Número de verificações em paralelo")
+def validate(path, output_format, output_file, no_cache, jobs):
+    """
+    Valida as specs do projeto (ou de uma única spec).
+
+    PATH pode ser a raiz do projeto (valida todas as specs em specs/) ou
+    o diretório de uma spec (specs/001-[nome]). Retorna código 1 se houver erros.
+    """
+    try:
+        result = validate_project(path, output_format, console, output_file, not no_cache, jobs)
+    except Exception as e:
+        console.print(f"[bold red]Erro ao validar specs:[/bold red] {str(e)}")
+        raise click.Abort()
+
+    if result['errors']:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.argument("ddp_path", required=False)
+@click.option("--output", "-o", "output_file", type=click.Path(dir_okay=False), default=None,
+              help="Grava o texto extraído em arquivo")
+@click.option("--list", "list_only", is_flag=True, default=False, help="Lista os DDPs do projeto sem extrair")
+@click.option("--stale", is_flag=True, default=False, help="Lista apenas DDPs alterados desde a última extração")
+def extract(ddp_path, output_file, list_only, stale):
+    """
+    Extrai o texto de um DDP.pptx.
+
+    DDP_PATH pode ser o caminho do .pptx ou o nome de uma spec (ex: 001-cadastro).
+    Sem DDP_PATH, usa o primeiro .pptx em DDP/ ou specs/*/DDP/ (índice em .specify/cache/).
+    """
+    try:
+        if list_only or stale:
+            list_ddps(console, only_stale=stale)
+            return
+        extract_command(ddp_path, console, output_file)
+    except FileNotFoundError as e:
+        console.print(f"[bold red]Erro:[/bold red] {str(e)}")
+        raise SystemExit(1)
+    except Exception as e:
+        console.print(f"[bold red]Erro ao extrair DDP:[/bold red] {str(e)}")
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument("spec_dir", required=False, default=None)
+@click.option("--generate", is_flag=True, default=False,
+              help="Regenera o robô afetado quando a validação passar (sobrescreve generated/<projeto>, como /t2c.implement)")
+@click.option("--output", "output_dir", type=click.Path(file_okay=False), default=None,
+              help="Diretório de saída da geração (default: generated/)")
+@click.option("--debounce", type=float, default=0.5, help="Segundos sem mudanças antes de processar (default: 0.5)")
+@click.option("--poll", is_flag=True, default=False, help="Usa polling mesmo com watchdog instalado")
+def watch(spec_dir, generate, output_dir, debounce, poll):
+    """
+    Observa uma spec e reexecuta só a etapa afetada.
+
+    DDP alterado: extrai para .specify/cache/ddp/. Markdown alterado em
+    SPEC_DIR ou config/: revalida e, com --generate, regenera o robô afetado.
+    Sem SPEC_DIR, observa a primeira spec em specs/.
+    """
+    try:
+        watch_project(spec_dir, console, output_dir, generate, debounce, poll)
+    except Exception as e:
+        console.print(f"[bold red]Erro ao observar specs:[/bold red] {str(e)}")
+        raise click.Abort()
+
+
+@cli.command()
+@click.argument("spec", required=False, default=None)
+@click.option("--format", "output_format", type=click.Choice(["prompt", "json"]), default="prompt",
+              help="Formato do delta (prompt: Markdown para o assistente)")
+@click.option("--output", "-o", "output_file", type=click.Path(dir_okay=False), default=None,
+              help="Grava o delta em arquivo")
+@click.option("--no-save", is_flag=True, default=False,
+              help="Só mostra o delta, sem torná-lo a base do próximo diff")
+@click.option("--no-ddp", is_flag=True, default=False, help="Ignora os DDPs")
+def diff(spec, output_format, output_file, no_save, no_ddp):
+    """
+    Mostra o que mudou na spec e no DDP desde o último diff.
+
+    Compara seções, regras (VAL/COND/EXC), tasks, seletores e slides do DDP
+    por ID estável com o snapshot em .specify/cache/spec-snapshots/ e emite um
+    prompt só com os itens adicionados, alterados e removidos. SPEC pode ser o
+    diretório, o nome ou o prefixo da spec (default: a primeira em specs/).
+    """
+    try:
+        diff_spec(spec, console, output_format, output_file, not no_save, not no_ddp)
+    except FileNotFoundError as e:
+        console.print(f"[bold red]Erro:[/bold red] {str(e)}")
+        raise SystemExit(1)
+    except Exception as e:
+        console.print(f"[bold red]Erro ao comparar a spec:[/bold red] {str(e)}")
+        raise click.Abort()
+
+
+@cli.group()
+def daemon():
+    """
+    Daemon opcional que mantém specs, constitution e DDPs em memória.
+
+    Escuta em .specify/cache/t2c.sock (protocolo: uma linha JSON por requisição)
+    e responde validate, estimate, extract, plan e constitution em milissegundos.
+    Requer sockets Unix (Linux/macOS).
+    """
+
+
+@daemon.command("start")
+@click.option("--detach", "-d", is_flag=True, default=False, help="Inicia em segundo plano")
+@click.option("--idle-timeout", type=float, default=1800,
+              help="Segundos sem requisições até encerrar (0 desliga; default: 1800)")
+@click.option("--poll", is_flag=True, default=False, help="Usa polling mesmo com watchdog instalado")
+def daemon_start(detach, idle_timeout, poll):
+    """Inicia o daemon do projeto atual."""
+    try:
+        start_daemon(console, idle_timeout, detach, poll)
+    except Exception as e:
+        console.print(f"[bold red]Erro ao iniciar o daemon:[/bold red] {str(e)}")
+        raise click.Abort()
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Encerra o daemon do projeto atual."""
+    stop_daemon(console)
+
+
+@daemon.command("status")
+def daemon_status_command():
+    """Mostra se o daemon está rodando e o tamanho dos caches."""
+    daemon_status(console)
+
+
+@daemon.command("call")
+@click.argument("cmd")
+@click.argument("args", nargs=-1)
+def daemon_call(cmd, args):
+    """
+    Envia um comando ao daemon e imprime a resposta em JSON.
+
+    ARGS no formato chave=valor (valores JSON são convertidos), ex:
+    t2c daemon call estimate system=e-CAC interface="Web Legado" horas=2
+    """
+    kwargs = {}
+    for arg in args:
+        key, separator, value = arg.partition("=")
+        if not separator:
+            raise click.BadParameter(f"Use chave=valor: {arg}")
+        try:
+            kwargs[key] = json.loads(value)
+        except ValueError:
+            kwargs[key] = value
+    try:
+        call_daemon(cmd, kwargs, console)
+    except (ConnectionError, DaemonError) as e:
+        console.print(f"[bold red]Erro:[/bold red] {str(e)}")
+        raise SystemExit(1)
+
+
 def main():
     """Ponto de entrada principal"""
     cli()
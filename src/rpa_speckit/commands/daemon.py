@@ -0,0 +1,106 @@
+"""
+Comando daemon - Inicia, encerra e consulta o daemon do projeto
+"""
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from rich.console import Console
+
+from rpa_speckit.utils.daemon_client import find_project_root, is_running, is_supported, request, socket_path
+
+
+def start_daemon(console: Console, idle_timeout: float, detach: bool = False, use_polling: bool = False):
+    """
+    Inicia o daemon do projeto atual
+
+    Args:
+        console: Console do rich para output
+        idle_timeout: Segundos sem requisições até encerrar (0 desliga)
+        detach: Se True, inicia em segundo plano (log em .specify/cache/daemon.log) e retorna
+        use_polling: Força o modo polling do observador de arquivos
+
+    Raises:
+        RuntimeError: Se a plataforma não tem sockets Unix
+    """
+    if not is_supported():
+        raise RuntimeError("O daemon requer sockets Unix (indisponíveis nesta plataforma)")
+    root = find_project_root()
+    if not detach:
+        # Import tardio: o servidor importa o extrator (pptx) e o validador
+        from rpa_speckit.utils.daemon import run_daemon
+
+        def ready(path: Path):
+            console.print(f"[green]✓[/green] Daemon atendendo em {path} (Ctrl+C para encerrar)")
+
+        try:
+            run_daemon(root, idle_timeout, use_polling, on_ready=ready)
+        except KeyboardInterrupt:
+            pass
+        console.print("[yellow]Daemon encerrado.[/yellow]")
+        return
+
+    if is_running(root):
+        console.print(f"[yellow]O daemon já está rodando em {socket_path(root)}.[/yellow]")
+        return
+    log_path = root / ".specify" / "cache" / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, "-m", "rpa_speckit.cli", "daemon", "start", "--idle-timeout", str(idle_timeout)]
+    if use_polling:
+        command.append("--poll")
+    with open(log_path, "ab") as log_file:
+        subprocess.Popen(command, cwd=str(root), stdin=subprocess.DEVNULL, stdout=log_file,
+                         stderr=subprocess.STDOUT, start_new_session=True)
+
+    # Aguardar o socket responder (o servidor importa o toolchain antes de atender)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if is_running(root):
+            console.print(f"[green]✓[/green] Daemon iniciado em {socket_path(root)}")
+            return
+        time.sleep(0.1)
+    raise RuntimeError(f"O daemon não respondeu; veja {log_path}")
+
+
+def stop_daemon(console: Console):
+    """Encerra o daemon do projeto atual"""
+    if not is_running():
+        console.print("[yellow]Nenhum daemon rodando neste projeto.[/yellow]")
+        return
+    request("shutdown")
+    console.print("[green]✓[/green] Daemon encerrado.")
+
+
+def daemon_status(console: Console) -> Optional[Dict]:
+    """
+    Exibe o estado do daemon do projeto atual
+
+    Returns:
+        Estado devolvido pelo daemon (None se não estiver rodando)
+    """
+    if not is_running():
+        console.print(f"[yellow]Daemon parado[/yellow] (socket: {socket_path()})")
+        return None
+    status = request("status")
+    console.print(f"[green]Daemon rodando[/green] (pid {status['pid']}, {status['uptime_s']:.0f}s)")
+    console.print(f"  [cyan]Projeto:[/cyan] {status['root']}")
+    console.print(f"  [cyan]Requisições:[/cyan] {status['requests']}")
+    console.print(f"  [cyan]Em cache:[/cyan] {status['models']} modelo(s), {status['extractions']} DDP(s), "
+                  f"constitution {'sim' if status['constitution'] else 'não'}")
+    return status
+
+
+def call_daemon(cmd: str, args: Dict, console: Console):
+    """
+    Envia um comando ao daemon e imprime o resultado em JSON (para scripts e editores)
+
+    Args:
+        cmd: Comando do protocolo (validate, estimate, extract, plan, constitution, invalidate)
+        args: Argumentos do comando
+        console: Console do rich para output
+    """
+    result = request(cmd, **args)
+    console.print(json.dumps(result, ensure_ascii=False, indent=2, default=str),
+                  markup=False, highlight=False, soft_wrap=True)
@@ -0,0 +1,65 @@
+"""
+Comando diff - Emite só as mudanças da spec e do DDP desde a última atualização
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+from rich.console import Console
+
+from rpa_speckit.utils.spec_diff import SpecSnapshot, diff_snapshots, format_delta_prompt
+
+
+def resolve_spec_dir(spec: Optional[str], root: Path = Path(".")) -> Path:
+    """
+    Resolve a spec: caminho de um diretório, nome/prefixo em specs/ ou a primeira spec
+
+    Raises:
+        FileNotFoundError: Se a spec não for encontrada
+    """
+    if spec and Path(spec).is_dir() and Path(spec).parent.name == "specs":
+        return Path(spec).resolve()
+    specs_root = root / "specs"
+    spec_dirs = sorted(path for path in specs_root.glob("*") if path.is_dir()) if specs_root.is_dir() else []
+    if spec:
+        spec_dirs = [path for path in spec_dirs if path.name == spec or path.name.startswith(f"{spec}-")]
+    if not spec_dirs:
+        raise FileNotFoundError(f"Spec não encontrada: {spec or 'nenhuma spec em specs/'}")
+    return spec_dirs[0].resolve()
+
+
+def diff_spec(spec: Optional[str], console: Console, output_format: str = "prompt",
+              output_file: Optional[str] = None, save: bool = True, include_ddp: bool = True) -> List[Dict]:
+    """
+    Compara a spec com o snapshot anterior e emite o delta
+
+    Args:
+        spec: Diretório, nome ou prefixo da spec (None para a primeira em specs/)
+        console: Console do rich para output
+        output_format: "prompt" (Markdown para o assistente) ou "json"
+        output_file: Arquivo onde gravar o delta (None para imprimir)
+        save: Se True, o estado atual passa a ser a base do próximo diff
+        include_ddp: Se False, ignora os DDPs
+
+    Returns:
+        Lista de mudanças (ver diff_snapshots)
+    """
+    snapshot = SpecSnapshot(resolve_spec_dir(spec))
+    previous = snapshot.load()
+    current = snapshot.build(previous, include_ddp)
+    changes = diff_snapshots(previous, current)
+
+    if output_format == "json":
+        output = json.dumps({'spec': current['spec'], 'first_run': previous is None, 'changes': changes},
+                            ensure_ascii=False, indent=2)
+    else:
+        output = format_delta_prompt(current['spec'], changes, first_run=previous is None)
+
+    if output_file:
+        Path(output_file).write_text(output, encoding="utf-8")
+        console.print(f"[green]✓[/green] Delta ({len(changes)} mudança(s)) gravado em {output_file}")
+    else:
+        # Saída para a LLM: sem markup/quebra de linha do rich
+        console.print(output, markup=False, highlight=False, soft_wrap=True)
+    if save:
+        snapshot.save(current)
+    return changes
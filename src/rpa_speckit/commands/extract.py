@@ -0,0 +1,61 @@
+"""
+Comando extract - Extrai o texto de um DDP.pptx
+"""
+from pathlib import Path
+from typing import Optional
+from rich.console import Console
+from rich.table import Table
+
+from rpa_speckit.utils.ddp_extractor import extract_ddp, resolve_ddp
+from rpa_speckit.utils.ddp_index import DdpIndex
+
+
+def extract_command(ddp_path: Optional[str], console: Console, output_file: Optional[str] = None) -> str:
+    """
+    Extrai o DDP e emite o texto formatado para a LLM
+
+    Args:
+        ddp_path: Caminho do DDP.pptx ou nome de uma spec (None para o primeiro DDP do projeto)
+        console: Console do rich para output
+        output_file: Arquivo onde gravar o texto (None para imprimir)
+
+    Returns:
+        Texto extraído
+    """
+    pptx_file = resolve_ddp(ddp_path)
+    extracted_text = extract_ddp(str(pptx_file))
+    if output_file:
+        Path(output_file).write_text(extracted_text, encoding="utf-8")
+        console.print(f"[green]✓[/green] Texto do DDP gravado em {output_file}")
+    else:
+        # Saída para a LLM: sem markup/quebra de linha do rich
+        console.print(extracted_text, markup=False, highlight=False, soft_wrap=True)
+    DdpIndex().mark_extracted(pptx_file)
+    return extracted_text
+
+
+def list_ddps(console: Console, only_stale: bool = False):
+    """
+    Lista os DDPs do projeto e se foram alterados desde a última extração
+
+    Args:
+        console: Console do rich para output
+        only_stale: Se True, lista apenas os DDPs nunca extraídos ou alterados
+    """
+    index = DdpIndex()
+    decks = index.stale() if only_stale else index.decks()
+    if not decks:
+        console.print("[yellow]Nenhum DDP encontrado em DDP/ ou specs/*/DDP/.[/yellow]")
+        return
+
+    table = Table(show_lines=False)
+    table.add_column("Spec", style="cyan")
+    table.add_column("DDP")
+    table.add_column("Tamanho", justify="right")
+    table.add_column("Status")
+    for deck in decks:
+        status = "[yellow]alterado desde a extração[/yellow]" if deck['stale'] else "[green]extraído[/green]"
+        if deck['stale'] and deck['extracted_sha256'] is None:
+            status = "[yellow]nunca extraído[/yellow]"
+        table.add_row(deck['spec'] or "(raiz)", deck['rel'], f"{deck['size'] / 1024:.0f} KB", status)
+    console.print(table)
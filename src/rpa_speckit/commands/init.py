@@ -1,10 +1,13 @@
 """
 Comando init - Cria estrutura inicial do projeto
 """
-import os
-import shutil
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional
 from rich.console import Console
+
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.scaffold import ScaffoldPlan, load_archive
 try:
     from importlib.resources import files as resource_files
 except ImportError:
@@ -21,13 +24,47 @@ def init_project(project_name: str, ai_assistant: str, console: Console):
         ai_assistant: AI assistant escolhido (cursor, vscode-copilot, vscode-claude, other)
         console: Console do rich para output
     """
-    project_path = Path(project_name)
+    with tracing.span("init_project", ai_assistant=ai_assistant):
+        project_path = Path(project_name)
     
-    if project_path.exists():
-        raise ValueError(f"Diretório {project_name} já existe!")
+        if project_path.exists():
+            raise ValueError(f"Diretório {project_name} já existe!")
+    
+        console.print(f"[cyan]Criando estrutura do projeto...[/cyan]")
+        plan = load_archive(ai_assistant, project_path)
+        if plan is not None:
+            # Estrutura estática pré-montada: falta apenas o que depende do nome do projeto
+            _create_readme(project_path, project_name, plan)
+        else:
+            with tracing.span("init.plan"):
+                plan = build_scaffold_plan(project_path, project_name, ai_assistant, console)
     
-    console.print(f"[cyan]Criando estrutura do projeto...[/cyan]")
+        console.print(f"[cyan]Gravando {len(plan.files)} arquivos...[/cyan]")
+        plan.write()
     
+        console.print("[green]✓[/green] Estrutura criada com sucesso!")
+
+
+def build_scaffold_plan(project_path: Path, project_name: str, ai_assistant: str,
+                        console: Optional[Console] = None) -> ScaffoldPlan:
+    """
+    Monta todos os diretórios e arquivos do projeto, sem gravar nada
+
+    Args:
+        project_path: Diretório do projeto
+        project_name: Nome do projeto
+        ai_assistant: AI assistant escolhido (cursor, vscode-copilot, vscode-claude, other)
+        console: Console do rich para o progresso (opcional)
+
+    Returns:
+        Plano pronto para ScaffoldPlan.write()
+    """
+    def step(message: str):
+        if console is not None:
+            console.print(f"[cyan]{message}[/cyan]")
+
+    plan = ScaffoldPlan(project_path)
+
     # Criar estrutura de diretórios
     directories = [
         ".specify/memory",
@@ -48,44 +85,43 @@ def init_project(project_name: str, ai_assistant: str, console: Console):
             directories.append(".github/prompts")
     
     for directory in directories:
-        (project_path / directory).mkdir(parents=True, exist_ok=True)
+        plan.add_dir(directory)
     
     # Copiar constitution
-    console.print("[cyan]Copiando constitution do framework T2C...[/cyan]")
-    _copy_constitution(project_path)
+    step("Copiando constitution do framework T2C...")
+    _copy_constitution(project_path, plan)
     
     # Criar templates vazios
-    console.print("[cyan]Criando templates...[/cyan]")
-    _create_templates(project_path)
+    step("Criando templates...")
+    _create_templates(project_path, plan)
     
     # Criar script de extração de DDP
-    console.print("[cyan]Criando script de extração de DDP...[/cyan]")
-    _create_extract_ddp_script(project_path)
+    step("Criando script de extração de DDP...")
+    _create_extract_ddp_script(project_path, plan)
     
     # Criar requirements.txt
-    console.print("[cyan]Criando requirements.txt...[/cyan]")
-    _create_requirements_txt(project_path)
+    step("Criando requirements.txt...")
+    _create_requirements_txt(project_path, plan)
     
     # Criar comandos Cursor/VS Code/GitHub Copilot
     if ai_assistant == "cursor":
-        console.print("[cyan]Criando comandos Cursor...[/cyan]")
-        _create_cursor_commands(project_path)
+        step("Criando comandos Cursor...")
+        _create_cursor_commands(project_path, plan)
     elif ai_assistant in ["vscode-copilot", "vscode-claude"]:
-        console.print("[cyan]Criando configurações VS Code...[/cyan]")
-        _create_vscode_config(project_path, ai_assistant)
+        step("Criando configurações VS Code...")
+        _create_vscode_config(project_path, ai_assistant, plan)
         # Criar comandos para GitHub Copilot (reconhece .github/prompts/)
         if ai_assistant == "vscode-copilot":
-            console.print("[cyan]Criando comandos GitHub Copilot...[/cyan]")
-            _create_github_prompts(project_path)
+            step("Criando comandos GitHub Copilot...")
+            _create_github_prompts(project_path, plan)
     
     # Criar arquivos iniciais
-    console.print("[cyan]Criando arquivos iniciais...[/cyan]")
-    _create_initial_files(project_path, project_name)
-    
-    console.print("[green]✓[/green] Estrutura criada com sucesso!")
+    step("Criando arquivos iniciais...")
+    _create_initial_files(project_path, project_name, plan)
+    return plan
 
 
-def _copy_constitution(project_path: Path):
+def _copy_constitution(project_path: Path, plan: ScaffoldPlan):
     """Copia a constitution do framework T2C do template interno"""
     constitution_path = project_path / ".specify/memory/constitution.md"
     
@@ -97,7 +133,7 @@ def _copy_constitution(project_path: Path):
         if constitution_resource.is_file():
             # Ler conteúdo do recurso do pacote
             constitution_content = constitution_resource.read_text(encoding="utf-8")
-            constitution_path.write_text(constitution_content, encoding="utf-8")
+            plan.add_text(constitution_path, constitution_content)
         else:
             raise FileNotFoundError("Constitution não encontrada no pacote")
     except (ImportError, FileNotFoundError, AttributeError):
@@ -106,7 +142,7 @@ def _copy_constitution(project_path: Path):
         internal_constitution = memory_dir / "constitution.md"
         
         if internal_constitution.exists():
-            shutil.copy2(internal_constitution, constitution_path)
+            plan.add_bytes(constitution_path, internal_constitution.read_bytes())
         else:
             # Se não encontrar, criar versão básica
             basic_constitution = """# Constitution do Framework T2C
@@ -121,10 +157,10 @@ A constitution completa do framework T2C deve estar disponível no SpecKit.
 
 A constitution contém todas as regras, padrões e templates necessários para geração de código.
 """
-            constitution_path.write_text(basic_constitution, encoding="utf-8")
+            plan.add_text(constitution_path, basic_constitution)
 
 
-def _create_templates(project_path: Path):
+def _create_templates(project_path: Path, plan: ScaffoldPlan):
     """Cria templates vazios para o desenvolvedor preencher"""
     templates_dir = project_path / ".specify/templates"
     
@@ -150,10 +186,10 @@ def _create_templates(project_path: Path):
             if template_resource.is_file():
                 # Ler conteúdo do recurso do pacote
                 template_content = template_resource.read_text(encoding="utf-8")
-                dest_template.write_text(template_content, encoding="utf-8")
+                plan.add_text(dest_template, template_content)
             else:
                 # Fallback: criar arquivo vazio se template não existir
-                dest_template.write_text(f"# {template_file}\n\n[Template não encontrado no pacote]", encoding="utf-8")
+                plan.add_text(dest_template, f"# {template_file}\n\n[Template não encontrado no pacote]")
     except (ImportError, AttributeError):
         # Fallback: tentar caminho relativo (modo desenvolvimento)
         internal_templates_dir = Path(__file__).parent.parent.parent / "templates"
@@ -163,14 +199,21 @@ def _create_templates(project_path: Path):
             dest_template = templates_dir / template_file
             
             if source_template.exists():
-                shutil.copy2(source_template, dest_template)
+                plan.add_bytes(dest_template, source_template.read_bytes())
             else:
                 # Fallback: criar arquivo vazio se template não existir
-                dest_template.write_text(f"# {template_file}\n\n[Template não encontrado]", encoding="utf-8")
+                plan.add_text(dest_template, f"# {template_file}\n\n[Template não encontrado]")
 
 
-def _create_extract_ddp_script(project_path: Path):
-    """Cria script Python pronto para extração de DDP"""
+def _create_extract_ddp_script(project_path: Path, plan: ScaffoldPlan):
+    """
+    Cria o script de extração de DDP do projeto
+
+    O script é apenas um ponto de entrada: a extração (e a busca automática em
+    DDP/ e specs/*/DDP/) fica em rpa_speckit.utils.ddp_extractor, então melhorias
+    no pacote chegam a todos os projetos sem recriar o script. Com o daemon
+    rodando, o texto vem da memória dele, sem importar o extrator.
+    """
     scripts_dir = project_path / ".specify/scripts"
     
     # Usar raw string para evitar problemas com escape e encoding
@@ -179,150 +222,72 @@ def _create_extract_ddp_script(project_path: Path):
 """
 Script para extração de texto de arquivos DDP.pptx
 Este script já está pronto e não deve ser modificado.
+
+A extração é feita pelo pacote t2c-speckit (rpa_speckit.utils.ddp_extractor).
+Uso: python .specify/scripts/extract-ddp.py [caminho_do_ddp]
 """
-import sys
 import os
+import shutil
 import subprocess
-from pathlib import Path
-
-try:
-    from pptx import Presentation
-except ImportError:
-    print("python-pptx não está instalado. Instalando automaticamente...", file=sys.stderr)
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "python-pptx>=0.6.21"], 
-                             stdout=sys.stderr, stderr=sys.stderr)
-        from pptx import Presentation
-        print("python-pptx instalado com sucesso!", file=sys.stderr)
-    except Exception as e:
-        print(f"Erro ao instalar python-pptx: {e}", file=sys.stderr)
-        print("Tente instalar manualmente: pip install python-pptx", file=sys.stderr)
-        sys.exit(1)
+import sys
 
 
-def extract_ddp(pptx_path: str) -> str:
-    """
-    Extrai texto de todos os slides de um arquivo DDP.pptx
-    
-    Args:
-        pptx_path: Caminho para o arquivo DDP.pptx (pode ser relativo, absoluto ou apenas nome do arquivo)
-        
-    Returns:
-        Texto formatado com conteúdo de todos os slides
-    """
-    # Converter para Path e resolver para absoluto (simples e direto)
-    pptx_file = Path(pptx_path).resolve()
-    
-    # Se não encontrar, procurar automaticamente nas pastas comuns
-    if not pptx_file.exists():
-        # Procurar em DDP/ primeiro
-        ddp_dir = Path("DDP")
-        if ddp_dir.exists():
-            pptx_files = list(ddp_dir.glob("*.pptx"))
-            if pptx_files:
-                pptx_file = pptx_files[0].resolve()
-        
-        # Se não encontrou, procurar em specs/*/DDP/
-        if not pptx_file.exists():
-            for spec_dir in Path("specs").glob("*/DDP"):
-                if spec_dir.exists():
-                    pptx_files = list(spec_dir.glob("*.pptx"))
-                    if pptx_files:
-                        pptx_file = pptx_files[0].resolve()
-                        break
-        
-        if not pptx_file.exists():
-            raise FileNotFoundError(f"DDP não encontrado: {pptx_path}")
-    
-    # Usar caminho absoluto sempre (simples)
-    presentation = Presentation(str(pptx_file.absolute()))
-    
-    # Formatar texto para apresentar à LLM
-    formatted_text = "# Conteúdo Extraído do DDP\n\n"
-    formatted_text += f"**Arquivo:** {pptx_path}\n\n"
-    formatted_text += f"**Total de slides:** {len(presentation.slides)}\n\n"
-    formatted_text += "---\n\n"
-    
-    # Passar slide por slide e extrair texto
-    for i, slide in enumerate(presentation.slides, 1):
-        slide_text = []
-        
-        # Extrair texto de todas as formas no slide
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                slide_text.append(shape.text.strip())
-        
-        # Adicionar slide ao texto formatado
-        formatted_text += f"## Slide {i}\n\n"
-        formatted_text += "\n".join(slide_text)
-        formatted_text += "\n\n---\n\n"
-    
-    return formatted_text
-
-
-def main():
-    """CLI para extração de DDP"""
-    # Configurar encoding UTF-8 para stdout/stderr no Windows
-    if sys.platform == 'win32':
-        import io
-        try:
-            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-        except:
-            pass
-    
-    # Se não passou caminho, procurar automaticamente
-    if len(sys.argv) < 2:
-        # Procurar arquivos .pptx nas pastas comuns
-        search_dirs = [Path("DDP")]
-        for spec_dir in Path("specs").glob("*/DDP"):
-            search_dirs.append(spec_dir)
-        
-        pptx_file = None
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                pptx_files = list(search_dir.glob("*.pptx"))
-                if pptx_files:
-                    pptx_file = pptx_files[0].resolve()
-                    break
-        
-        if not pptx_file:
-            print("Erro: Nenhum arquivo .pptx encontrado. Use: python .specify/scripts/extract-ddp.py <caminho>", file=sys.stderr)
-            sys.exit(1)
-        
-        ddp_path = str(pptx_file)
-    else:
-        ddp_path = sys.argv[1]
-    
+def extract_from_daemon():
+    """Texto do DDP pelo daemon do projeto (t2c daemon start), ou None se ele não estiver rodando"""
     try:
-        extracted_text = extract_ddp(ddp_path)
-        print(extracted_text)
-    except FileNotFoundError as e:
-        print(f"Erro: {e}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Erro ao extrair DDP: {e}", file=sys.stderr)
-        sys.exit(1)
+        from rpa_speckit.utils.daemon_client import try_request
+    except ImportError:
+        return None
+    ddp = sys.argv[1] if len(sys.argv) > 1 else None
+    if ddp and os.path.isfile(ddp):
+        ddp = os.path.abspath(ddp)
+    try:
+        result = try_request("extract", ddp=ddp)
+    except Exception:
+        return None
+    return result["text"] if result else None
 
 
 if __name__ == "__main__":
+    text = extract_from_daemon()
+    if text is not None:
+        print(text)
+        sys.exit(0)
+
+    try:
+        from rpa_speckit.utils.ddp_extractor import main
+    except ImportError as e:
+        # Pacote instalado fora deste ambiente (ex: uvx): usar o comando t2c
+        t2c = shutil.which("t2c")
+        if t2c:
+            sys.exit(subprocess.call([t2c, "extract"] + sys.argv[1:]))
+        print(f"Não foi possível carregar o extrator de DDP: {e}", file=sys.stderr)
+        print("Execute uma vez: pip install -r requirements.txt", file=sys.stderr)
+        sys.exit(1)
     main()
 '''
     
     extract_script = scripts_dir / "extract-ddp.py"
-    extract_script.write_text(script_content, encoding="utf-8")
+    plan.add_text(extract_script, script_content)
 
 
-def _create_requirements_txt(project_path: Path):
+def _create_requirements_txt(project_path: Path, plan: ScaffoldPlan):
     """Cria requirements.txt com dependências necessárias"""
     requirements_content = """# Dependências para scripts do projeto
+t2c-speckit
 python-pptx>=0.6.21
 """
-    (project_path / "requirements.txt").write_text(requirements_content, encoding="utf-8")
+    plan.add_text(project_path / "requirements.txt", requirements_content)
 
 
 def _get_command_content(command_name: str) -> str:
     """Retorna o conteúdo completo de um comando (reutilizável para Cursor e VS Code)"""
+    return _command_contents().get(command_name, "")
+
+
+@lru_cache(maxsize=None)
+def _command_contents() -> Dict[str, str]:
+    """Monta uma única vez o conteúdo de todos os comandos (memoizado por processo)"""
     commands = {
         "t2c.extract-ddp": """# Extrair DDP
 
@@ -866,6 +831,13 @@ specs/001-[nome]/
 - \`caminho_da_spec\`: Caminho para o diretório da spec (ex: specs/001-automacao-exemplo)
 - \`--robot nome_do_robo\`: (Opcional) Gera apenas o robô especificado (ex: robot1, robot2). Se não especificado, gera todos os robôs.
 
+## Opções de Geração (spec.md)
+
+Lidas da seção "Arquitetura de Robôs" do spec.md de cada robô (\`t2c watch --generate\` usa as mesmas):
+
+- \`Workers em paralelo: SIM\` - bot.py usa \`T2CLoopStationPool\` (N workers, chave \`QuantidadeWorkers\` do Config.xlsx). Só para processos web headless ou API
+- \`Reutilizar navegador: SIM\` - gera \`T2CBrowserSession\`, que mantém a sessão do navegador entre tentativas e itens (reset suave em vez de reinício a frio). Só tem efeito se as tasks usam navegador
+
 ## Arquivos Gerados
 
 - **Standalone**: Estrutura completa em \`generated/[nome-automacao]/\`
@@ -882,7 +854,8 @@ specs/001-[nome]/
 - O framework é gerado do zero a cada execução
 - Arquivos customizados são gerados baseados nas specs de cada robô
 - Arquivos do framework base são copiados (não modificados)
-- Se múltiplos robôs, cada um tem seu próprio framework completo gerado""",
+- Se múltiplos robôs, cada um tem seu próprio framework completo gerado
+- **Spec já implementada antes?** Execute \`t2c diff specs/001-[nome]\` e ajuste apenas os itens listados no delta (seções, regras, tasks, seletores e slides do DDP adicionados, alterados ou removidos), em vez de reprocessar a spec inteira""",
         "t2c.validate": """# Validar Especificações
 
 Valida a estrutura e completude dos arquivos de especificação.
@@ -899,17 +872,33 @@ Valida a estrutura e completude dos arquivos de especificação.
 /t2c.validate specs/001-automacao-exemplo
 \`\`\`
 
+## O que fazer
+
+**PASSO 1 - Execute a validação estrutural (CLI):**
+
+\`\`\`bash
+t2c validate specs/001-automacao-exemplo --format json
+\`\`\`
+
+- Sem caminho (\`t2c validate\`), valida todas as specs em \`specs/\`
+- Os resultados ficam em cache em \`.specify/cache/\` e só arquivos alterados são revalidados
+- \`--format sarif --output validate.sarif\` gera relatório para CI/editores
+
+**PASSO 2 - Revise o que a CLI não cobre:** campos obrigatórios preenchidos com conteúdo real (não placeholders) e coerência com o DDP.
+
 ## O que faz
 
 1. Verifica se todos os arquivos necessários existem:
    - spec.md (ARQUIVO PRINCIPAL)
    - selectors.md
    - business-rules.md
+   - tests.md
    - tasks.md
-   - config/*.md
-2. Valida estrutura dos arquivos
-3. Verifica se campos obrigatórios estão preenchidos
-4. Gera relatório de validação
+2. Verifica se spec.md contém todas as seções do \`spec-template.md\`
+3. Verifica a numeração das regras (VAL*, COND*, EXC*) em business-rules.md
+4. Verifica a consistência entre fases e tasks em tasks.md (e o robô de cada task)
+5. Verifica se os seletores são referenciados em spec.md e se os links para selectors.md/business-rules.md existem
+6. Gera relatório de validação (texto, JSON ou SARIF)
 
 ## Saída
 
@@ -924,20 +913,20 @@ Relatório indicando:
 - Execute antes de /t2c.implement para garantir que tudo está pronto
 - Corrija os problemas indicados antes de prosseguir"""
     }
-    return commands.get(command_name, "")
+    return commands
 
 
-def _create_cursor_commands(project_path: Path):
+def _create_cursor_commands(project_path: Path, plan: ScaffoldPlan):
     """Cria comandos Cursor"""
     commands_dir = project_path / ".cursor/commands"
     
     # Usar a mesma função para garantir conteúdo idêntico
     for cmd_name in ["t2c.extract-ddp", "t2c.tasks", "t2c.implement", "t2c.validate"]:
         content = _get_command_content(cmd_name)
-        (commands_dir / f"{cmd_name}.md").write_text(content, encoding="utf-8")
+        plan.add_text(commands_dir / f"{cmd_name}.md", content)
 
 
-def _create_github_prompts(project_path: Path):
+def _create_github_prompts(project_path: Path, plan: ScaffoldPlan):
     """Cria comandos para GitHub Copilot usando .github/prompts/ com extensão .prompt.md"""
     prompts_dir = project_path / ".github" / "prompts"
     
@@ -945,10 +934,10 @@ def _create_github_prompts(project_path: Path):
     for cmd_name in ["t2c.extract-ddp", "t2c.tasks", "t2c.implement", "t2c.validate"]:
         content = _get_command_content(cmd_name)
         # Copilot reconhece arquivos .prompt.md em .github/prompts/
-        (prompts_dir / f"{cmd_name}.prompt.md").write_text(content, encoding="utf-8")
+        plan.add_text(prompts_dir / f"{cmd_name}.prompt.md", content)
 
 
-def _create_vscode_config(project_path: Path, ai_assistant: str):
+def _create_vscode_config(project_path: Path, ai_assistant: str, plan: ScaffoldPlan):
     """Cria configurações VS Code - apenas settings.json para GitHub Copilot"""
     vscode_dir = project_path / ".vscode"
     
@@ -990,25 +979,22 @@ def _create_vscode_config(project_path: Path, ai_assistant: str):
         }
     
     import json
-    (vscode_dir / "settings.json").write_text(
-        json.dumps(settings, indent=2),
-        encoding="utf-8"
-    )
+    plan.add_text(vscode_dir / "settings.json", json.dumps(settings, indent=2))
     
     # Criar tasks.json (para executar scripts via VS Code Tasks como alternativa)
-    _create_vscode_tasks(vscode_dir)
+    _create_vscode_tasks(vscode_dir, plan)
 
 
-def _create_vscode_commands(commands_dir: Path):
+def _create_vscode_commands(commands_dir: Path, plan: ScaffoldPlan):
     """Cria arquivos markdown de comandos EXATAMENTE como no Cursor (com slash commands)"""
     
     # Usar a mesma função para garantir conteúdo idêntico
     for cmd_name in ["t2c.extract-ddp", "t2c.tasks", "t2c.implement", "t2c.validate"]:
         content = _get_command_content(cmd_name)
-        (commands_dir / f"{cmd_name}.md").write_text(content, encoding="utf-8")
+        plan.add_text(commands_dir / f"{cmd_name}.md", content)
 
 
-def _create_copilot_instructions(vscode_dir: Path, commands_dir: Path):
+def _create_copilot_instructions(vscode_dir: Path, commands_dir: Path, plan: ScaffoldPlan):
     """Cria arquivo de instruções do Copilot dentro de .vscode para suportar slash commands"""
     instructions_content = """# GitHub Copilot Instructions - T2C Commands
 
@@ -1074,10 +1060,10 @@ Quando o usuário usar um slash command:
 Cada arquivo contém instruções detalhadas sobre como executar o comando correspondente.
 """
     
-    (vscode_dir / "copilot-instructions.md").write_text(instructions_content, encoding="utf-8")
+    plan.add_text(vscode_dir / "copilot-instructions.md", instructions_content)
 
 
-def _create_vscode_tasks(vscode_dir: Path):
+def _create_vscode_tasks(vscode_dir: Path, plan: ScaffoldPlan):
     """Cria tasks.json com tasks para executar os scripts"""
     tasks = {
         "version": "2.0.0",
@@ -1129,13 +1115,10 @@ def _create_vscode_tasks(vscode_dir: Path):
     }
     
     import json
-    (vscode_dir / "tasks.json").write_text(
-        json.dumps(tasks, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    plan.add_text(vscode_dir / "tasks.json", json.dumps(tasks, indent=2, ensure_ascii=False))
 
 
-def _create_vscode_readme(vscode_dir: Path):
+def _create_vscode_readme(vscode_dir: Path, plan: ScaffoldPlan):
     """Cria README explicando como usar os comandos com GitHub Copilot"""
     readme_content = """# Comandos T2C para VS Code + GitHub Copilot
 
@@ -1235,12 +1218,19 @@ Consulte os arquivos em `.vscode/commands/` para documentação detalhada de cad
 4. **Use as tasks**: Para execução rápida, use as tasks do VS Code (`Ctrl+Shift+P` > "Tasks: Run Task")
 """
     
-    (vscode_dir / "README.md").write_text(readme_content, encoding="utf-8")
+    plan.add_text(vscode_dir / "README.md", readme_content)
 
 
-def _create_initial_files(project_path: Path, project_name: str):
+def _create_initial_files(project_path: Path, project_name: str, plan: ScaffoldPlan):
     """Cria arquivos iniciais do projeto"""
-    # README.md
+    _create_readme(project_path, project_name, plan)
+    
+    # .gitignore
+    _create_gitignore(project_path, plan)
+
+
+def _create_readme(project_path: Path, project_name: str, plan: ScaffoldPlan):
+    """Cria o README.md do projeto (único arquivo que depende do nome do projeto)"""
     readme_content = f"""# {project_name}
 
 Projeto de automação RPA criado com RPA Spec-Kit.
@@ -1269,7 +1259,7 @@ Projeto de automação RPA criado com RPA Spec-Kit.
 
 1. **Inicialização**: Projeto já inicializado ✓
 2. **Extrair DDP**: Coloque DDP.pptx em `specs/001-[nome]/DDP/` ou `DDP/` e execute `/t2c.extract-ddp`
-   - O script instala dependências automaticamente se necessário
+   - Antes da primeira extração, instale as dependências uma vez: `pip install -r requirements.txt`
 4. **Completar Specs**: Revise e complete os arquivos .md gerados
 5. **Gerar Tasks** (Opcional): Execute `/t2c.tasks` para gerar tasks.md
 6. **Implementar**: Execute `/t2c.implement` para gerar o framework T2C completo
@@ -1289,9 +1279,11 @@ Projeto de automação RPA criado com RPA Spec-Kit.
 4. Complete os arquivos .md conforme necessário
 5. Execute `/t2c.implement` para gerar o framework
 """
-    (project_path / "README.md").write_text(readme_content, encoding="utf-8")
-    
-    # .gitignore
+    plan.add_text(project_path / "README.md", readme_content)
+
+
+def _create_gitignore(project_path: Path, plan: ScaffoldPlan):
+    """Cria o .gitignore do projeto"""
     gitignore_content = """# Python
 __pycache__/
 *.py[cod]
@@ -1329,6 +1321,7 @@ ENV/
 
 # RPA Spec-Kit
 generated/
+.specify/cache/
 *.pptx
 *.xlsx
 *.db
@@ -1341,5 +1334,5 @@ generated/
 .DS_Store
 Thumbs.db
 """
-    (project_path / ".gitignore").write_text(gitignore_content, encoding="utf-8")
+    plan.add_text(project_path / ".gitignore", gitignore_content)
 
@@ -0,0 +1,72 @@
+"""
+Comando validate - Valida as specs do projeto
+"""
+from pathlib import Path
+from typing import Dict, Optional
+from rich.console import Console
+from rich.table import Table
+
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.spec_validator import SpecValidator, to_json, to_sarif
+
+
+def validate_project(path: str, output_format: str, console: Console, output_file: Optional[str] = None,
+                     use_cache: bool = True, max_workers: Optional[int] = None) -> Dict:
+    """
+    Valida todas as specs a partir de um caminho e emite o relatório
+
+    Args:
+        path: Raiz do projeto ou diretório de uma spec
+        output_format: Formato do relatório (text, json ou sarif)
+        console: Console do rich para output
+        output_file: Arquivo onde gravar o relatório (None para imprimir)
+        use_cache: Se False, revalida tudo sem usar .specify/cache/
+        max_workers: Número de threads para as verificações
+
+    Returns:
+        Resultado da validação (ver SpecValidator.validate)
+    """
+    validator = SpecValidator(Path(path), use_cache=use_cache, max_workers=max_workers)
+    with tracing.span("validate_project"):
+        result = validator.validate()
+
+    if output_format == "json":
+        report = to_json(result)
+    elif output_format == "sarif":
+        report = to_sarif(result)
+    else:
+        report = None
+
+    if report is not None:
+        if output_file:
+            Path(output_file).write_text(report, encoding="utf-8")
+        else:
+            # Saída de máquina: sem markup/quebra de linha do rich
+            console.print(report, markup=False, highlight=False, soft_wrap=True)
+        return result
+
+    _print_report(result, console)
+    if output_file:
+        Path(output_file).write_text(to_json(result), encoding="utf-8")
+    return result
+
+
+def _print_report(result: Dict, console: Console):
+    """Exibe o relatório de validação em formato de tabela"""
+    if result['issues']:
+        table = Table(show_lines=False)
+        table.add_column("Nível")
+        table.add_column("Regra", style="cyan")
+        table.add_column("Arquivo")
+        table.add_column("Mensagem")
+        for issue in result['issues']:
+            level = "[red]✗ erro[/red]" if issue['level'] == "error" else "[yellow]! aviso[/yellow]"
+            table.add_row(level, issue['rule'], f"{issue['file']}:{issue['line']}", issue['message'])
+        console.print(table)
+
+    status = "[green]✓[/green]" if result['errors'] == 0 else "[red]✗[/red]"
+    console.print(
+        f"{status} {result['units']} robô(s)/spec(s), {result['checks']} verificações "
+        f"({result['cached']} em cache) em {result['duration_ms']} ms - "
+        f"{result['errors']} erro(s), {result['warnings']} aviso(s)"
+    )
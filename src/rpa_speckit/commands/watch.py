@@ -0,0 +1,209 @@
+"""
+Comando watch - Reexecuta extração, validação e geração conforme os arquivos mudam
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from rich.console import Console
+
+from rpa_speckit.commands.validate import _print_report
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.ddp_extractor import extract_ddp
+from rpa_speckit.utils.ddp_index import DdpIndex
+from rpa_speckit.utils.framework_generator import T2CFrameworkGenerator
+from rpa_speckit.utils.spec_model import parse_spec_texts, read_spec_texts
+from rpa_speckit.utils.spec_validator import SpecValidator
+from rpa_speckit.utils.watcher import FileWatcher
+
+
+class SpecWatchSession:
+    """Estado mantido entre eventos: modelos das specs já lidas, gerador e índice de DDPs"""
+
+    def __init__(self, spec_dir: Path, console: Console, output_dir: Optional[Path] = None, generate: bool = False):
+        """
+        Inicializa a sessão
+
+        Args:
+            spec_dir: Diretório da spec observada (specs/001-[nome]/)
+            console: Console do rich para output
+            output_dir: Diretório de saída da geração (default: generated/ na raiz do projeto)
+            generate: Se True, regenera os robôs afetados quando a validação passar
+        """
+        self.spec_dir = Path(spec_dir).resolve()
+        self.project_root = self.spec_dir.parent.parent if self.spec_dir.parent.name == "specs" else self.spec_dir
+        self.console = console
+        self.output_dir = Path(output_dir) if output_dir else self.project_root / "generated"
+        self.generate = generate
+        self.generator = T2CFrameworkGenerator(str(self.spec_dir))
+        self.ddp_index = DdpIndex(self.project_root)
+        self.models: Dict[Optional[str], Dict] = {}
+        self.robots: List[Optional[str]] = []
+        self.refresh_structure()
+
+    def watched_dirs(self) -> List[Path]:
+        """Diretórios observados: a spec (com seu DDP/), DDP/ e config/ da raiz"""
+        return [self.spec_dir, self.project_root / "DDP", self.project_root / "config"]
+
+    def refresh_structure(self):
+        """Detecta os robôs da spec e lê o modelo de cada um"""
+        self.generator.detect_structure()
+        self.robots = list(self.generator.robot_list) or [None]
+        self.models = {robot: self._parse(robot) for robot in self.robots}
+
+    def _parse(self, robot: Optional[str]) -> Dict:
+        """Lê e converte os .md de um robô (ou da spec standalone) em modelo"""
+        return parse_spec_texts(read_spec_texts(self.spec_dir, self.spec_dir / robot if robot else None))
+
+    def _is_config(self, path: Path) -> bool:
+        """Indica se o arquivo está em config/ na raiz do projeto"""
+        return (self.project_root / "config") in path.resolve().parents
+
+    def affected_robots(self, path: Path) -> Set[Optional[str]]:
+        """
+        Robôs afetados por um .md alterado
+
+        Returns:
+            O robô da pasta robotN/; todos para tasks.md, arquivos da raiz da spec e config/
+        """
+        try:
+            parts = path.resolve().relative_to(self.spec_dir).parts
+        except ValueError:
+            return set(self.robots) if self._is_config(path) else set()
+        if len(parts) > 1 and parts[0].startswith("robot"):
+            return {parts[0]}
+        return set(self.robots)
+
+    def extract(self, deck: Path):
+        """Extrai um DDP alterado para .specify/cache/ddp/<spec>/<deck>.md"""
+        with tracing.span("watch.extract", deck=deck.name):
+            spec = deck.parent.parent.name if deck.parent.parent.parent.name == "specs" else "raiz"
+            output = self.project_root / ".specify" / "cache" / "ddp" / spec / f"{deck.stem}.md"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(extract_ddp(str(deck)), encoding="utf-8")
+            self.ddp_index.mark_extracted(deck)
+        self.console.print(f"[green]✓[/green] DDP extraído: {deck.name} -> {output.relative_to(self.project_root)}")
+
+    def validate(self) -> Dict:
+        """Revalida a spec (o cache de validate só reprocessa os arquivos alterados)"""
+        with tracing.span("watch.validate"):
+            result = SpecValidator(self.spec_dir).validate()
+        _print_report(result, self.console)
+        return result
+
+    def regenerate(self, robot: Optional[str]):
+        """Regenera no lugar os arquivos de um robô (mantém o framework base já copiado)"""
+        with tracing.span("watch.generate", robot=robot or "standalone"):
+            try:
+                generated_dir = self.generator.regenerate_robot(robot, self.output_dir)
+            except FileNotFoundError:
+                # Robô ainda não gerado: geração completa (sem baixar o framework)
+                generated_dir = self.generator.generate_single_robot(robot, self.output_dir, skip_download=True)
+        self.console.print(f"[green]✓[/green] {robot or 'Robô'} regenerado em {generated_dir}")
+
+    def regenerate_selectors(self, robot: Optional[str]):
+        """Regenera só o T2CSelectors.py de um robô (selectors.md alterado)"""
+        try:
+            self.generator.regenerate_selectors(robot, self.output_dir)
+        except FileNotFoundError:
+            # Robô ainda não gerado: geração completa
+            self.regenerate(robot)
+            return
+        self.console.print(f"[green]✓[/green] {robot or 'Robô'}: T2CSelectors.py regenerado")
+
+    def handle(self, changed: List[Path]) -> Dict:
+        """
+        Processa um lote de arquivos alterados, executando só as etapas afetadas
+
+        Args:
+            changed: Arquivos alterados, criados ou removidos
+
+        Returns:
+            Resumo com extracted, robots (modelos alterados), validated e generated
+        """
+        summary = {'extracted': [], 'robots': [], 'validated': False, 'generated': []}
+
+        for deck in (path for path in changed if path.suffix.lower() == ".pptx" and path.exists()):
+            try:
+                self.extract(deck)
+                summary['extracted'].append(deck)
+            except Exception as e:
+                self.console.print(f"[bold red]Erro ao extrair {deck.name}:[/bold red] {str(e)}")
+
+        markdown = [path for path in changed if path.suffix.lower() == ".md"]
+        if not markdown:
+            return summary
+
+        # robotN/ criado ou removido: refazer a estrutura inteira
+        robot_dirs = sorted(path.name for path in self.spec_dir.glob("robot*") if path.is_dir())
+        if robot_dirs != sorted(robot for robot in self.robots if robot):
+            self.refresh_structure()
+            affected = set(self.robots)
+        else:
+            affected = set()
+            for path in markdown:
+                affected |= self.affected_robots(path)
+            # config/ não faz parte do modelo; nos demais, só conta se o modelo mudou
+            # (ex: salvar sem editar não revalida nem regenera)
+            config_changed = any(self._is_config(path) for path in markdown)
+            for robot in list(affected):
+                model = self._parse(robot)
+                if model == self.models.get(robot) and not config_changed:
+                    affected.discard(robot)
+                self.models[robot] = model
+        if not affected:
+            return summary
+
+        summary['robots'] = sorted(affected, key=lambda robot: robot or "")
+        result = self.validate()
+        summary['validated'] = True
+        if not self.generate:
+            return summary
+        if result['errors']:
+            self.console.print("[yellow]Geração ignorada: corrija os erros de validação.[/yellow]")
+            return summary
+        # Só selectors.md mudou: basta regenerar o módulo de seletores
+        selectors_only = all(path.name == "selectors.md" for path in markdown)
+        for robot in summary['robots']:
+            try:
+                if selectors_only:
+                    self.regenerate_selectors(robot)
+                else:
+                    self.regenerate(robot)
+                summary['generated'].append(robot)
+            except Exception as e:
+                self.console.print(f"[bold red]Erro ao gerar {robot or 'robô'}:[/bold red] {str(e)}")
+        return summary
+
+
+def watch_project(spec_dir: Optional[str], console: Console, output_dir: Optional[str] = None,
+                  generate: bool = False, debounce: float = 0.5, use_polling: bool = False):
+    """
+    Observa uma spec e reexecuta as etapas afetadas a cada lote de mudanças (até Ctrl+C)
+
+    Args:
+        spec_dir: Diretório da spec (None para a primeira em specs/)
+        console: Console do rich para output
+        output_dir: Diretório de saída da geração
+        generate: Se True, regenera os robôs afetados quando a validação passar
+        debounce: Segundos sem novas mudanças para processar um lote
+        use_polling: Força o modo polling mesmo com watchdog instalado
+    """
+    if spec_dir is None:
+        specs = sorted(path for path in Path("specs").glob("*") if path.is_dir())
+        if not specs:
+            raise FileNotFoundError("Nenhuma spec encontrada em specs/")
+        spec_dir = specs[0]
+
+    session = SpecWatchSession(Path(spec_dir), console, Path(output_dir) if output_dir else None, generate)
+    watcher = FileWatcher(session.watched_dirs(), debounce=debounce, use_polling=use_polling)
+    watcher.start()
+    console.print(f"[cyan]Observando {session.spec_dir.name} ({watcher.backend}); Ctrl+C para sair.[/cyan]")
+    try:
+        while True:
+            changed = watcher.wait()
+            names = ", ".join(path.name for path in changed[:5]) + (" ..." if len(changed) > 5 else "")
+            console.print(f"\n[bold cyan]Alterado:[/bold cyan] {names}")
+            session.handle(changed)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Observação encerrada.[/yellow]")
+    finally:
+        watcher.stop()
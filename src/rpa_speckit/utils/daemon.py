@@ -0,0 +1,454 @@
+"""
+Daemon do t2c - Servidor local que mantém specs, constitution e DDPs em memória
+
+Cada comando do assistente abre um novo processo Python que importa rich, pptx e
+o gerador e relê constitution e specs. Com `t2c daemon start` (opcional), um
+processo residente escuta no socket Unix do projeto (ver daemon_client) e
+responde validate, estimate, extract, plan e constitution a partir de caches em
+memória, invalidados por eventos de arquivo (FileWatcher). Sem requisições por
+`idle_timeout` segundos, o daemon encerra sozinho.
+"""
+import json
+import os
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.daemon_client import find_project_root, is_running, is_supported, socket_path
+from rpa_speckit.utils.ddp_extractor import extract_ddp, resolve_ddp
+from rpa_speckit.utils.ddp_index import DdpIndex
+from rpa_speckit.utils.spec_model import parse_sections, parse_spec_texts, read_spec_texts
+from rpa_speckit.utils.spec_validator import SpecValidator
+from rpa_speckit.utils.watcher import FileWatcher
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    # Python < 3.9 fallback
+    from importlib_resources import files as resource_files
+
+
+# Segundos sem requisições até o daemon encerrar (0 desliga)
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+CONSTITUTION_FILE = Path(".specify") / "memory" / "constitution.md"
+
+
+def load_complexity_catalog() -> Dict:
+    """Carrega a base de complexidade de sistemas (memory/system_complexity.json do pacote)"""
+    from rpa_speckit import memory
+    return json.loads((resource_files(memory) / "system_complexity.json").read_text(encoding="utf-8"))
+
+
+def _lookup(options: Dict[str, Dict], name: str) -> Tuple[str, float]:
+    """Procura uma opção pelo nome exato ou por um trecho (ex: "Parcial" -> "Documentação Parcial")"""
+    wanted = name.strip().lower()
+    matches = [key for key in options if key.lower() == wanted] or \
+              [key for key in options if wanted in key.lower()]
+    if not matches:
+        raise ValueError(f"Opção desconhecida: {name} (opções: {', '.join(options)})")
+    return matches[0], options[matches[0]]['multiplicador']
+
+
+class DaemonState:
+    """Caches do daemon: modelos das specs, índice da constitution, base de complexidade e extrações"""
+
+    def __init__(self, root: Path):
+        """
+        Inicializa os caches (vazios; cada um é preenchido no primeiro uso)
+
+        Args:
+            root: Raiz do projeto
+        """
+        self.root = find_project_root(root)
+        self.ddp_index = DdpIndex(self.root)
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.RLock()
+        # Validações em série: o SpecValidator não é thread-safe entre chamadas de validate()
+        self._validate_lock = threading.Lock()
+        self._models: Dict[Tuple[str, Optional[str]], Dict] = {}
+        self._validators: Dict[str, SpecValidator] = {}
+        self._constitution: Optional[List[Dict]] = None
+        self._catalog: Optional[Dict] = None
+        self._extractions: Dict[str, Tuple[str, str]] = {}
+
+    def watched_dirs(self) -> List[Path]:
+        """Diretórios cujas mudanças invalidam os caches"""
+        return [self.root / "specs", self.root / "DDP", self.root / ".specify" / "memory"]
+
+    def invalidate(self, paths: List[Path]) -> Dict:
+        """
+        Descarta os caches afetados por arquivos alterados
+
+        Args:
+            paths: Arquivos alterados, criados ou removidos
+
+        Returns:
+            Quantidade de modelos e extrações descartados e se a constitution foi descartada
+        """
+        dropped = {'models': 0, 'extractions': 0, 'constitution': False}
+        with self._lock:
+            for path in paths:
+                path = Path(path).resolve()
+                try:
+                    parts = path.relative_to(self.root).parts
+                except ValueError:
+                    continue
+                if path == self.root / CONSTITUTION_FILE:
+                    dropped['constitution'] = self._constitution is not None
+                    self._constitution = None
+                elif path.suffix.lower() == ".pptx":
+                    dropped['extractions'] += int(self._extractions.pop(Path(*parts).as_posix(), None) is not None)
+                elif len(parts) > 1 and parts[0] == "specs":
+                    stale = [key for key in self._models if key[0] == parts[1]]
+                    for key in stale:
+                        del self._models[key]
+                    dropped['models'] += len(stale)
+        return dropped
+
+    def spec_dirs(self) -> List[Path]:
+        """Specs do projeto (specs/NNN-*/) em ordem de nome"""
+        specs_root = self.root / "specs"
+        return sorted(entry for entry in specs_root.iterdir() if entry.is_dir()) if specs_root.is_dir() else []
+
+    def resolve_spec(self, spec: Optional[str]) -> Path:
+        """Spec pelo nome completo ou prefixo (ex: "001"); None para a primeira"""
+        spec_dirs = self.spec_dirs()
+        if spec:
+            spec_dirs = [path for path in spec_dirs if path.name == spec or path.name.startswith(f"{spec}-")]
+        if not spec_dirs:
+            raise FileNotFoundError(f"Spec não encontrada: {spec or 'nenhuma spec em specs/'}")
+        return spec_dirs[0]
+
+    def model(self, spec_dir: Path, robot: Optional[str]) -> Dict:
+        """Modelo de um robô (ou da spec standalone), lido do disco só após uma invalidação"""
+        key = (spec_dir.name, robot)
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = parse_spec_texts(read_spec_texts(spec_dir, spec_dir / robot if robot else None))
+            return self._models[key]
+
+    def constitution(self) -> List[Dict]:
+        """Seções da constitution do projeto (vazio se o arquivo não existe)"""
+        with self._lock:
+            if self._constitution is None:
+                path = self.root / CONSTITUTION_FILE
+                text = path.read_text(encoding="utf-8") if path.is_file() else ""
+                self._constitution = parse_sections(text)
+            return self._constitution
+
+    def catalog(self) -> Dict:
+        """Base de complexidade de sistemas (não muda enquanto o pacote instalado for o mesmo)"""
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = load_complexity_catalog()
+            return self._catalog
+
+    # Comandos ---------------------------------------------------------------
+
+    def cmd_ping(self) -> str:
+        """Teste de conexão"""
+        return "pong"
+
+    def cmd_status(self) -> Dict:
+        """Raiz, pid, tempo no ar, requisições atendidas e tamanho dos caches"""
+        with self._lock:
+            return {
+                'root': str(self.root),
+                'pid': os.getpid(),
+                'uptime_s': round(time.time() - self.started, 1),
+                'requests': self.requests,
+                'models': len(self._models),
+                'extractions': len(self._extractions),
+                'constitution': self._constitution is not None,
+            }
+
+    def cmd_validate(self, path: str = ".") -> Dict:
+        """Valida o projeto ou uma spec (o SpecValidator mantém os hashes dos arquivos entre chamadas)"""
+        target = (self.root / path).resolve()
+        with self._lock:
+            validator = self._validators.setdefault(str(target), SpecValidator(target))
+        with self._validate_lock:
+            return validator.validate()
+
+    def cmd_estimate(self, system: str, interface: Optional[str] = None, documentacao: Optional[str] = None,
+                     seletores: Optional[str] = None, categoria: Optional[str] = None,
+                     horas: Optional[float] = None) -> Dict:
+        """
+        Multiplicadores da base de complexidade para um sistema (ver seção 14 da constitution)
+
+        Args:
+            system: Nome do sistema (ex: "e-CAC"); se não estiver na base, informe `categoria`
+            interface: Tipo de interface (ex: "Web Legado")
+            documentacao: Nível de documentação (ex: "Parcial" ou "Documentação Parcial")
+            seletores: Estabilidade dos seletores (ex: "Instáveis" ou "Seletores Instáveis")
+            categoria: Categoria do sistema fora da base (ex: "portais_governo")
+            horas: Estimativa base em horas (opcional)
+
+        Returns:
+            Sistema e categoria encontrados, multiplicadores, multiplicador total e horas estimadas
+        """
+        catalog = self.catalog()
+        found = None
+        for category, systems in catalog['sistemas'].items():
+            for name, entry in systems.items():
+                if name.lower() == system.strip().lower():
+                    found = (category, name, entry)
+        if found:
+            category, system, entry = found
+            system_factor = entry['multiplicador']
+        elif categoria in catalog['multiplicadores_base']:
+            category, system_factor = categoria, catalog['multiplicadores_base'][categoria]
+        else:
+            raise ValueError(f"Sistema fora da base: {system}. Informe a categoria "
+                             f"({', '.join(catalog['multiplicadores_base'])})")
+
+        factors = catalog['fatores_tecnicos']
+        multipliers = {'sistema': system_factor}
+        chosen = {}
+        for key, group, value in (('interface', 'tipo_interface', interface),
+                                  ('documentacao', 'documentacao', documentacao),
+                                  ('seletores', 'estabilidade_seletores', seletores)):
+            if not value:
+                continue
+            option, factor = _lookup(factors[group], value)
+            multipliers[key] = factor
+            chosen[key] = option
+
+        total = 1.0
+        for factor in multipliers.values():
+            total *= factor
+        return {
+            'sistema': system,
+            'categoria': category,
+            'opcoes': chosen,
+            'multiplicadores': multipliers,
+            'multiplicador_total': round(total, 3),
+            'horas_estimadas': round(float(horas) * total, 2) if horas is not None else None,
+        }
+
+    def cmd_extract(self, ddp: Optional[str] = None) -> Dict:
+        """
+        Texto de um DDP, reaproveitado enquanto o hash do deck (DdpIndex) não mudar
+
+        Args:
+            ddp: Caminho do .pptx (absoluto ou relativo à raiz) ou nome de uma spec; None para o primeiro DDP
+
+        Returns:
+            path, text e cached (se o texto veio da memória)
+        """
+        candidate = ddp
+        if ddp and not Path(ddp).is_absolute() and (self.root / ddp).is_file():
+            candidate = str(self.root / ddp)
+        with self._lock:
+            pptx_file = resolve_ddp(candidate, self.root)
+            rel_path = pptx_file.relative_to(self.root).as_posix()
+            digest = self.ddp_index.refresh().get(rel_path, {}).get('sha256')
+            cached = self._extractions.get(rel_path)
+        hit = cached is not None and digest is not None and cached[0] == digest
+        text = cached[1] if hit else extract_ddp(str(pptx_file))
+        with self._lock:
+            self._extractions[rel_path] = (digest, text)
+            self.ddp_index.mark_extracted(pptx_file)
+        return {'path': str(pptx_file), 'text': text, 'cached': hit}
+
+    def cmd_plan(self, spec: Optional[str] = None) -> Dict:
+        """
+        Resumo de uma spec para o planejamento: robôs, seções, regras, fases, seletores e DDPs
+
+        Args:
+            spec: Nome ou prefixo da spec (None para a primeira)
+
+        Returns:
+            Resumo da spec com um item por robô (ou um único, standalone)
+        """
+        spec_dir = self.resolve_spec(spec)
+        units = SpecValidator(spec_dir).discover_units()
+        robots = []
+        for unit in units:
+            model = self.model(spec_dir, unit['robot'])
+            robots.append({
+                'robot': unit['robot'],
+                'sections': [section['title'] for section in model['sections'] if section['level'] == 2],
+                'rules': [rule['id'] for rule in model['rules']],
+                'phases': len(model['phases']),
+                'tasks': len(model['tasks']),
+                'selectors': len(model['selectors']),
+            })
+        decks = [
+            {'rel': deck['rel'], 'stale': deck['stale']}
+            for deck in self.ddp_index.decks(spec_dir.name)
+        ]
+        return {'spec': spec_dir.name, 'robots': robots, 'ddps': decks}
+
+    def cmd_constitution(self, section: Optional[str] = None) -> Dict:
+        """
+        Índice da constitution ou o corpo das seções cujo título contém `section`
+
+        Args:
+            section: Trecho do título (ex: "14" ou "Estimativas"); None para o índice
+
+        Returns:
+            sections: títulos (índice) ou seções completas com title, line e body
+        """
+        sections = self.constitution()
+        if not section:
+            return {'sections': [{'level': item['level'], 'title': item['title'], 'line': item['line']}
+                                 for item in sections if item['level'] <= 2]}
+        wanted = str(section).lower()
+        return {'sections': [{'title': item['title'], 'line': item['line'], 'body': item['body']}
+                             for item in sections if wanted in item['title'].lower()]}
+
+    def cmd_invalidate(self, paths: Optional[List[str]] = None) -> Dict:
+        """Invalida caches manualmente (sem caminhos, descarta todos)"""
+        if paths:
+            return self.invalidate([self.root / path for path in paths])
+        with self._lock:
+            dropped = {'models': len(self._models), 'extractions': len(self._extractions),
+                       'constitution': self._constitution is not None}
+            self._models.clear()
+            self._extractions.clear()
+            self._constitution = None
+        return dropped
+
+    def handle(self, cmd: str, args: Dict) -> object:
+        """
+        Executa um comando do protocolo
+
+        Args:
+            cmd: Nome do comando (método cmd_<nome>)
+            args: Argumentos nomeados
+
+        Returns:
+            Resultado serializável em JSON
+        """
+        handler: Optional[Callable] = getattr(self, f"cmd_{cmd}", None)
+        if handler is None:
+            raise ValueError(f"Comando desconhecido: {cmd}")
+        with self._lock:
+            self.requests += 1
+        with tracing.span(f"daemon.{cmd}"):
+            return handler(**args)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Lê requisições JSON (uma por linha) e responde uma linha JSON para cada"""
+
+    def handle(self):
+        server: "DaemonServer" = self.server
+        for line in self.rfile:
+            server.touch()
+            try:
+                request = json.loads(line.decode("utf-8"))
+                cmd = request.get('cmd', '')
+                if cmd == "shutdown":
+                    response = {'ok': True, 'result': "bye"}
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                else:
+                    response = {'ok': True, 'result': server.state.handle(cmd, request.get('args') or {})}
+            except Exception as e:
+                response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+# UnixStreamServer não existe sem AF_UNIX (Windows): o módulo continua importável e
+# run_daemon recusa a plataforma com RuntimeError antes de criar o servidor
+_UnixStreamServer = getattr(socketserver, "UnixStreamServer", socketserver.BaseServer)
+
+
+class DaemonServer(socketserver.ThreadingMixIn, _UnixStreamServer):
+    """Servidor do socket Unix com invalidação por eventos de arquivo e encerramento por ociosidade"""
+
+    daemon_threads = True
+
+    def __init__(self, state: DaemonState, path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 use_polling: bool = False):
+        """
+        Inicializa o servidor (o socket é criado aqui; `serve` bloqueia até o encerramento)
+
+        Args:
+            state: Caches do daemon
+            path: Caminho do socket
+            idle_timeout: Segundos sem requisições até encerrar (0 desliga)
+            use_polling: Força o modo polling do FileWatcher
+        """
+        self.state = state
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.monotonic()
+        self.watcher = FileWatcher(state.watched_dirs(), suffixes=(".md", ".pptx"), use_polling=use_polling)
+        self._stopped = threading.Event()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(path), _RequestHandler)
+        os.chmod(str(path), 0o600)
+
+    def touch(self):
+        """Registra atividade (adia o encerramento por ociosidade)"""
+        self.last_activity = time.monotonic()
+
+    def _watch_loop(self):
+        """Invalida os caches a cada lote de arquivos alterados"""
+        while not self._stopped.is_set():
+            changed = self.watcher.wait(timeout=1.0)
+            if changed:
+                self.state.invalidate(changed)
+
+    def _idle_loop(self):
+        """Encerra o servidor depois de `idle_timeout` segundos sem requisições"""
+        while not self._stopped.wait(5.0):
+            if time.monotonic() - self.last_activity >= self.idle_timeout:
+                self.shutdown()
+                return
+
+    def serve(self):
+        """Atende requisições até `shutdown`, Ctrl+C ou ociosidade; remove o socket ao sair"""
+        self.watcher.start()
+        threads = [threading.Thread(target=self._watch_loop, daemon=True)]
+        if self.idle_timeout:
+            threads.append(threading.Thread(target=self._idle_loop, daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            self.serve_forever(poll_interval=0.5)
+        finally:
+            self._stopped.set()
+            self.watcher.stop()
+            self.server_close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+def run_daemon(root: Path = Path("."), idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+               use_polling: bool = False, on_ready: Optional[Callable[[Path], None]] = None):
+    """
+    Executa o daemon de um projeto em primeiro plano
+
+    Args:
+        root: Raiz do projeto (ou qualquer pasta dentro dele)
+        idle_timeout: Segundos sem requisições até encerrar (0 desliga)
+        use_polling: Força o modo polling do FileWatcher
+        on_ready: Chamada com o caminho do socket quando o daemon começa a atender
+
+    Raises:
+        RuntimeError: Se a plataforma não tem sockets Unix ou se já há um daemon no projeto
+    """
+    if not is_supported():
+        raise RuntimeError("O daemon requer sockets Unix (indisponíveis nesta plataforma)")
+    state = DaemonState(root)
+    path = socket_path(state.root)
+    if is_running(state.root):
+        raise RuntimeError(f"Já há um daemon rodando em {path}")
+    if path.exists():
+        # Socket de um daemon que não encerrou corretamente
+        path.unlink()
+
+    server = DaemonServer(state, path, idle_timeout, use_polling)
+    if on_ready:
+        on_ready(path)
+    server.serve()
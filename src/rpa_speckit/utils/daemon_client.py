@@ -0,0 +1,124 @@
+"""
+Cliente do daemon - Chamadas ao `t2c daemon` pelo socket Unix do projeto
+
+Só usa a biblioteca padrão (sem rich, pptx ou o gerador), para que editores,
+scripts do projeto e o assistente consultem o daemon sem o custo de importar
+o toolchain. Protocolo: uma linha JSON por requisição e uma por resposta.
+
+    {"cmd": "validate", "args": {"path": "specs/001-cadastro"}}
+    {"ok": true, "result": {...}}
+"""
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+SOCKET_NAME = "t2c.sock"
+
+# Limite de sun_path (108 bytes no Linux, 104 no macOS), com folga
+MAX_SOCKET_PATH = 100
+
+DEFAULT_TIMEOUT = 30.0
+
+
+class DaemonError(RuntimeError):
+    """Erro devolvido pelo daemon ao processar uma requisição"""
+
+
+def is_supported() -> bool:
+    """Indica se a plataforma tem sockets Unix (AF_UNIX)"""
+    return hasattr(socket, "AF_UNIX")
+
+
+def find_project_root(start: Path = Path(".")) -> Path:
+    """Procura o diretório com .specify/ a partir de `start` (ou o próprio `start`)"""
+    start = Path(start).resolve()
+    for candidate in [start, *start.parents]:
+        if (candidate / ".specify").is_dir():
+            return candidate
+    return start
+
+
+def socket_path(root: Path = Path(".")) -> Path:
+    """
+    Caminho do socket do daemon de um projeto
+
+    Args:
+        root: Raiz do projeto (ou qualquer pasta dentro dele)
+
+    Returns:
+        .specify/cache/t2c.sock, ou um arquivo na pasta temporária se o caminho
+        for longo demais para um socket Unix
+    """
+    root = find_project_root(root)
+    path = root / ".specify" / "cache" / SOCKET_NAME
+    if len(str(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"t2c-{digest}.sock"
+
+
+def request(cmd: str, root: Path = Path("."), timeout: float = DEFAULT_TIMEOUT, **args) -> Any:
+    """
+    Envia uma requisição ao daemon do projeto
+
+    Args:
+        cmd: Comando (ping, validate, estimate, extract, plan, invalidate, shutdown)
+        root: Raiz do projeto (ou qualquer pasta dentro dele)
+        timeout: Segundos de espera pela resposta
+        **args: Argumentos do comando
+
+    Returns:
+        Campo `result` da resposta
+
+    Raises:
+        ConnectionError: Se o daemon não estiver rodando
+        DaemonError: Se o daemon devolver um erro
+    """
+    if not is_supported():
+        raise ConnectionError("Sockets Unix não são suportados nesta plataforma")
+    path = socket_path(root)
+    payload = json.dumps({'cmd': cmd, 'args': args}, ensure_ascii=False).encode("utf-8") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(path))
+            client.sendall(payload)
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise ConnectionError(f"Daemon não está rodando em {path}") from e
+    if not line:
+        raise ConnectionError("O daemon encerrou a conexão sem resposta")
+
+    response = json.loads(line.decode("utf-8"))
+    if not response.get('ok'):
+        raise DaemonError(response.get('error', 'Erro desconhecido'))
+    return response.get('result')
+
+
+def try_request(cmd: str, root: Path = Path("."), **args) -> Optional[Any]:
+    """
+    Como `request`, mas retorna None se o daemon não estiver rodando
+
+    Uso típico em scripts: tentar o daemon e, sem ele, executar localmente.
+    Erros devolvidos pelo daemon continuam sendo propagados (DaemonError).
+    """
+    if os.environ.get("T2C_NO_DAEMON"):
+        return None
+    try:
+        return request(cmd, root, **args)
+    except ConnectionError:
+        return None
+
+
+def is_running(root: Path = Path(".")) -> bool:
+    """Indica se há um daemon respondendo no socket do projeto"""
+    try:
+        return request("ping", root, timeout=2.0) == "pong"
+    except (ConnectionError, DaemonError, OSError, ValueError):
+        return False
@@ -1,64 +1,139 @@
 """
 Extrator de DDP - Extrai texto de arquivos PPTX
 """
+import sys
 from pathlib import Path
+from typing import Dict, List, Optional
+
 from pptx import Presentation
 
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.ddp_index import DdpIndex
+
+
+def find_ddp(root: Path = Path("."), hint: Optional[str] = None) -> Optional[Path]:
+    """
+    Procura um DDP nas pastas padrão do projeto: DDP/ e depois specs/*/DDP/ (em ordem de nome)
+
+    Usa o índice .specify/cache/ddp-index.json (ver DdpIndex), então só as pastas
+    alteradas desde a última busca são relistadas.
+
+    Args:
+        root: Raiz do projeto
+        hint: Nome de uma spec (ex: "001-cadastro") para usar o DDP dela
+
+    Returns:
+        Caminho absoluto do DDP encontrado (ou None)
+    """
+    return DdpIndex(root).find(hint)
+
+
+def resolve_ddp(pptx_path: Optional[str] = None, root: Path = Path(".")) -> Path:
+    """
+    Resolve o DDP a extrair: o caminho informado ou a busca automática (sem caminho ou com nome de spec)
+
+    Args:
+        pptx_path: Caminho para o DDP.pptx, nome de uma spec ou None
+        root: Raiz do projeto usada na busca automática
+
+    Returns:
+        Caminho absoluto do DDP
+
+    Raises:
+        FileNotFoundError: Se o arquivo informado não existir ou nenhum DDP for encontrado
+    """
+    if pptx_path:
+        pptx_file = Path(pptx_path).resolve()
+        if pptx_file.is_file():
+            return pptx_file
+        # Caminho de arquivo inexistente: erro, nunca outro DDP da busca automática
+        if Path(pptx_path).suffix.lower() == ".pptx" or "/" in pptx_path or "\\" in pptx_path:
+            raise FileNotFoundError(f"Arquivo não encontrado: {pptx_path}")
+    pptx_file = find_ddp(root, pptx_path)
+    if pptx_file is None:
+        raise FileNotFoundError(f"DDP não encontrado: {pptx_path or 'nenhum .pptx em DDP/ ou specs/*/DDP/'}")
+    return pptx_file
+
+
+def read_slides(pptx_file: Path) -> List[Dict]:
+    """
+    Lê o texto de cada slide de um DDP
+
+    Args:
+        pptx_file: Caminho do .pptx
+
+    Returns:
+        Lista com number e texts (textos não vazios das formas, na ordem do slide)
+    """
+    with tracing.span("extract_ddp.open", file=pptx_file.name):
+        presentation = Presentation(str(pptx_file))
+    tracing.count("slides", len(presentation.slides))
+
+    slides = []
+    for i, slide in enumerate(presentation.slides, 1):
+        # Extrair texto de todas as formas no slide
+        texts = [shape.text.strip() for shape in slide.shapes if hasattr(shape, "text") and shape.text.strip()]
+        slides.append({'number': i, 'texts': texts})
+    return slides
+
 
-def extract_ddp(pptx_path: str) -> str:
+@tracing.traced("extract_ddp")
+def extract_ddp(pptx_path: Optional[str]) -> str:
     """
     Extrai texto de todos os slides de um arquivo DDP.pptx
     
     Args:
-        pptx_path: Caminho para o arquivo DDP.pptx
+        pptx_path: Caminho para o arquivo DDP.pptx, nome de uma spec ou None (busca em DDP/ e specs/*/DDP/)
         
     Returns:
         Texto formatado com conteúdo de todos os slides
     """
-    pptx_file = Path(pptx_path)
-    if not pptx_file.exists():
-        raise FileNotFoundError(f"DDP não encontrado: {pptx_path}")
-    
-    presentation = Presentation(str(pptx_file))
+    pptx_file = resolve_ddp(pptx_path)
+    slides = read_slides(pptx_file)
     
     # Formatar texto para apresentar à LLM
     formatted_text = "# Conteúdo Extraído do DDP\n\n"
-    formatted_text += f"**Arquivo:** {pptx_path}\n\n"
-    formatted_text += f"**Total de slides:** {len(presentation.slides)}\n\n"
+    # Caminho como informado; se veio da busca automática, o caminho encontrado
+    shown_path = pptx_path if pptx_path and Path(pptx_path).is_file() else pptx_file
+    formatted_text += f"**Arquivo:** {shown_path}\n\n"
+    formatted_text += f"**Total de slides:** {len(slides)}\n\n"
     formatted_text += "---\n\n"
     
-    # Passar slide por slide e extrair texto
-    for i, slide in enumerate(presentation.slides, 1):
-        slide_text = []
-        
-        # Extrair texto de todas as formas no slide
-        for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                slide_text.append(shape.text.strip())
-        
-        # Adicionar slide ao texto formatado
-        formatted_text += f"## Slide {i}\n\n"
-        formatted_text += "\n".join(slide_text)
+    # Passar slide por slide
+    for slide in slides:
+        formatted_text += f"## Slide {slide['number']}\n\n"
+        formatted_text += "\n".join(slide['texts'])
         formatted_text += "\n\n---\n\n"
     
     return formatted_text
 
 
-def main():
-    """CLI para extração de DDP"""
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Uso: python -m rpa_speckit.utils.ddp_extractor <caminho_do_ddp>", file=sys.stderr)
-        sys.exit(1)
-    
-    ddp_path = sys.argv[1]
-    
+def main(argv: Optional[List[str]] = None):
+    """
+    CLI para extração de DDP (também usada pelo .specify/scripts/extract-ddp.py dos projetos)
+
+    Args:
+        argv: Argumentos (default: sys.argv[1:]); sem caminho, procura o DDP automaticamente
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    # Configurar encoding UTF-8 para stdout/stderr no Windows
+    if sys.platform == 'win32':
+        import io
+        try:
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+        except (AttributeError, ValueError):
+            pass
+
     try:
-        extracted_text = extract_ddp(ddp_path)
+        pptx_file = resolve_ddp(args[0] if args else None)
+        extracted_text = extract_ddp(str(pptx_file))
         print(extracted_text)
+        DdpIndex().mark_extracted(pptx_file)
     except FileNotFoundError as e:
         print(f"Erro: {e}", file=sys.stderr)
+        print("Uso: python .specify/scripts/extract-ddp.py [caminho_do_ddp]", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Erro ao extrair DDP: {e}", file=sys.stderr)
@@ -66,4 +141,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,227 @@
+"""
+Índice de DDPs - Descoberta incremental dos decks em DDP/ e specs/*/DDP/
+
+O índice fica em .specify/cache/ddp-index.json e guarda, para cada spec, os
+DDPs encontrados com mtime, tamanho e hash. A atualização usa os.scandir e só
+relista uma pasta DDP/ quando o mtime dela mudou; o hash só é recalculado
+quando mtime ou tamanho do deck mudaram. O hash da última extração de cada deck
+permite listar os DDPs alterados desde então.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from rpa_speckit.utils import tracing
+
+
+INDEX_VERSION = "1"
+
+INDEX_FILE = "ddp-index.json"
+
+# Spec usada para os decks da pasta DDP/ na raiz do projeto
+ROOT_SPEC = ""
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    """os.stat que retorna None se o caminho não existir"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class DdpIndex:
+    """Classe para localizar os DDPs do projeto a partir de um índice em cache"""
+
+    def __init__(self, root: Path = Path("."), use_cache: bool = True):
+        """
+        Inicializa o índice
+
+        Args:
+            root: Raiz do projeto (com DDP/ e/ou specs/)
+            use_cache: Se False, não lê nem grava .specify/cache/ddp-index.json
+        """
+        self.root = Path(root).resolve()
+        # Caminhos montados como str: em árvores com milhares de specs o custo de Path domina
+        self._root = str(self.root)
+        self.use_cache = use_cache and (self.root / ".specify").is_dir()
+        self.index_path = self.root / ".specify" / "cache" / INDEX_FILE
+        self._index: Dict = {'version': INDEX_VERSION, 'dirs': {}, 'decks': {}}
+        self._dirty = False
+        self._loaded = False
+
+    def _load(self):
+        """Carrega o índice do disco uma vez (descartando-o se for de outra versão)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.use_cache or not self.index_path.exists():
+            return
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if index.get('version') == INDEX_VERSION:
+            self._index = index
+
+    def save(self):
+        """Grava o índice no disco, se algo mudou"""
+        if not self.use_cache or not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path.write_text(json.dumps(self._index, indent=1), encoding="utf-8")
+        self._dirty = False
+
+    def _ddp_dirs(self) -> List[tuple]:
+        """
+        Lista as pastas DDP/ do projeto (uma listagem de specs/ com os.scandir)
+
+        Returns:
+            Lista ordenada de (spec, caminho relativo da pasta DDP)
+        """
+        ddp_dirs = [(ROOT_SPEC, "DDP")]
+        try:
+            with os.scandir(os.path.join(self._root, "specs")) as entries:
+                specs = sorted(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            specs = []
+        ddp_dirs += [(spec, f"specs/{spec}/DDP") for spec in specs]
+        return ddp_dirs
+
+    def _scan_dir(self, spec: str, rel_dir: str, dir_mtime: int) -> List[str]:
+        """
+        Lista os .pptx de uma pasta DDP/, reaproveitando o índice se o mtime não mudou
+
+        Returns:
+            Caminhos relativos dos decks da pasta
+        """
+        cached = self._index['dirs'].get(rel_dir)
+        if cached and cached['mtime_ns'] == dir_mtime:
+            return cached['decks']
+        with os.scandir(os.path.join(self._root, rel_dir)) as entries:
+            decks = sorted(
+                f"{rel_dir}/{entry.name}" for entry in entries
+                # ~$arquivo.pptx: arquivo de lock do PowerPoint
+                if entry.is_file() and entry.name.lower().endswith(".pptx") and not entry.name.startswith("~$")
+            )
+        self._index['dirs'][rel_dir] = {'spec': spec, 'mtime_ns': dir_mtime, 'decks': decks}
+        self._dirty = True
+        return decks
+
+    def _refresh_deck(self, spec: str, rel_path: str) -> Optional[Dict]:
+        """Atualiza mtime/tamanho/hash de um deck (hash só se o arquivo mudou)"""
+        full_path = os.path.join(self._root, rel_path)
+        stat = _stat(full_path)
+        if stat is None:
+            return None
+        entry = self._index['decks'].get(rel_path)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+        with open(full_path, "rb") as deck_file:
+            digest = hashlib.sha256(deck_file.read()).hexdigest()
+        entry = {
+            'spec': spec,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': digest,
+            'extracted_sha256': (entry or {}).get('extracted_sha256'),
+        }
+        self._index['decks'][rel_path] = entry
+        self._dirty = True
+        return entry
+
+    @tracing.traced("ddp_index.refresh")
+    def refresh(self) -> Dict[str, Dict]:
+        """
+        Atualiza o índice com o estado atual das pastas DDP/
+
+        Returns:
+            Decks do projeto (caminho relativo -> spec, mtime_ns, size, sha256, extracted_sha256)
+        """
+        self._load()
+        decks: Dict[str, Dict] = {}
+        seen_dirs = set()
+        for spec, rel_dir in self._ddp_dirs():
+            stat = _stat(os.path.join(self._root, rel_dir))
+            if stat is None:
+                continue
+            seen_dirs.add(rel_dir)
+            for rel_path in self._scan_dir(spec, rel_dir, stat.st_mtime_ns):
+                entry = self._refresh_deck(spec, rel_path)
+                if entry is not None:
+                    decks[rel_path] = entry
+
+        # Remover pastas e decks que não existem mais
+        if set(self._index['dirs']) != seen_dirs or set(self._index['decks']) != set(decks):
+            self._index['dirs'] = {key: value for key, value in self._index['dirs'].items() if key in seen_dirs}
+            self._index['decks'] = decks
+            self._dirty = True
+        tracing.count("ddps_indexados", len(decks))
+        self.save()
+        return decks
+
+    def decks(self, spec: Optional[str] = None) -> List[Dict]:
+        """
+        Lista os decks (DDP/ da raiz primeiro, depois specs em ordem de nome)
+
+        Args:
+            spec: Restringe aos decks de uma spec (ex: "001-cadastro")
+
+        Returns:
+            Lista com path (absoluto), rel, spec, stale e os campos do índice
+        """
+        result = []
+        for rel_path, entry in self.refresh().items():
+            if spec is not None and entry['spec'] != spec:
+                continue
+            result.append({
+                **entry,
+                'rel': rel_path,
+                'path': self.root / rel_path,
+                'stale': entry['extracted_sha256'] != entry['sha256'],
+            })
+        return sorted(result, key=lambda deck: (deck['spec'] != ROOT_SPEC, deck['spec'], deck['rel']))
+
+    def find(self, hint: Optional[str] = None) -> Optional[Path]:
+        """
+        Escolhe o DDP a extrair
+
+        Args:
+            hint: Nome de uma spec (ex: "001-cadastro") para usar o DDP dela; None para o primeiro do projeto
+
+        Returns:
+            Caminho absoluto do deck (ou None se não houver DDPs ou nenhum for da spec informada)
+        """
+        decks = self.decks()
+        if hint:
+            # Spec informada sem DDP: None (erro), nunca o DDP de outra spec
+            decks = [deck for deck in decks if deck['spec'] == hint or deck['spec'].startswith(f"{hint}-")]
+        return decks[0]['path'] if decks else None
+
+    def stale(self) -> List[Dict]:
+        """
+        Lista os decks nunca extraídos ou alterados desde a última extração
+
+        Returns:
+            Decks com stale=True
+        """
+        return [deck for deck in self.decks() if deck['stale']]
+
+    def mark_extracted(self, pptx_file: Path):
+        """
+        Registra que um deck foi extraído (o hash atual passa a ser o da última extração)
+
+        Args:
+            pptx_file: Caminho do deck extraído
+        """
+        try:
+            rel_path = Path(pptx_file).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return
+        decks = self.refresh()
+        if rel_path in decks and decks[rel_path]['extracted_sha256'] != decks[rel_path]['sha256']:
+            decks[rel_path]['extracted_sha256'] = decks[rel_path]['sha256']
+            self._dirty = True
+            self.save()
@@ -1,13 +1,15 @@
 """
 Gerador de Framework T2C - Gera framework completo baseado em specs
 """
-import os
+import importlib.util
 import shutil
-import subprocess
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
 import re
+from rpa_speckit.utils.rule_codegen import generate_rule_code
+from rpa_speckit.utils.selector_catalog import SelectorCatalog, generate_selectors_code
+from rpa_speckit.utils.spec_model import parse_architecture_flag, parse_robot_role
+from rpa_speckit.utils import tracing
 try:
     from importlib.resources import files as resource_files
 except ImportError:
@@ -18,7 +20,8 @@ except ImportError:
 class T2CFrameworkGenerator:
     """Classe para gerar framework T2C completo"""
     
-    def __init__(self, spec_dir: str, framework_repo_url: Optional[str] = None, robot_name: Optional[str] = None):
+    def __init__(self, spec_dir: str, framework_repo_url: Optional[str] = None, robot_name: Optional[str] = None,
+                 worker_pool: bool = False, browser_session: bool = False):
         """
         Inicializa o gerador
         
@@ -26,6 +29,10 @@ class T2CFrameworkGenerator:
             spec_dir: Diretório com as specs (specs/001-[nome]/)
             framework_repo_url: URL do repositório do framework T2C (opcional)
             robot_name: Nome do robô específico para gerar (opcional, ex: 'robot1', 'robot2')
+            worker_pool: Se True, bot.py usa T2CLoopStationPool (N workers, chave QuantidadeWorkers do Config.xlsx)
+                em todos os robôs; também ativado por robô com "Workers em paralelo: SIM" no spec.md
+            browser_session: Se True, o navegador é reaproveitado entre tentativas e itens (T2CBrowserSession)
+                em todos os robôs; também ativado por robô com "Reutilizar navegador: SIM" no spec.md
         """
         self.spec_dir = Path(spec_dir)
         self.framework_repo_url = framework_repo_url or "https://github.com/T2C-Consultoria/prj_botcity_framework_template.git"
@@ -35,6 +42,12 @@ class T2CFrameworkGenerator:
         self.robot_name: Optional[str] = robot_name
         self.is_multi_robot: bool = False
         self.robot_list: List[str] = []
+        self.worker_pool: bool = worker_pool
+        self.browser_session: bool = browser_session
+        self.robot_roles: Dict[str, str] = {}
+        self.robot_role: str = "standalone"
+        self._template_dir: Optional[Path] = None
+        self._environment_checked: bool = False
     
     def detect_structure(self) -> bool:
         """
@@ -43,6 +56,9 @@ class T2CFrameworkGenerator:
         Returns:
             True se múltiplos robôs, False se standalone
         """
+        # Recomeça do zero: o watch chama de novo a cada mudança na spec
+        self.robot_list = []
+        self.robot_roles = {}
         # Verificar se existe robot1/ (indica múltiplos robôs)
         robot1_dir = self.spec_dir / "robot1"
         if robot1_dir.exists() and robot1_dir.is_dir():
@@ -52,11 +68,15 @@ class T2CFrameworkGenerator:
                 if item.is_dir() and item.name.startswith("robot") and item.name[5:].isdigit():
                     self.robot_list.append(item.name)
             self.robot_list.sort(key=lambda x: int(x[5:]) if x[5:].isdigit() else 0)
+            # Papel de cada robô (campo "Tipo" de spec.md): dispatcher, performer ou standalone
+            for robot_name in self.robot_list:
+                spec_file = self.spec_dir / robot_name / "spec.md"
+                role = parse_robot_role(spec_file.read_text(encoding="utf-8")) if spec_file.exists() else "standalone"
+                self.robot_roles[robot_name] = role
             return True
         
         # Se não tem robot1/, é standalone
         self.is_multi_robot = False
-        self.robot_list = []
         return False
     
     def read_specs(self, robot_dir: Optional[Path] = None) -> Dict:
@@ -153,97 +173,95 @@ class T2CFrameworkGenerator:
             return dir_name[4:]  # Remove "001-"
         return dir_name
     
+    def check_environment(self):
+        """
+        Verifica, uma única vez por gerador, o que o download do framework precisa
+
+        Nada é instalado durante a geração: se faltar algo, a geração para antes de
+        começar, com a instrução de instalação.
+
+        Raises:
+            RuntimeError: Se cookiecutter ou git não estiverem disponíveis
+        """
+        if self._environment_checked:
+            return
+        missing = []
+        if importlib.util.find_spec("cookiecutter") is None:
+            missing.append("cookiecutter (pip install cookiecutter)")
+        if shutil.which("git") is None:
+            missing.append("git (https://git-scm.com/downloads)")
+        if missing:
+            raise RuntimeError(
+                "Dependências ausentes para baixar o framework T2C: " + ", ".join(missing)
+                + ". Instale-as ou gere com skip_download=True."
+            )
+        self._environment_checked = True
+
+    def _clone_template(self, target_dir: Path) -> Path:
+        """
+        Clona o repositório do framework uma única vez por geração
+
+        Args:
+            target_dir: Diretório temporário da geração
+
+        Returns:
+            Diretório do template clonado (reaproveitado pelos demais robôs)
+        """
+        if self._template_dir is not None and self._template_dir.exists():
+            return self._template_dir
+
+        from cookiecutter.vcs import clone
+
+        clone_root = target_dir / "t2c_template_temp"
+        if clone_root.exists():
+            shutil.rmtree(clone_root)
+        clone_root.mkdir(parents=True)
+        with tracing.span("clone_template"):
+            try:
+                self._template_dir = Path(clone(self.framework_repo_url, clone_to_dir=str(clone_root), no_input=True))
+            except Exception as e:
+                raise RuntimeError(f"Erro ao baixar framework: {e}")
+        return self._template_dir
+
+    @tracing.traced("download_framework")
     def download_framework(self, target_dir: Path, project_name: str) -> Path:
         """
-        Baixa framework do GitHub usando cookiecutter
+        Gera o framework a partir do template T2C usando a API do cookiecutter (no processo)
         
         Args:
-            target_dir: Diretório onde baixar
+            target_dir: Diretório onde gerar
             project_name: Nome do projeto para cookiecutter
             
         Returns:
-            Caminho do framework baixado
+            Caminho do framework gerado
         """
+        self.check_environment()
+        template_dir = self._clone_template(target_dir)
+
+        # Sem cookiecutter.json o repositório já é o framework pronto
+        if not (template_dir / "cookiecutter.json").exists():
+            return template_dir
+
+        from cookiecutter.main import cookiecutter
+
         framework_dir = target_dir / "t2c_framework_temp"
-        
         if framework_dir.exists():
             shutil.rmtree(framework_dir)
-        
-        # Verificar se cookiecutter está instalado
-        try:
-            subprocess.run(["cookiecutter", "--version"], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Se cookiecutter não estiver instalado, tentar instalar ou usar git clone
-            try:
-                subprocess.run(
-                    ["pip", "install", "cookiecutter"],
-                    check=True,
-                    capture_output=True
-                )
-            except subprocess.CalledProcessError:
-                # Fallback: clonar repositório diretamente
-                try:
-                    subprocess.run(
-                        ["git", "clone", self.framework_repo_url, str(framework_dir)],
-                        check=True,
-                        capture_output=True
-                    )
-                    return framework_dir
-                except subprocess.CalledProcessError as e:
-                    raise RuntimeError(f"Erro ao baixar framework: {e.stderr.decode()}")
-        
-        # Usar cookiecutter para gerar projeto
         try:
-            # Cookiecutter precisa de um template, então vamos clonar primeiro
-            template_dir = target_dir / "t2c_template_temp"
-            if template_dir.exists():
-                shutil.rmtree(template_dir)
-            
-            subprocess.run(
-                ["git", "clone", self.framework_repo_url, str(template_dir)],
-                check=True,
-                capture_output=True
-            )
-            
-            # Executar cookiecutter
-            # Cookiecutter espera respostas interativas, então vamos usar variáveis de ambiente
-            import os
-            env = os.environ.copy()
-            env['COOKIECUTTER_REPLAY'] = 'false'
-            
-            # Criar arquivo de contexto para cookiecutter
-            context_file = template_dir / "cookiecutter.json"
-            if not context_file.exists():
-                # Se não tiver cookiecutter.json, criar um básico
-                import json
-                context = {
+            rendered_dir = cookiecutter(
+                str(template_dir),
+                no_input=True,
+                extra_context={
                     "project_name": project_name,
-                    "project_slug": project_name.lower().replace(" ", "_").replace("-", "_")
-                }
-                context_file.write_text(json.dumps(context, indent=2), encoding="utf-8")
-            
-            # Executar cookiecutter
-            subprocess.run(
-                ["cookiecutter", str(template_dir), "--no-input", f"project_name={project_name}"],
-                cwd=str(target_dir),
-                check=True,
-                capture_output=True
+                    "project_slug": project_name.lower().replace(" ", "_").replace("-", "_"),
+                },
+                output_dir=str(framework_dir),
+                overwrite_if_exists=True,
             )
-            
-            # O cookiecutter cria o diretório com o nome do projeto
-            framework_dir = target_dir / project_name
-            if not framework_dir.exists():
-                # Se cookiecutter não funcionou, usar o template clonado
-                framework_dir = template_dir
-            
-        except subprocess.CalledProcessError as e:
-            # Fallback: usar template clonado diretamente
-            if template_dir.exists():
-                framework_dir = template_dir
-            else:
-                raise RuntimeError(f"Erro ao gerar framework com cookiecutter: {e.stderr.decode()}")
-        
-        return framework_dir
+        except Exception:
+            # Template fora do padrão cookiecutter: usar o repositório clonado diretamente
+            return template_dir
+        return Path(rendered_dir)
     
     def generate_project_structure(self, project_name: str, output_dir: Path):
         """
@@ -283,6 +301,7 @@ class T2CFrameworkGenerator:
             else:
                 path.mkdir(parents=True, exist_ok=True)
     
+    @tracing.traced("copy_framework_files")
     def copy_framework_files(self, framework_dir: Path):
         """
         Copia arquivos do framework base
@@ -319,6 +338,7 @@ class T2CFrameworkGenerator:
             if src.exists():
                 dst.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(src, dst)
+                tracing.count("arquivos_copiados")
             else:
                 # Se não encontrar no framework, criar arquivo vazio com aviso
                 dst.parent.mkdir(parents=True, exist_ok=True)
@@ -346,8 +366,7 @@ class T2CFrameworkGenerator:
         
         # Gerar código baseado nas specs
         imports = self._generate_imports()
-        validacoes = self._generate_validacoes()
-        condicoes = self._generate_condicoes()
+        regras = self._generate_regras()
         processamento = self._generate_processamento()
         preenchimento_fila = self._generate_preenchimento_fila()
         inicializacao = self._generate_inicializacao()
@@ -355,10 +374,12 @@ class T2CFrameworkGenerator:
         
         # Substituir variáveis
         bot_content = bot_template.replace("{{PROJECT_NAME}}", self.project_name)
+        bot_content = bot_content.replace("{{LOOP_STATION}}", "T2CLoopStationPool" if self._uses_worker_pool() else "T2CLoopStation")
         process_content = process_template.replace("{{PROJECT_NAME}}", self.project_name)
         process_content = process_content.replace("{{IMPORTS}}", imports)
-        process_content = process_content.replace("{{VALIDACOES_ENTRADA}}", validacoes)
-        process_content = process_content.replace("{{CONDICOES_ESPECIAIS}}", condicoes)
+        process_content = process_content.replace("{{TABELA_REGRAS}}", regras['TABELA_REGRAS'])
+        process_content = process_content.replace("{{VALIDACOES_ENTRADA}}", regras['VALIDACOES_ENTRADA'])
+        process_content = process_content.replace("{{CONDICOES_ESPECIAIS}}", regras['CONDICOES_ESPECIAIS'])
         process_content = process_content.replace("{{PROCESSAMENTO_PRINCIPAL}}", processamento)
         
         init_content = init_template.replace("{{PROJECT_NAME}}", self.project_name)
@@ -385,9 +406,12 @@ class T2CFrameworkGenerator:
         """Gera imports baseado nas specs"""
         imports = []
         
-        # Verificar se usa Clicknium
-        if 'selectors' in self.specs and 'clicknium' in self.specs['selectors'].lower():
+        # Verificar se usa Clicknium (locators do catálogo ou menção em selectors.md)
+        catalog = SelectorCatalog(self.specs.get('selectors', ""))
+        if "clicknium" in catalog.strategies() or 'clicknium' in self.specs.get('selectors', "").lower():
             imports.append("from clicknium import clicknium as cc, locator")
+        # T2CSelectors.py é sempre gerado (mesmo vazio): selectors.md pode mudar sem regenerar este arquivo
+        imports.append(f"from {self.project_name}.classes_t2c.utils.T2CSelectors import T2CSelectors as Selectors")
         
         # Verificar se usa pandas
         if 'spec' in self.specs and 'pandas' in self.specs['spec'].lower():
@@ -399,52 +423,21 @@ class T2CFrameworkGenerator:
         # Verificar se usa Browser
         if 'spec' in self.specs and ('navegador' in self.specs['spec'].lower() or 'browser' in self.specs['spec'].lower()):
             imports.append("from botcity.web import Browser")
+        if self._uses_browser_session():
+            if "from botcity.web import Browser" not in imports:
+                imports.append("from botcity.web import Browser")
+            imports.append(f"from {self.project_name}.classes_t2c.utils.T2CBrowserSession import T2CBrowserSession as BrowserSession")
         
         return '\n'.join(imports) if imports else "# Nenhum import adicional necessário"
     
-    def _generate_validacoes(self) -> str:
-        """Gera código de validações baseado em business-rules.md"""
-        if 'business_rules' not in self.specs:
-            return "# Nenhuma validação definida"
-        
-        validacoes = []
-        rules_text = self.specs['business_rules']
-        
-        # Procurar por VAL*
-        val_pattern = r'###\s*VAL\d+[:\s]+([^\n]+)'
-        matches = re.findall(val_pattern, rules_text, re.IGNORECASE)
-        
-        for i, match in enumerate(matches[:10], 1):
-            validacoes.append(f"        # VAL{i:03d}: {match.strip()}")
-            validacoes.append(f"        # TODO: Implementar validação")
-            validacoes.append("")
-        
-        if not validacoes:
-            return "# Nenhuma validação definida"
-        
-        return '\n'.join(validacoes)
-    
-    def _generate_condicoes(self) -> str:
-        """Gera código de condições especiais"""
-        if 'business_rules' not in self.specs:
-            return "# Nenhuma condição especial definida"
-        
-        condicoes = []
-        rules_text = self.specs['business_rules']
-        
-        # Procurar por COND*
-        cond_pattern = r'###\s*COND\d+[:\s]+([^\n]+)'
-        matches = re.findall(cond_pattern, rules_text, re.IGNORECASE)
-        
-        for i, match in enumerate(matches[:10], 1):
-            condicoes.append(f"        # COND{i:03d}: {match.strip()}")
-            condicoes.append(f"        # TODO: Implementar condição")
-            condicoes.append("")
-        
-        if not condicoes:
-            return "# Nenhuma condição especial definida"
-        
-        return '\n'.join(condicoes)
+    def _generate_regras(self) -> Dict[str, str]:
+        """
+        Gera código das validações (VAL*) e condições especiais (COND*) de business-rules.md
+
+        Todas as regras são mantidas com seus IDs originais. Acima de
+        RULE_TABLE_THRESHOLD regras de um tipo, o código vira tabela + dispatcher.
+        """
+        return generate_rule_code(self.specs.get('business_rules', ""))
     
     def _generate_processamento(self) -> str:
         """Gera código de processamento principal"""
@@ -460,7 +453,9 @@ class T2CFrameworkGenerator:
         
         for i, match in enumerate(matches, 1):
             processamento.append(f"        # Task 2.{i}: {match.strip()}")
-            processamento.append(f"        # TODO: Implementar")
+            processamento.append(f"        with Metricas.etapa('Task 2.{i}'):")
+            processamento.append(f"            # TODO: Implementar")
+            processamento.append("            pass")
             processamento.append("")
         
         if not processamento:
@@ -470,6 +465,20 @@ class T2CFrameworkGenerator:
     
     def _generate_preenchimento_fila(self) -> str:
         """Gera código para preencher fila"""
+        if self.robot_role == "dispatcher":
+            return """        # Dispatcher: item vazio na própria fila para que o framework execute
+        QueueManager.insert_new_queue_item(arg_strReferencia="DISPATCHER_INIT", arg_dictInfAdicional={})
+        
+        # TODO: Implementar a leitura da fonte de dados e enviar para a fila do performer
+        # stream_items grava um lote por commit em FilaProcessamentoPerformer: os performers
+        # (T2CLoopStationPool) consomem a fila enquanto a carga continua
+        # var_intQtdItens = QueueBulkLoader.stream_items(
+        #     (str(var_dictLinha['id']), {'campo1': var_dictLinha['campo1']})
+        #     for var_listLote in QueueBulkLoader.read_excel_chunks('dados.xlsx')
+        #     for var_dictLinha in var_listLote
+        # )
+        # LogBuffer.write_log(f"{var_intQtdItens} itens enviados para a fila do performer")"""
+        
         if 'tasks' not in self.specs:
             return "# TODO: Implementar preenchimento da fila"
         
@@ -478,15 +487,16 @@ class T2CFrameworkGenerator:
         # Procurar por Task 1.2 (add_to_queue)
         if 'Task 1.2' in tasks_text or 'add_to_queue' in tasks_text.lower():
             return """        # TODO: Implementar lógica para preencher fila
-        # Exemplo:
-        # import pandas as pd
-        # df = pd.read_excel('dados.xlsx')
-        # for index, row in df.iterrows():
-        #     var_dictInfoAdicional = {'campo1': row['campo1']}
-        #     QueueManager.insert_new_queue_item(
-        #         arg_strReferencia=str(row['id']),
-        #         arg_dictInfAdicional=var_dictInfoAdicional
-        #     )"""
+        # Exemplo (leitura em blocos + inserção em lote, uma única transação):
+        # var_intQtdItens = QueueBulkLoader.insert_items(
+        #     (str(var_dictLinha['id']), {'campo1': var_dictLinha['campo1']})
+        #     for var_listLote in QueueBulkLoader.read_excel_chunks('dados.xlsx')
+        #     for var_dictLinha in var_listLote
+        # )
+        # LogBuffer.write_log(f"{var_intQtdItens} itens adicionados à fila")
+        #
+        # Para CSV: QueueBulkLoader.read_csv_chunks('dados.csv', sep=';')
+        # Para poucos itens, QueueManager.insert_new_queue_item(...) item a item também funciona"""
         
         return "# TODO: Implementar preenchimento da fila"
     
@@ -497,28 +507,197 @@ class T2CFrameworkGenerator:
         
         tasks_text = self.specs['tasks']
         
-        # Verificar se menciona navegador
+        # Verificar se menciona navegador (com reuso de sessão, se a opção estiver ligada)
+        if self._uses_browser_session():
+            return """                # Navegador: reaproveita a sessão aberta (health-check + reset suave) e só reinicia se preciso
+                # Na última tentativa o reinício é forçado (sessão reaproveitada pode ser a causa do erro)
+                BrowserSession.preparar(
+                    arg_fncIniciar=lambda: InitAllSettings.initiate_web_manipulator(
+                        arg_boolHeadless=BrowserSession.headless(),
+                        arg_brwBrowserEscolhido=Browser.CHROME,
+                        arg_strPastaDownload=r"C:\\Downloads"
+                    ),
+                    arg_boolForcarReinicio=var_intTentativa > 0 and var_intTentativa+1 == var_intMaxTentativas
+                )
+                # Página inicial: chave UrlInicial do Config.xlsx (aberta no início e a cada reset suave)"""
         if 'navegador' in tasks_text.lower() or 'browser' in tasks_text.lower():
-            return """            # Inicializar navegador
-            InitAllSettings.initiate_web_manipulator(
-                arg_boolHeadless=False,
-                arg_brwBrowserEscolhido=Browser.CHROME,
-                arg_strPastaDownload=r"C:\\Downloads"
-            )
-            
-            # Navegar para página inicial
-            # InitAllSettings.var_botWebbot.navigate_to("https://exemplo.com")"""
+            return """                # Inicializar navegador
+                InitAllSettings.initiate_web_manipulator(
+                    arg_boolHeadless=False,
+                    arg_brwBrowserEscolhido=Browser.CHROME,
+                    arg_strPastaDownload=r"C:\\Downloads"
+                )
+                
+                # Navegar para página inicial
+                # InitAllSettings.var_botWebbot.navigate_to("https://exemplo.com")"""
         
         return "# TODO: Implementar inicialização de aplicações"
     
     def _generate_fechamento(self) -> str:
         """Gera código de fechamento"""
-        return """            # Fechar navegador
-            if InitAllSettings.var_botWebbot is not None:
-                InitAllSettings.var_botWebbot.stop_browser()
-            
-            # Fechar outras aplicações se necessário
-            # subprocess.run(['taskkill', '/F', '/IM', 'aplicacao.exe'])"""
+        if self._uses_browser_session():
+            return """                # Navegador: sessão mantida para o próximo InitAllApplications (fechada no fim do processo)
+                BrowserSession.liberar()
+                
+                # Fechar outras aplicações se necessário
+                # subprocess.run(['taskkill', '/F', '/IM', 'aplicacao.exe'])"""
+        return """                # Fechar navegador
+                if InitAllSettings.var_botWebbot is not None:
+                    InitAllSettings.var_botWebbot.stop_browser()
+                
+                # Fechar outras aplicações se necessário
+                # subprocess.run(['taskkill', '/F', '/IM', 'aplicacao.exe'])"""
+    
+    def _uses_worker_pool(self) -> bool:
+        """
+        Indica se o robô atual usa T2CLoopStationPool
+        
+        Ativado pela opção worker_pool ou pelo campo "Workers em paralelo: SIM" da
+        seção "Arquitetura de Robôs" do spec.md. Performers alimentados por um
+        dispatcher sempre usam: o pool aguarda novos itens enquanto o dispatcher
+        ainda está carregando a fila compartilhada.
+        """
+        if self.worker_pool or parse_architecture_flag(self.specs.get('spec', ""), "Workers em paralelo"):
+            return True
+        return (
+            self.robot_role == "performer" and "dispatcher" in self.robot_roles.values()
+        )
+    
+    def _uses_browser_session(self) -> bool:
+        """
+        Indica se o robô atual reaproveita a sessão do navegador
+        
+        Ativado pela opção browser_session ou pelo campo "Reutilizar navegador: SIM" da
+        seção "Arquitetura de Robôs" do spec.md, desde que as tasks usem navegador.
+        """
+        enabled = self.browser_session or parse_architecture_flag(self.specs.get('spec', ""), "Reutilizar navegador")
+        tasks_text = self.specs.get('tasks', "").lower()
+        return enabled and ('navegador' in tasks_text or 'browser' in tasks_text)
+    
+    def generate_support_files(self, templates_dir: Path):
+        """
+        Gera módulos de apoio do projeto (fila em lote, loop com workers, métricas, novas tentativas, tracker e logs em segundo plano, profiling, scripts)
+        
+        Args:
+            templates_dir: Diretório com templates (pode ser Path ou Traversable)
+        """
+        def read_template(template_path):
+            if hasattr(template_path, 'read_text'):
+                return template_path.read_text(encoding="utf-8")
+            else:
+                return Path(template_path).read_text(encoding="utf-8")
+        
+        # Template -> destino (relativo ao pacote do projeto)
+        support_files = {
+            "t2c_queue_bulk_loader.py.template": "classes_t2c/queue/T2CQueueBulkLoader.py",
+            "t2c_queue_schema.py.template": "classes_t2c/queue/T2CQueueSchema.py",
+            "t2c_metricas.py.template": "classes_t2c/utils/T2CMetricas.py",
+            "t2c_retry.py.template": "classes_t2c/utils/T2CRetry.py",
+            "t2c_tracker_buffer.py.template": "classes_t2c/utils/T2CTrackerBuffer.py",
+            "t2c_log_buffer.py.template": "classes_t2c/utils/T2CLogBuffer.py",
+            "t2c_backup_sqlite_online.py.template": "classes_t2c/utils/T2CBackupSqliteOnline.py",
+            "t2c_profiler.py.template": "classes_t2c/utils/T2CProfiler.py",
+            "relatorio_metricas.py.template": "resources/scripts/analitico_sintetico/relatorio_metricas.py",
+            "relatorio_fila.py.template": "resources/scripts/analitico_sintetico/relatorio_fila.py",
+            "benchmark_fila.py.template": "resources/scripts/benchmark_fila.py",
+            "benchmark_fila_sqlite.py.template": "resources/scripts/benchmark_fila_sqlite.py",
+            "tracker_stand_in.py.template": "resources/scripts/tracker_stand_in.py",
+        }
+        if self._uses_worker_pool():
+            support_files["t2c_loop_station_pool.py.template"] = "classes_t2c/framework/T2CLoopStationPool.py"
+        if self._uses_browser_session():
+            support_files["t2c_browser_session.py.template"] = "classes_t2c/utils/T2CBrowserSession.py"
+        
+        for template_name, destination in support_files.items():
+            content = read_template(templates_dir / template_name)
+            content = content.replace("{{PROJECT_NAME}}", self.project_name)
+            dst = self.generated_dir / self.project_name / destination
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_text(content, encoding="utf-8")
+    
+    def generate_selectors_module(self, templates_dir: Path) -> bool:
+        """
+        Gera classes_t2c/utils/T2CSelectors.py com os seletores de selectors.md pré-calculados
+        
+        Args:
+            templates_dir: Diretório com templates (pode ser Path ou Traversable)
+        
+        Returns:
+            True se o arquivo foi gravado (False se o conteúdo não mudou)
+        """
+        template_path = templates_dir / "t2c_selectors.py.template"
+        if hasattr(template_path, 'read_text'):
+            content = template_path.read_text(encoding="utf-8")
+        else:
+            content = Path(template_path).read_text(encoding="utf-8")
+        for placeholder, code in generate_selectors_code(self.specs.get('selectors', "")).items():
+            content = content.replace("{{" + placeholder + "}}", code)
+        content = content.replace("{{PROJECT_NAME}}", self.project_name)
+        
+        dst = self.generated_dir / self.project_name / "classes_t2c" / "utils" / "T2CSelectors.py"
+        # Sem mudança, manter o arquivo (e o mtime) como está
+        if dst.exists() and dst.read_text(encoding="utf-8") == content:
+            return False
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_text(content, encoding="utf-8")
+        return True
+    
+    def regenerate_selectors(self, robot_name: Optional[str], output_dir: Path) -> Path:
+        """
+        Regenera apenas o T2CSelectors.py de um robô já gerado (selectors.md alterado)
+        
+        Args:
+            robot_name: Nome do robô ('robot1', 'robot2', etc. ou None para standalone)
+            output_dir: Diretório de saída usado na geração
+        
+        Returns:
+            Caminho do diretório gerado
+        
+        Raises:
+            FileNotFoundError: Se o robô ainda não foi gerado
+        """
+        with tracing.span("regenerate_selectors", robot=robot_name or "standalone"):
+            self.specs = self.read_specs(self.spec_dir / robot_name if robot_name else None)
+            self.project_name = self._robot_project_name(robot_name)
+            self.generated_dir = output_dir / self.project_name
+            if not (self.generated_dir / self.project_name).is_dir():
+                raise FileNotFoundError(f"Robô ainda não gerado: {self.generated_dir}")
+            self.generate_selectors_module(self._templates_dir())
+        return self.generated_dir
+    
+    def regenerate_robot(self, robot_name: Optional[str], output_dir: Path) -> Path:
+        """
+        Regenera no lugar os arquivos gerados a partir das specs de um robô já gerado
+        
+        Reescreve apenas os arquivos customizados, os módulos de apoio e o T2CSelectors.py;
+        os arquivos do framework base copiados na geração completa são mantidos.
+        
+        Args:
+            robot_name: Nome do robô ('robot1', 'robot2', etc. ou None para standalone)
+            output_dir: Diretório de saída usado na geração
+        
+        Returns:
+            Caminho do diretório gerado
+        
+        Raises:
+            FileNotFoundError: Se o robô ainda não foi gerado
+            ValueError: Se as specs do robô têm erros de validação
+        """
+        with tracing.span("regenerate_robot", robot=robot_name or "standalone"):
+            self.project_name = self._robot_project_name(robot_name)
+            self.generated_dir = output_dir / self.project_name
+            if not (self.generated_dir / self.project_name).is_dir():
+                raise FileNotFoundError(f"Robô ainda não gerado: {self.generated_dir}")
+            self.specs = self.read_specs(self.spec_dir / robot_name if robot_name else None)
+            self.robot_role = self.robot_roles.get(robot_name, "standalone")
+            errors = self.validate_specs(self.specs)
+            if errors:
+                raise ValueError(f"Erros de validação para {robot_name or 'standalone'}: {', '.join(errors)}")
+            templates_dir = self._templates_dir()
+            self.generate_custom_files(templates_dir)
+            self.generate_support_files(templates_dir)
+            self.generate_selectors_module(templates_dir)
+        return self.generated_dir
     
     def generate_config_xlsx(self):
         """Gera Config.xlsx baseado em config/*.md"""
@@ -562,6 +741,21 @@ class T2CFrameworkGenerator:
         content = content.replace("{{PROJECT_DESCRIPTION}}", f"Automação RPA gerada com RPA Spec-Kit")
         (self.generated_dir / "README.md").write_text(content, encoding="utf-8")
     
+    def _robot_project_name(self, robot_name: Optional[str]) -> str:
+        """Nome do projeto gerado (com sufixo do robô se múltiplos robôs)"""
+        base_project_name = self.determine_project_name()
+        return f"{base_project_name}-{robot_name}" if robot_name else base_project_name
+    
+    def _templates_dir(self) -> Path:
+        """Diretório dos templates de código (templates/code do pacote)"""
+        # Usar importlib.resources para acessar templates do pacote instalado
+        try:
+            from rpa_speckit import templates
+            return Path(resource_files(templates) / "code")
+        except (ImportError, AttributeError):
+            # Fallback: tentar caminho relativo (modo desenvolvimento)
+            return Path(__file__).parent.parent / "templates" / "code"
+    
     def generate_single_robot(self, robot_name: str, output_dir: Path, skip_download: bool = False) -> Path:
         """
         Gera framework para um robô específico
@@ -574,6 +768,11 @@ class T2CFrameworkGenerator:
         Returns:
             Caminho do diretório gerado
         """
+        with tracing.span("generate_single_robot", robot=robot_name or "standalone"):
+            return self._generate_single_robot(robot_name, output_dir, skip_download)
+
+    def _generate_single_robot(self, robot_name: Optional[str], output_dir: Path, skip_download: bool) -> Path:
+        """Etapas de generate_single_robot (medidas em spans separados)"""
         # Determinar diretório do robô
         if robot_name:
             robot_dir = self.spec_dir / robot_name
@@ -583,22 +782,19 @@ class T2CFrameworkGenerator:
             robot_dir = None  # Standalone
         
         # Ler specs do robô
-        specs = self.read_specs(robot_dir)
+        with tracing.span("read_specs"):
+            specs = self.read_specs(robot_dir)
         self.specs = specs
+        self.robot_role = self.robot_roles.get(robot_name, "standalone")
         
         # Validar
-        errors = self.validate_specs(specs)
+        with tracing.span("validate_specs"):
+            errors = self.validate_specs(specs)
         if errors:
             raise ValueError(f"Erros de validação para {robot_name or 'standalone'}: {', '.join(errors)}")
         
         # Determinar nome do projeto
-        base_project_name = self.determine_project_name()
-        
-        # Se múltiplos robôs, adicionar sufixo do robô
-        if robot_name:
-            project_name = f"{base_project_name}-{robot_name}"
-        else:
-            project_name = base_project_name
+        project_name = self._robot_project_name(robot_name)
         
         # Criar estrutura
         self.generate_project_structure(project_name, output_dir)
@@ -616,24 +812,24 @@ class T2CFrameworkGenerator:
             self.copy_framework_files(framework_dir)
         
         # Gerar arquivos customizados
-        # Usar importlib.resources para acessar templates do pacote instalado
-        try:
-            from rpa_speckit import templates
-            templates_resource = resource_files(templates) / "code"
-            templates_dir = Path(templates_resource)
-        except (ImportError, AttributeError):
-            # Fallback: tentar caminho relativo (modo desenvolvimento)
-            templates_dir = Path(__file__).parent.parent / "templates" / "code"
+        templates_dir = self._templates_dir()
         
-        self.generate_custom_files(templates_dir)
+        with tracing.span("generate_custom_files"):
+            self.generate_custom_files(templates_dir)
+        with tracing.span("generate_support_files"):
+            self.generate_support_files(templates_dir)
+        with tracing.span("generate_selectors_module"):
+            self.generate_selectors_module(templates_dir)
         
         # Gerar Config.xlsx
-        self.generate_config_xlsx()
+        with tracing.span("generate_config_xlsx"):
+            self.generate_config_xlsx()
         
         # Gerar arquivos de projeto
-        self.generate_requirements_txt(templates_dir)
-        self.generate_setup_py(templates_dir)
-        self.generate_readme(templates_dir)
+        with tracing.span("generate_project_files"):
+            self.generate_requirements_txt(templates_dir)
+            self.generate_setup_py(templates_dir)
+            self.generate_readme(templates_dir)
         
         return self.generated_dir
     
@@ -648,6 +844,12 @@ class T2CFrameworkGenerator:
         Returns:
             Lista de caminhos dos diretórios gerados (ou caminho único se standalone)
         """
+        # Verificar o ambiente uma vez, antes de gerar qualquer robô
+        if not skip_download:
+            self.check_environment()
+        # Template clonado uma vez por geração e reaproveitado por todos os robôs
+        self._template_dir = None
+
         # Detectar estrutura
         is_multi = self.detect_structure()
         
@@ -0,0 +1,158 @@
+"""
+Geração de Código de Regras - Converte VAL*/COND* de business-rules.md em código do T2CProcess
+
+Até RULE_TABLE_THRESHOLD regras por tipo, cada regra vira um bloco de
+comentário dentro de T2CProcess.execute(). Acima disso, as regras são
+emitidas como uma tabela de dados (ID original, descrição) no início do
+T2CProcess.py, executada por um dispatcher, o que mantém o tamanho do arquivo
+gerado proporcional ao número de regras e não ao código de cada uma.
+"""
+from typing import Dict, List
+
+from rpa_speckit.utils.spec_model import parse_rules
+
+
+RULE_TABLE_THRESHOLD = 20
+
+# Tipo -> (constante da tabela, descrição, TODO do modo inline, mensagem sem regras)
+RULE_KINDS = {
+    'VAL': ("CONS_TPL_VALIDACOES", "validações de entrada", "Implementar validação", "# Nenhuma validação definida"),
+    'COND': ("CONS_TPL_CONDICOES", "condições especiais", "Implementar condição", "# Nenhuma condição especial definida"),
+}
+
+PLACEHOLDERS = {
+    'VAL': "VALIDACOES_ENTRADA",
+    'COND': "CONDICOES_ESPECIAIS",
+}
+
+_DISPATCHER = '''
+# Implementações das regras da tabela, registradas com @regra("ID")
+_var_dictImplementacoesRegras: dict = {}
+
+
+def regra(arg_strIdRegra: str):
+    """
+    Registra a implementação de uma regra das tabelas CONS_TPL_*.
+
+    Parâmetros:
+    - arg_strIdRegra (str): ID original da regra em business-rules.md (ex: "VAL001").
+
+    Retorna:
+    - Decorator que registra a função recebida.
+    """
+    def registrar(arg_fncImplementacao):
+        _var_dictImplementacoesRegras[arg_strIdRegra] = arg_fncImplementacao
+        return arg_fncImplementacao
+    return registrar
+
+
+def executar_regras(arg_tplRegras: tuple, arg_dictItem: dict):
+    """
+    Executa, na ordem da tabela, as regras que possuem implementação registrada.
+
+    Parâmetros:
+    - arg_tplRegras (tuple): tabela de regras (ID, descrição).
+    - arg_dictItem (dict): item atual da fila.
+
+    Retorna:
+    """
+    for var_strIdRegra, var_strDescricao in arg_tplRegras:
+        var_fncImplementacao = _var_dictImplementacoesRegras.get(var_strIdRegra)
+        if var_fncImplementacao is not None:
+            with Metricas.etapa(var_strIdRegra):
+                var_fncImplementacao(arg_dictItem)
+
+
+# Exemplo de implementação (lance BusinessRuleException quando a regra não for atendida):
+# @regra("VAL001")
+# def validar_val001(arg_dictItem: dict):
+#     if not arg_dictItem['info_adicionais'].get('cpf'):
+#         raise BusinessRuleException("CPF não informado")
+'''
+
+
+def extract_rules(rules_text: str) -> Dict[str, List[Dict]]:
+    """
+    Separa as regras de business-rules.md por tipo, sem limite de quantidade
+
+    Args:
+        rules_text: Conteúdo de business-rules.md
+
+    Returns:
+        Dicionário tipo (VAL/COND) -> regras na ordem do arquivo, com IDs originais
+    """
+    rules_by_kind = {kind: [] for kind in RULE_KINDS}
+    for rule in parse_rules(rules_text):
+        if rule['prefix'] in rules_by_kind:
+            rules_by_kind[rule['prefix']].append(rule)
+    return rules_by_kind
+
+
+def render_inline(rules: List[Dict], todo: str) -> str:
+    """
+    Gera um bloco por regra dentro de T2CProcess.execute(), medido com Metricas.etapa
+
+    Args:
+        rules: Regras de um tipo
+        todo: Texto do TODO de cada regra
+
+    Returns:
+        Código indentado para o corpo do método
+    """
+    lines = []
+    for rule in rules:
+        lines.append(f"        # {rule['id']}: {rule['title']}")
+        lines.append(f"        with Metricas.etapa({rule['id']!r}):")
+        lines.append(f"            # TODO: {todo}")
+        lines.append("            pass")
+        lines.append("")
+    return '\n'.join(lines)
+
+
+def render_table(rules: List[Dict], constant: str, description: str) -> str:
+    """
+    Gera a tabela de regras (ID original, descrição) em nível de módulo
+
+    Args:
+        rules: Regras de um tipo
+        constant: Nome da constante da tabela
+        description: Descrição do tipo de regra (para o comentário)
+
+    Returns:
+        Código Python da tabela
+    """
+    lines = [f"# {len(rules)} {description} geradas de business-rules.md (ID original, descrição)"]
+    lines.append(f"{constant}: tuple = (")
+    for rule in rules:
+        lines.append(f"    ({rule['id']!r}, {rule['title']!r}),")
+    lines.append(")")
+    return '\n'.join(lines)
+
+
+def generate_rule_code(rules_text: str, threshold: int = RULE_TABLE_THRESHOLD) -> Dict[str, str]:
+    """
+    Gera o código das regras VAL*/COND* para o template de T2CProcess.py
+
+    Args:
+        rules_text: Conteúdo de business-rules.md
+        threshold: Quantidade de regras de um tipo a partir da qual usar tabela + dispatcher
+
+    Returns:
+        Dicionário placeholder -> código (VALIDACOES_ENTRADA, CONDICOES_ESPECIAIS, TABELA_REGRAS)
+    """
+    code = {}
+    tables = []
+    for kind, rules in extract_rules(rules_text).items():
+        constant, description, todo, empty = RULE_KINDS[kind]
+        if not rules:
+            code[PLACEHOLDERS[kind]] = empty
+        elif len(rules) <= threshold:
+            code[PLACEHOLDERS[kind]] = render_inline(rules, todo)
+        else:
+            tables.append(render_table(rules, constant, description))
+            code[PLACEHOLDERS[kind]] = (
+                f"        # {kind}*: {len(rules)} {description} em {constant} (implementar com @regra)\n"
+                f"        executar_regras({constant}, var_dictItem)"
+            )
+    code['TABELA_REGRAS'] = '\n' + '\n\n'.join(tables) + '\n' + _DISPATCHER if tables else ""
+    return code
@@ -0,0 +1,248 @@
+"""
+Plano de scaffolding - Arquivos de um projeto montados em memória e gravados em paralelo
+
+O `t2c init` primeiro calcula todos os pares (caminho, bytes) do projeto e só
+depois grava: diretórios em uma passada e arquivos por um pool limitado de
+threads, o que reduz o tempo em sistemas de arquivos de rede e volumes
+montados do Windows, onde cada gravação pequena tem latência alta.
+
+A parte estática do projeto (tudo menos o README.md) pode ser pré-montada por
+AI assistant em templates/scaffold/<assistant>.tar.gz antes de empacotar:
+
+    python -m rpa_speckit.utils.scaffold
+
+Com o arquivo presente, da mesma versão do pacote e gerado a partir dos mesmos
+recursos (hash em SOURCE_PATTERNS), o init carrega o plano em uma única leitura
+sequencial; senão, monta o plano a partir dos recursos.
+"""
+import hashlib
+import io
+import json
+import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+from rpa_speckit import __version__
+from rpa_speckit.utils import tracing
+
+
+# Limite de threads de gravação (o ganho vem da latência de I/O, não de CPU)
+MAX_WRITE_WORKERS = 8
+
+AI_ASSISTANTS = ("cursor", "vscode-copilot", "vscode-claude", "other")
+
+# Arquivos que dependem do projeto e não entram no arquivo pré-montado
+PROJECT_FILES = ("README.md",)
+
+# Primeiro membro de cada arquivo pré-montado (versão do pacote e hash dos recursos que o geraram)
+MANIFEST_NAME = ".t2c-scaffold.json"
+
+PACKAGE_DIR = Path(__file__).parent.parent
+ARCHIVE_DIR = PACKAGE_DIR / "templates" / "scaffold"
+
+# Recursos lidos por build_scaffold_plan (relativos ao pacote): constitution, templates
+# e os comandos/scripts embutidos em commands/init.py
+SOURCE_PATTERNS = ("commands/init.py", "memory/constitution.md", "templates/*.md")
+
+
+class ScaffoldPlan:
+    """Classe com os diretórios e arquivos a criar em um projeto"""
+
+    def __init__(self, root: Path):
+        """
+        Inicializa o plano
+
+        Args:
+            root: Diretório raiz do projeto
+        """
+        self.root = Path(root)
+        self.directories: List[Path] = []
+        self.files: Dict[Path, bytes] = {}
+
+    def add_dir(self, relative_path: str):
+        """Inclui um diretório (mesmo que fique vazio)"""
+        self.directories.append(self.root / relative_path)
+
+    def add_text(self, path: Path, content: str):
+        """Inclui um arquivo de texto (gravado em UTF-8)"""
+        self.add_bytes(path, content.encode("utf-8"))
+
+    def add_bytes(self, path: Path, data: bytes):
+        """Inclui um arquivo; um caminho repetido substitui o conteúdo anterior"""
+        self.files[Path(path)] = data
+
+    def items(self) -> List[Tuple[Path, bytes]]:
+        """Pares (caminho, bytes) na ordem em que foram incluídos"""
+        return list(self.files.items())
+
+    def write(self, max_workers: Optional[int] = None):
+        """
+        Grava o plano: cria os diretórios e depois grava os arquivos em paralelo
+
+        Args:
+            max_workers: Número de threads de gravação (default: até MAX_WRITE_WORKERS)
+        """
+        directories = set(self.directories) | {path.parent for path in self.files}
+        with tracing.span("scaffold.mkdir", directories=len(directories)):
+            # Ordenados: os pais são criados antes, e os filhos só verificam exist_ok
+            for directory in sorted(directories):
+                directory.mkdir(parents=True, exist_ok=True)
+
+        items = self.items()
+        with tracing.span("scaffold.write", files=len(items)):
+            if len(items) <= 1:
+                for path, data in items:
+                    path.write_bytes(data)
+            else:
+                workers = max_workers or min(MAX_WRITE_WORKERS, len(items))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # list(): propaga a primeira exceção de gravação
+                    list(executor.map(lambda item: item[0].write_bytes(item[1]), items))
+        tracing.count("arquivos_gravados", len(items))
+
+
+def sources_hash(package_dir: Path = PACKAGE_DIR) -> str:
+    """
+    Hash do conteúdo dos recursos que entram no scaffold (SOURCE_PATTERNS)
+
+    Um arquivo pré-montado com hash diferente foi gerado antes de uma alteração nesses
+    recursos (ex: constitution.md editada em um checkout de desenvolvimento sem mudar a
+    versão) e é ignorado pelo init.
+
+    Args:
+        package_dir: Pasta do pacote rpa_speckit
+
+    Returns:
+        SHA-256 em hexadecimal
+    """
+    digest = hashlib.sha256()
+    for pattern in SOURCE_PATTERNS:
+        for path in sorted(package_dir.glob(pattern)):
+            digest.update(path.relative_to(package_dir).as_posix().encode("utf-8") + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def archive_path(ai_assistant: str, archive_dir: Path = ARCHIVE_DIR) -> Path:
+    """Caminho do arquivo pré-montado de um AI assistant"""
+    return archive_dir / f"{ai_assistant}.tar.gz"
+
+
+def write_archive(plan: ScaffoldPlan, output: Path, ai_assistant: str) -> Path:
+    """
+    Grava a parte estática de um plano em um .tar.gz (sem PROJECT_FILES)
+
+    Args:
+        plan: Plano montado com a raiz do projeto como referência
+        output: Arquivo .tar.gz a criar
+        ai_assistant: AI assistant do plano (registrado no manifesto)
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    def add(tar: tarfile.TarFile, name: str, data: Optional[bytes] = None):
+        info = tarfile.TarInfo(name)
+        if data is None:
+            info.type = tarfile.DIRTYPE
+            info.mode = 0o755
+            tar.addfile(info)
+        else:
+            info.size = len(data)
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+
+    files = {path.relative_to(plan.root).as_posix(): data for path, data in plan.items()}
+    files = {name: data for name, data in files.items() if name not in PROJECT_FILES}
+    directories = sorted({path.relative_to(plan.root).as_posix() for path in plan.directories})
+    manifest = {'version': __version__, 'ai_assistant': ai_assistant, 'sources': sources_hash(), 'files': len(files)}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(output, "w:gz") as tar:
+        add(tar, MANIFEST_NAME, json.dumps(manifest).encode("utf-8"))
+        for directory in directories:
+            add(tar, directory)
+        for name in sorted(files):
+            add(tar, name, files[name])
+    return output
+
+
+def _safe_member_path(root: Path, name: str) -> Path:
+    """Resolve o destino de um membro, recusando caminhos absolutos ou com '..'"""
+    member = PurePosixPath(name)
+    if member.is_absolute() or ".." in member.parts:
+        raise ValueError(f"Caminho inválido no arquivo pré-montado: {name}")
+    return root.joinpath(*member.parts)
+
+
+@tracing.traced("scaffold.load_archive")
+def load_archive(ai_assistant: str, root: Path, archive_dir: Path = ARCHIVE_DIR) -> Optional[ScaffoldPlan]:
+    """
+    Lê o arquivo pré-montado de um AI assistant em uma única passada sequencial
+
+    Args:
+        ai_assistant: AI assistant escolhido
+        root: Diretório do projeto
+        archive_dir: Pasta dos arquivos pré-montados
+
+    Returns:
+        Plano com a parte estática do projeto, ou None se o arquivo não existe, é de
+        outra versão do pacote ou foi gerado com outros recursos (nesse caso, monte o
+        plano completo)
+    """
+    path = archive_path(ai_assistant, archive_dir)
+    if not path.is_file():
+        return None
+    plan = ScaffoldPlan(root)
+    with open(path, "rb") as archive, tarfile.open(fileobj=archive, mode="r|gz") as tar:
+        members = iter(tar)
+        first = next(members, None)
+        if first is None or first.name != MANIFEST_NAME:
+            return None
+        manifest = json.loads(tar.extractfile(first).read().decode("utf-8"))
+        if manifest.get('version') != __version__ or manifest.get('ai_assistant') != ai_assistant:
+            return None
+        if manifest.get('sources') != sources_hash():
+            return None
+
+        for member in members:
+            target = _safe_member_path(root, member.name)
+            if member.isdir():
+                plan.directories.append(target)
+            elif member.isfile():
+                # Conteúdo lido para o plano (não tar.extract): gravação em paralelo,
+                # data atual e sem permissões/donos vindos do arquivo
+                plan.add_bytes(target, tar.extractfile(member).read())
+    return plan
+
+
+def build_archives(archive_dir: Path = ARCHIVE_DIR) -> List[Path]:
+    """
+    Pré-monta o scaffold estático de cada AI assistant (etapa de build, antes de empacotar)
+
+    Args:
+        archive_dir: Pasta de saída (default: templates/scaffold do pacote)
+
+    Returns:
+        Arquivos gravados
+    """
+    # Import tardio: commands.init usa este módulo
+    from rpa_speckit.commands.init import build_scaffold_plan
+
+    outputs = []
+    for ai_assistant in AI_ASSISTANTS:
+        plan = build_scaffold_plan(Path("projeto"), "projeto", ai_assistant)
+        outputs.append(write_archive(plan, archive_path(ai_assistant, archive_dir), ai_assistant))
+    return outputs
+
+
+def main():
+    """CLI da etapa de build: python -m rpa_speckit.utils.scaffold [pasta_de_saida]"""
+    archive_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVE_DIR
+    for output in build_archives(archive_dir):
+        print(f"{output} ({output.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
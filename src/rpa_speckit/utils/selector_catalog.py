@@ -0,0 +1,218 @@
+"""
+Catálogo de Seletores - Índice dos seletores de selectors.md e geração do T2CSelectors.py
+
+Cada seletor (### Pasta: x / #### elemento) vira uma entrada com pasta (tela ou
+sistema), estratégia (clicknium, xpath, css, id, name) e valor. Sem estratégia
+explícita ou reconhecível no campo **Seletor:**, o seletor é o locator gravado
+no Clicknium Recorder (locator.<pasta>.<elemento>), como orienta o template.
+
+O catálogo detecta nomes duplicados e seletores diferentes com o mesmo locator,
+e é emitido como um módulo de constantes pré-calculadas com busca por nome.
+"""
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+from rpa_speckit.utils.spec_model import parse_selectors
+
+
+STRATEGIES = ("clicknium", "xpath", "css", "id", "name")
+
+# Prefixos explícitos no valor do seletor (ex: "xpath=//button", "css=#login")
+_PREFIX_PATTERN = re.compile(r'^(clicknium|xpath|css|id|name)\s*[=:]\s*(.+)$', re.IGNORECASE)
+
+
+def _field(fields: Dict[str, str], *names: str) -> str:
+    """Valor do primeiro campo presente (sem diferenciar maiúsculas e acentos no nome)"""
+    normalized = {_ascii(key).lower(): value for key, value in fields.items()}
+    for name in names:
+        value = normalized.get(name)
+        if value:
+            return value.strip().strip('`').strip()
+    return ""
+
+
+def _ascii(text: str) -> str:
+    """Remove acentos (ex: "Estratégia" -> "Estrategia")"""
+    return ''.join(char for char in unicodedata.normalize('NFKD', text) if not unicodedata.combining(char))
+
+
+def _is_placeholder(value: str) -> bool:
+    """Indica se o valor ainda é um placeholder do template ([...])"""
+    return not value or value.strip().startswith('[')
+
+
+def constant_name(folder: str, name: str) -> str:
+    """
+    Nome da constante de um seletor no módulo gerado
+
+    Args:
+        folder: Pasta do seletor
+        name: Nome do elemento
+
+    Returns:
+        Identificador em maiúsculas (ex: "login", "btn entrar" -> "CONS_SEL_LOGIN_BTN_ENTRAR")
+    """
+    identifier = re.sub(r'\W+', '_', _ascii(f"{folder}_{name}")).strip('_').upper()
+    return f"CONS_SEL_{identifier or 'SELETOR'}"
+
+
+def detect_strategy(folder: str, name: str, fields: Dict[str, str]) -> Dict[str, str]:
+    """
+    Determina estratégia e valor de um seletor
+
+    Args:
+        folder: Pasta do seletor
+        name: Nome do elemento
+        fields: Campos do seletor (Tipo, Seletor, Estratégia, Uso...)
+
+    Returns:
+        Dicionário com strategy, value e description (texto livre do campo Seletor, se houver)
+    """
+    selector = _field(fields, 'seletor', 'selector', 'locator')
+    explicit = _field(fields, 'estrategia', 'strategy').lower()
+    match = _PREFIX_PATTERN.match(selector)
+    if match:
+        strategy, value = match.group(1).lower(), match.group(2).strip()
+    elif explicit in STRATEGIES and explicit != "clicknium" and selector:
+        strategy, value = explicit, selector
+    elif selector.startswith(("//", "(//")):
+        strategy, value = "xpath", selector
+    elif selector.startswith("locator."):
+        strategy, value = "clicknium", selector
+    else:
+        # Descrição livre: o locator é o do Clicknium Recorder
+        path = ".".join(part for part in (folder, name) if part)
+        return {'strategy': "clicknium", 'value': path, 'description': "" if _is_placeholder(selector) else selector}
+
+    if strategy == "clicknium" and value.startswith("locator."):
+        value = value[len("locator."):]
+    return {'strategy': strategy, 'value': value, 'description': ""}
+
+
+class SelectorCatalog:
+    """Classe com o índice dos seletores de um selectors.md (chave "pasta.elemento")"""
+
+    def __init__(self, selectors_text: str = ""):
+        """
+        Monta o catálogo
+
+        Args:
+            selectors_text: Conteúdo de selectors.md
+        """
+        self.entries: List[Dict] = []
+        self.index: Dict[str, Dict] = {}
+        self.issues: List[Dict] = []
+        self._build(selectors_text)
+
+    def _build(self, selectors_text: str):
+        """Indexa os seletores e registra duplicados e conflitos"""
+        constants = set()
+        by_locator: Dict[tuple, Dict] = {}
+        for selector in parse_selectors(selectors_text):
+            if _is_placeholder(selector['name']) or _is_placeholder(selector['folder']):
+                continue
+            key = f"{selector['folder']}.{selector['name']}" if selector['folder'] else selector['name']
+            if key in self.index:
+                self.issues.append({
+                    'kind': "duplicate", 'key': key, 'line': selector['line'],
+                    'message': f"Seletor '{key}' duplicado (primeira definição na linha {self.index[key]['line']})",
+                })
+                continue
+
+            constant = constant_name(selector['folder'], selector['name'])
+            suffix = 2
+            while constant in constants:
+                constant = f"{constant_name(selector['folder'], selector['name'])}_{suffix}"
+                suffix += 1
+            constants.add(constant)
+
+            entry = {
+                'key': key,
+                'name': selector['name'],
+                'folder': selector['folder'],
+                'type': _field(selector['fields'], 'tipo', 'type'),
+                'line': selector['line'],
+                'constant': constant,
+                **detect_strategy(selector['folder'], selector['name'], selector['fields']),
+            }
+            locator = (entry['strategy'], entry['value'])
+            if locator in by_locator:
+                other = by_locator[locator]
+                self.issues.append({
+                    'kind': "conflict", 'key': key, 'line': selector['line'],
+                    'message': f"Seletores '{other['key']}' e '{key}' usam o mesmo locator ({entry['strategy']}: {entry['value']})",
+                })
+            else:
+                by_locator[locator] = entry
+            self.entries.append(entry)
+            self.index[key] = entry
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """
+        Busca um seletor
+
+        Args:
+            name: "pasta.elemento" ou só "elemento" (se o nome for único no catálogo)
+
+        Returns:
+            Entrada do catálogo (ou None)
+        """
+        if name in self.index:
+            return self.index[name]
+        matches = [entry for entry in self.entries if entry['name'] == name]
+        return matches[0] if len(matches) == 1 else None
+
+    def strategies(self) -> List[str]:
+        """Estratégias usadas no catálogo (em ordem de STRATEGIES)"""
+        used = {entry['strategy'] for entry in self.entries}
+        return [strategy for strategy in STRATEGIES if strategy in used]
+
+    def render_constants(self) -> str:
+        """Constantes Seletor(...) de cada entrada, agrupadas por pasta"""
+        if not self.entries:
+            return "# Nenhum seletor definido em selectors.md"
+        lines = []
+        folder = None
+        for entry in self.entries:
+            if entry['folder'] != folder:
+                folder = entry['folder']
+                lines += ["", f"# Pasta: {folder}"] if lines else [f"# Pasta: {folder}"]
+            if entry['description']:
+                lines.append(f"# {entry['description']}")
+            lines.append(
+                f"{entry['constant']} = Seletor({entry['name']!r}, {entry['folder']!r}, "
+                f"{entry['strategy']!r}, {entry['value']!r}, {entry['type']!r})"
+            )
+        return '\n'.join(lines)
+
+    def render_index(self) -> str:
+        """Dicionário nome -> constante (chave completa e, se único, o nome do elemento)"""
+        names = [entry['name'] for entry in self.entries]
+        lines = ["{"]
+        for entry in self.entries:
+            lines.append(f"        {entry['key']!r}: {entry['constant']},")
+            if entry['key'] != entry['name'] and names.count(entry['name']) == 1 and entry['name'] not in self.index:
+                lines.append(f"        {entry['name']!r}: {entry['constant']},")
+        lines.append("    }")
+        return '\n'.join(lines) if self.entries else "{}"
+
+
+def generate_selectors_code(selectors_text: str) -> Dict[str, str]:
+    """
+    Gera o código do template de T2CSelectors.py
+
+    Args:
+        selectors_text: Conteúdo de selectors.md
+
+    Returns:
+        Dicionário placeholder -> código (CONSTANTES_SELETORES, INDICE_SELETORES)
+    """
+    catalog = SelectorCatalog(selectors_text)
+    return {
+        'CONSTANTES_SELETORES': catalog.render_constants(),
+        'INDICE_SELETORES': catalog.render_index(),
+    }
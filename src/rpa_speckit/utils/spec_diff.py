@@ -0,0 +1,295 @@
+"""
+Diff semântico de specs - Mudanças por item (seção, regra, task, seletor, slide)
+
+Compara o modelo de uma spec (spec_model) e os slides dos seus DDPs com o
+snapshot gravado na última vez em que as mudanças foram entregues ao assistente
+(.specify/cache/spec-snapshots/<spec>.json). Cada item tem um ID estável
+(chave do título da seção, VAL001, Task 2.1, Pasta/elemento, título do slide),
+então inserir um item no meio do arquivo não marca os seguintes como alterados.
+O resultado vira um prompt compacto só com o que mudou.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from rpa_speckit.utils import tracing
+from rpa_speckit.utils.ddp_index import ROOT_SPEC, DdpIndex
+from rpa_speckit.utils.spec_model import normalize_title, parse_spec_texts, read_spec_texts
+
+
+SNAPSHOT_VERSION = "1"
+
+SNAPSHOT_DIR = Path(".specify") / "cache" / "spec-snapshots"
+
+# Ordem e rótulo dos tipos de item no prompt
+KINDS = {
+    'section': "Seções (spec.md)",
+    'rule': "Regras (business-rules.md)",
+    'task': "Tasks (tasks.md)",
+    'selector': "Seletores (selectors.md)",
+    'slide': "Slides do DDP",
+}
+
+
+def _fingerprint(*values) -> str:
+    """Hash curto do conteúdo de um item (o que decide se ele mudou)"""
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def _unique(key: str, seen: Dict[str, int]) -> str:
+    """Torna um ID único dentro do arquivo (títulos repetidos recebem #2, #3...)"""
+    seen[key] = seen.get(key, 0) + 1
+    return key if seen[key] == 1 else f"{key}#{seen[key]}"
+
+
+def _items(entries: List[Dict], make_id: Callable[[Dict], str], title: Callable[[Dict], str],
+           body: Callable[[Dict], str], content: Callable[[Dict], tuple]) -> Dict[str, Dict]:
+    """Converte itens do modelo em {id: {title, line, body, hash}}"""
+    seen: Dict[str, int] = {}
+    items = {}
+    for entry in entries:
+        item_id = _unique(make_id(entry), seen)
+        items[item_id] = {
+            'title': title(entry),
+            'line': entry.get('line', 0),
+            'body': body(entry),
+            'hash': _fingerprint(*content(entry)),
+        }
+    return items
+
+
+def _format_fields(fields: Dict[str, str]) -> str:
+    """Campos "- **Campo:** valor" de volta em Markdown"""
+    return "\n".join(f"- **{name}:** {value}" for name, value in fields.items())
+
+
+def model_items(model: Dict) -> Dict[str, Dict[str, Dict]]:
+    """
+    Itens comparáveis de um modelo de spec (ver parse_spec_texts)
+
+    Args:
+        model: Modelo com sections, rules, tasks e selectors
+
+    Returns:
+        Tipo -> ID estável -> item (title, line, body, hash)
+    """
+    return {
+        'section': _items(
+            [section for section in model['sections'] if section['level'] == 2],
+            lambda section: section['key'] or f"linha-{section['line']}",
+            lambda section: section['title'],
+            lambda section: section['body'],
+            lambda section: (section['title'], section['body']),
+        ),
+        'rule': _items(
+            model['rules'],
+            lambda rule: rule['id'],
+            lambda rule: f"{rule['id']}: {rule['title']}",
+            lambda rule: rule['body'],
+            lambda rule: (rule['title'], rule['body']),
+        ),
+        'task': _items(
+            model['tasks'],
+            lambda task: f"Task {task['id']}",
+            lambda task: f"Task {task['id']}: {task['title']}",
+            lambda task: _format_fields(task['fields']),
+            lambda task: (task['title'], task['fields']),
+        ),
+        'selector': _items(
+            model['selectors'],
+            lambda selector: f"{selector['folder']}/{selector['name']}",
+            lambda selector: f"{selector['folder']} / {selector['name']}",
+            lambda selector: _format_fields(selector['fields']),
+            lambda selector: (selector['fields'],),
+        ),
+    }
+
+
+def slide_items(slides: List[Dict]) -> Dict[str, Dict]:
+    """
+    Itens comparáveis dos slides de um DDP (ID pelo título: o primeiro texto do slide)
+
+    Args:
+        slides: Slides de read_slides (number, texts)
+
+    Returns:
+        ID estável -> item (title, line = número do slide, body, hash)
+    """
+    return _items(
+        [{**slide, 'line': slide['number']} for slide in slides],
+        lambda slide: normalize_title(slide['texts'][0].splitlines()[0]) if slide['texts'] else f"slide-{slide['number']}",
+        lambda slide: f"Slide {slide['number']}: {slide['texts'][0].splitlines()[0]}" if slide['texts'] else f"Slide {slide['number']}",
+        lambda slide: "\n".join(slide['texts']),
+        lambda slide: (slide['texts'],),
+    )
+
+
+class SpecSnapshot:
+    """Classe para montar, gravar e carregar o snapshot de uma spec"""
+
+    def __init__(self, spec_dir: Path, project_root: Optional[Path] = None):
+        """
+        Inicializa o snapshot
+
+        Args:
+            spec_dir: Diretório da spec (specs/001-[nome]/)
+            project_root: Raiz do projeto (default: dois níveis acima da spec)
+        """
+        self.spec_dir = Path(spec_dir).resolve()
+        self.project_root = Path(project_root).resolve() if project_root else self.spec_dir.parent.parent
+        self.path = self.project_root / SNAPSHOT_DIR / f"{self.spec_dir.name}.json"
+
+    def robots(self) -> List[Optional[str]]:
+        """Robôs da spec (robotN/, em ordem numérica) ou [None] para standalone"""
+        robots = sorted(
+            (entry.name for entry in self.spec_dir.iterdir()
+             if entry.is_dir() and entry.name.startswith("robot") and entry.name[5:].isdigit()),
+            key=lambda name: int(name[5:]),
+        )
+        return robots or [None]
+
+    def load(self) -> Optional[Dict]:
+        """Snapshot gravado (None se não existe ou é de outra versão)"""
+        try:
+            snapshot = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return snapshot if snapshot.get('version') == SNAPSHOT_VERSION else None
+
+    def save(self, snapshot: Dict):
+        """Grava o snapshot (passa a ser a base do próximo diff)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+
+    @tracing.traced("spec_diff.build")
+    def build(self, previous: Optional[Dict] = None, include_ddp: bool = True) -> Dict:
+        """
+        Monta o snapshot atual da spec
+
+        Args:
+            previous: Snapshot anterior (os slides de decks com o mesmo hash são reaproveitados)
+            include_ddp: Se False, não lê os DDPs (mantém os slides do snapshot anterior)
+
+        Returns:
+            Snapshot com version, spec, units (robô -> itens), tasks e ddps (deck -> sha256, slides)
+        """
+        units = {}
+        tasks: Dict[str, Dict] = {}
+        for robot in self.robots():
+            model = parse_spec_texts(read_spec_texts(self.spec_dir, self.spec_dir / robot if robot else None))
+            items = model_items(model)
+            # tasks.md é da spec inteira: comparado uma vez, fora dos robôs
+            tasks = items.pop('task')
+            units[robot or ""] = items
+
+        ddps = {}
+        if not include_ddp:
+            ddps = dict((previous or {}).get('ddps', {}))
+        else:
+            index = DdpIndex(self.project_root)
+            # DDPs da spec; sem eles, os da pasta DDP/ na raiz do projeto
+            decks = index.decks(self.spec_dir.name) or index.decks(ROOT_SPEC)
+            old_ddps = (previous or {}).get('ddps', {})
+            for deck in decks:
+                old = old_ddps.get(deck['rel'])
+                if old and old['sha256'] == deck['sha256']:
+                    ddps[deck['rel']] = old
+                    continue
+                # Import tardio: python-pptx só é necessário quando um deck mudou
+                from rpa_speckit.utils.ddp_extractor import read_slides
+                ddps[deck['rel']] = {'sha256': deck['sha256'], 'slides': slide_items(read_slides(deck['path']))}
+
+        return {'version': SNAPSHOT_VERSION, 'spec': self.spec_dir.name, 'units': units, 'tasks': tasks, 'ddps': ddps}
+
+
+def diff_items(kind: str, unit: str, old: Dict[str, Dict], new: Dict[str, Dict]) -> List[Dict]:
+    """
+    Compara dois conjuntos de itens pelo ID estável
+
+    Args:
+        kind: Tipo do item (section, rule, task, selector, slide)
+        unit: Robô ou deck a que os itens pertencem ("" para a spec)
+        old: Itens do snapshot anterior
+        new: Itens atuais
+
+    Returns:
+        Mudanças com kind, unit, id, status (added, removed, changed), title, line e body
+    """
+    changes = []
+    for item_id, item in new.items():
+        status = "added" if item_id not in old else "changed" if old[item_id]['hash'] != item['hash'] else None
+        if status:
+            changes.append({'kind': kind, 'unit': unit, 'id': item_id, 'status': status,
+                            'title': item['title'], 'line': item['line'], 'body': item['body']})
+    for item_id, item in old.items():
+        if item_id not in new:
+            changes.append({'kind': kind, 'unit': unit, 'id': item_id, 'status': "removed",
+                            'title': item['title'], 'line': item['line'], 'body': ""})
+    return changes
+
+
+def diff_snapshots(old: Optional[Dict], new: Dict) -> List[Dict]:
+    """
+    Lista as mudanças entre dois snapshots (sem snapshot anterior, tudo é "added")
+
+    Args:
+        old: Snapshot anterior (ou None)
+        new: Snapshot atual
+
+    Returns:
+        Mudanças ordenadas por tipo, unidade e linha
+    """
+    old = old or {'units': {}, 'tasks': {}, 'ddps': {}}
+    changes = []
+    for unit in sorted(set(old['units']) | set(new['units'])):
+        old_items = old['units'].get(unit, {})
+        new_items = new['units'].get(unit, {})
+        for kind in ('section', 'rule', 'selector'):
+            changes += diff_items(kind, unit, old_items.get(kind, {}), new_items.get(kind, {}))
+    changes += diff_items('task', "", old['tasks'], new['tasks'])
+    for deck in sorted(set(old['ddps']) | set(new['ddps'])):
+        changes += diff_items('slide', deck, old['ddps'].get(deck, {}).get('slides', {}),
+                              new['ddps'].get(deck, {}).get('slides', {}))
+
+    order = list(KINDS)
+    return sorted(changes, key=lambda change: (order.index(change['kind']), change['unit'], change['line']))
+
+
+def format_delta_prompt(spec: str, changes: List[Dict], first_run: bool = False) -> str:
+    """
+    Monta o prompt compacto com as mudanças para o assistente
+
+    Args:
+        spec: Nome da spec
+        changes: Mudanças de diff_snapshots
+        first_run: Se True, não havia snapshot anterior (o prompt traz a spec inteira)
+
+    Returns:
+        Markdown com um bloco por tipo de item: IDs removidos e corpo dos adicionados/alterados
+    """
+    if not changes:
+        return f"# Delta da spec {spec}\n\nNenhuma mudança desde o último diff.\n"
+
+    counts = {status: sum(1 for change in changes if change['status'] == status)
+              for status in ("added", "changed", "removed")}
+    lines = [
+        f"# Delta da spec {spec}",
+        "",
+        "Sem snapshot anterior: todos os itens aparecem como adicionados." if first_run else
+        "Aplique apenas estas mudanças; o restante da spec não mudou desde a última atualização.",
+        "",
+        f"**Resumo:** {counts['added']} adicionado(s), {counts['changed']} alterado(s), {counts['removed']} removido(s)",
+    ]
+    labels = {'added': "+", 'changed': "~", 'removed': "-"}
+    for kind, label in KINDS.items():
+        kind_changes = [change for change in changes if change['kind'] == kind]
+        if not kind_changes:
+            continue
+        lines += ["", f"## {label}"]
+        for change in kind_changes:
+            where = f" [{change['unit']}]" if change['unit'] else ""
+            lines += ["", f"### {labels[change['status']]} {change['title']}{where}"]
+            if change['body']:
+                lines += ["", change['body']]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,348 @@
+"""
+Modelo de Specs - Leitura estruturada dos arquivos .md de especificação
+
+Converte spec.md, business-rules.md, tasks.md e selectors.md em estruturas
+simples (dicionários e listas) que podem ser validadas, comparadas e
+serializadas em JSON.
+"""
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+SPEC_FILES = {
+    'spec': 'spec.md',
+    'selectors': 'selectors.md',
+    'business_rules': 'business-rules.md',
+    'tests': 'tests.md',
+}
+
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_RULE_PATTERN = re.compile(r'^((VAL|COND|EXC(?:_UNMAPPED)?)(\d+))\b[:\s-]*(.*)$', re.IGNORECASE)
+_PHASE_PATTERN = re.compile(r'^Fase\s+(\d+)\s*[:\-]?\s*(.*)$', re.IGNORECASE)
+_TASK_PATTERN = re.compile(r'^Task\s+(\d+)\.(\d+)\s*[:\-]?\s*(.*)$', re.IGNORECASE)
+_FIELD_PATTERN = re.compile(r'^\s*-\s*\*\*([^*]+?):?\*\*:?\s*(.*)$')
+_PASTA_PATTERN = re.compile(r'^Pasta\s*:\s*(.+)$', re.IGNORECASE)
+
+
+def slugify(title: str) -> str:
+    """
+    Converte um título Markdown na âncora gerada pelos renderizadores (estilo GitHub)
+
+    Args:
+        title: Texto do título
+
+    Returns:
+        Âncora em minúsculas com hífens (ex: "Login SAP" -> "login-sap")
+    """
+    slug = title.strip().lower()
+    slug = re.sub(r'[^\w\s-]', '', slug, flags=re.UNICODE)
+    return re.sub(r'\s', '-', slug)
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normaliza um título para comparação (sem acentos, emojis, pontuação ou sufixos)
+
+    Args:
+        title: Texto do título
+
+    Returns:
+        Chave normalizada (ex: "INIT: Inicialização (...)" -> "init")
+    """
+    key = re.split(r'[:(]', title, maxsplit=1)[0]
+    key = unicodedata.normalize('NFKD', key)
+    key = ''.join(char for char in key if not unicodedata.combining(char))
+    key = re.sub(r'[^\w\s]', ' ', key.lower(), flags=re.UNICODE)
+    return ' '.join(key.split())
+
+
+def iter_lines(text: str):
+    """
+    Itera sobre as linhas de um Markdown ignorando blocos de código
+
+    Args:
+        text: Conteúdo Markdown
+
+    Yields:
+        Tuplas (número da linha, linha) fora de blocos ``` / ~~~
+    """
+    in_code = False
+    for line_number, line in enumerate(text.splitlines(), 1):
+        stripped = line.lstrip()
+        if stripped.startswith('```') or stripped.startswith('~~~'):
+            in_code = not in_code
+            continue
+        if not in_code:
+            yield line_number, line
+
+
+def parse_headings(text: str) -> List[Dict]:
+    """
+    Lista os títulos de um Markdown
+
+    Args:
+        text: Conteúdo Markdown
+
+    Returns:
+        Lista de dicionários com level, title e line
+    """
+    headings = []
+    for line_number, line in iter_lines(text):
+        match = _HEADING_PATTERN.match(line)
+        if match:
+            headings.append({
+                'level': len(match.group(1)),
+                'title': match.group(2).strip(),
+                'line': line_number,
+            })
+    return headings
+
+
+def parse_sections(text: str) -> List[Dict]:
+    """
+    Divide um Markdown em seções, cada uma com o corpo até o próximo título
+
+    Args:
+        text: Conteúdo Markdown
+
+    Returns:
+        Lista de dicionários com level, title, line, key e body
+    """
+    lines = text.splitlines()
+    headings = parse_headings(text)
+    sections = []
+    for index, heading in enumerate(headings):
+        end = len(lines)
+        for following in headings[index + 1:]:
+            if following['level'] <= heading['level']:
+                end = following['line'] - 1
+                break
+        body = '\n'.join(lines[heading['line']:end]).strip()
+        sections.append({
+            'level': heading['level'],
+            'title': heading['title'],
+            'line': heading['line'],
+            'key': normalize_title(heading['title']),
+            'body': body,
+        })
+    return sections
+
+
+def parse_fields(body: str) -> Dict[str, str]:
+    """
+    Extrai campos no formato "- **Campo:** valor" do corpo de uma seção
+
+    Args:
+        body: Corpo da seção
+
+    Returns:
+        Dicionário campo -> valor
+    """
+    fields = {}
+    for line in body.splitlines():
+        match = _FIELD_PATTERN.match(line)
+        if match:
+            fields[match.group(1).strip()] = match.group(2).strip()
+    return fields
+
+
+def parse_robot_role(text: str) -> str:
+    """
+    Lê o tipo do robô (campo "Tipo" da seção "Arquitetura de Robôs" de spec.md)
+
+    Args:
+        text: Conteúdo de spec.md
+
+    Returns:
+        'dispatcher', 'performer' ou 'standalone' (também quando o campo
+        não foi preenchido)
+    """
+    for section in parse_sections(text):
+        if normalize_title(section['title']) != 'arquitetura de robos':
+            continue
+        value = parse_fields(section['body']).get('Tipo', '')
+        # Template não preenchido: "[Standalone / Dispatcher / Performer]"
+        if '/' in value:
+            return 'standalone'
+        for role in ('dispatcher', 'performer'):
+            if role in value.lower():
+                return role
+    return 'standalone'
+
+
+def parse_architecture_flag(text: str, field: str) -> bool:
+    """
+    Lê um campo SIM/NÃO da seção "Arquitetura de Robôs" de spec.md (opções de geração)
+
+    Args:
+        text: Conteúdo de spec.md
+        field: Nome do campo (ex: "Workers em paralelo")
+
+    Returns:
+        True se o campo estiver preenchido com SIM (False se ausente, NÃO ou não
+        preenchido)
+    """
+    for section in parse_sections(text):
+        if normalize_title(section['title']) != 'arquitetura de robos':
+            continue
+        value = parse_fields(section['body']).get(field, '').strip()
+        # Template não preenchido: "[SIM / NÃO - ...]" (valores como "SIM (web/API)" valem)
+        if value.startswith('[') or re.search(r'SIM\s*/\s*N[ÃA]O', value, re.IGNORECASE):
+            return False
+        words = re.findall(r'\w+', value, flags=re.UNICODE)
+        return bool(words) and words[0].upper() == 'SIM'
+    return False
+
+
+def parse_rules(text: str) -> List[Dict]:
+    """
+    Extrai as regras de negócio (VAL*, COND*, EXC*) de business-rules.md
+
+    Args:
+        text: Conteúdo de business-rules.md
+
+    Returns:
+        Lista de regras com id, prefix, number, title, line, fields e body,
+        na ordem em que aparecem no arquivo (IDs originais preservados)
+    """
+    rules = []
+    for section in parse_sections(text):
+        if section['level'] < 3:
+            continue
+        match = _RULE_PATTERN.match(section['title'])
+        if not match:
+            continue
+        rules.append({
+            'id': match.group(1).upper(),
+            'prefix': match.group(2).upper(),
+            'number': int(match.group(3)),
+            'title': match.group(4).strip(),
+            'line': section['line'],
+            'fields': parse_fields(section['body']),
+            'body': section['body'],
+        })
+    return rules
+
+
+def parse_tasks(text: str) -> Dict[str, List[Dict]]:
+    """
+    Extrai fases e tasks de tasks.md
+
+    Args:
+        text: Conteúdo de tasks.md
+
+    Returns:
+        Dicionário com 'phases' (number, title, line) e 'tasks'
+        (id, phase, major, minor, title, line, fields)
+    """
+    phases = []
+    tasks = []
+    current_phase: Optional[int] = None
+    for section in parse_sections(text):
+        if section['level'] == 2:
+            match = _PHASE_PATTERN.match(section['title'])
+            current_phase = int(match.group(1)) if match else None
+            if match:
+                phases.append({
+                    'number': current_phase,
+                    'title': match.group(2).strip(),
+                    'line': section['line'],
+                })
+        elif section['level'] == 3:
+            match = _TASK_PATTERN.match(section['title'])
+            if match:
+                tasks.append({
+                    'id': f"{match.group(1)}.{match.group(2)}",
+                    'phase': current_phase,
+                    'major': int(match.group(1)),
+                    'minor': int(match.group(2)),
+                    'title': match.group(3).strip(),
+                    'line': section['line'],
+                    'fields': parse_fields(section['body']),
+                })
+    return {'phases': phases, 'tasks': tasks}
+
+
+def parse_selectors(text: str) -> List[Dict]:
+    """
+    Extrai os seletores de selectors.md (### Pasta: x / #### elemento)
+
+    Args:
+        text: Conteúdo de selectors.md
+
+    Returns:
+        Lista de seletores com name, folder, line, anchor e fields
+    """
+    selectors = []
+    current_folder = ""
+    for section in parse_sections(text):
+        if section['level'] == 3:
+            match = _PASTA_PATTERN.match(section['title'])
+            current_folder = match.group(1).strip() if match else section['title']
+        elif section['level'] == 4:
+            selectors.append({
+                'name': section['title'],
+                'folder': current_folder,
+                'line': section['line'],
+                'anchor': slugify(section['title']),
+                'fields': parse_fields(section['body']),
+            })
+    return selectors
+
+
+def parse_spec_texts(texts: Dict[str, str]) -> Dict:
+    """
+    Converte os textos de uma spec (chaves de read_specs) em modelo estruturado
+
+    Args:
+        texts: Dicionário com spec, selectors, business_rules, tests e tasks
+
+    Returns:
+        Modelo com sections, rules, tasks e selectors
+    """
+    model = {
+        'sections': [],
+        'rules': [],
+        'phases': [],
+        'tasks': [],
+        'selectors': [],
+    }
+    if 'spec' in texts:
+        model['sections'] = [
+            {key: section[key] for key in ('level', 'title', 'line', 'key', 'body')}
+            for section in parse_sections(texts['spec'])
+        ]
+    if 'business_rules' in texts:
+        model['rules'] = parse_rules(texts['business_rules'])
+    if 'tasks' in texts:
+        parsed_tasks = parse_tasks(texts['tasks'])
+        model['phases'] = parsed_tasks['phases']
+        model['tasks'] = parsed_tasks['tasks']
+    if 'selectors' in texts:
+        model['selectors'] = parse_selectors(texts['selectors'])
+    return model
+
+
+def read_spec_texts(spec_dir: Path, robot_dir: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Lê os arquivos .md existentes de uma spec (sem exigir que todos existam)
+
+    Args:
+        spec_dir: Diretório da spec (specs/001-[nome]/)
+        robot_dir: Diretório do robô (None para standalone)
+
+    Returns:
+        Dicionário com os textos encontrados (tasks.md sempre da raiz da spec)
+    """
+    base_dir = robot_dir if robot_dir else spec_dir
+    texts = {}
+    for key, filename in SPEC_FILES.items():
+        file_path = base_dir / filename
+        if file_path.exists():
+            texts[key] = file_path.read_text(encoding="utf-8")
+    tasks_file = spec_dir / 'tasks.md'
+    if tasks_file.exists():
+        texts['tasks'] = tasks_file.read_text(encoding="utf-8")
+    return texts
@@ -0,0 +1,540 @@
+"""
+Validador de Specs - Verificações estruturais de specs/ com cache incremental
+
+As verificações rodam em paralelo para todas as specs e robôs do projeto e
+os resultados ficam em cache por hash de arquivo em .specify/cache/, de modo
+que uma nova validação só reprocessa os arquivos alterados.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rpa_speckit.utils.spec_model import (
+    SPEC_FILES,
+    normalize_title,
+    parse_headings,
+    parse_rules,
+    parse_sections,
+    parse_selectors,
+    parse_tasks,
+    slugify,
+)
+from rpa_speckit.utils.selector_catalog import SelectorCatalog
+try:
+    from importlib.resources import files as resource_files
+except ImportError:
+    # Python < 3.9 fallback
+    from importlib_resources import files as resource_files
+
+
+VALIDATOR_VERSION = "1"
+
+CACHE_FILE = "validate.json"
+
+# Regras de validação (id -> (nível, descrição)), usadas também na saída SARIF
+RULES = {
+    "T2C001": ("error", "Arquivo obrigatório não encontrado"),
+    "T2C002": ("error", "Seção obrigatória do spec-template.md ausente em spec.md"),
+    "T2C003": ("error", "spec.md vazio, incompleto ou sem menção ao T2C Framework"),
+    "T2C004": ("error", "ID de regra de negócio duplicado"),
+    "T2C005": ("warning", "Numeração de regras de negócio fora de sequência"),
+    "T2C006": ("error", "Task fora da fase correspondente"),
+    "T2C007": ("error", "ID de task duplicado"),
+    "T2C008": ("warning", "Numeração de tasks fora de sequência"),
+    "T2C009": ("warning", "Fase sem tasks"),
+    "T2C010": ("warning", "Seletor não referenciado em spec.md"),
+    "T2C011": ("error", "Link para seção inexistente em selectors.md"),
+    "T2C012": ("error", "Link para regra inexistente em business-rules.md"),
+    "T2C013": ("error", "Task atribuída a robô inexistente"),
+    "T2C014": ("error", "Seletor duplicado em selectors.md"),
+    "T2C015": ("warning", "Seletores diferentes com o mesmo locator"),
+}
+
+_LINK_PATTERN = r'{filename}#([^)\s\]`,]+)'
+
+
+def _issue(rule: str, file: str, message: str, line: int = 1) -> Dict:
+    """Cria um registro de problema no formato usado pelo validador"""
+    return {
+        'rule': rule,
+        'level': RULES[rule][0],
+        'file': file,
+        'line': line,
+        'message': message,
+    }
+
+
+def _is_placeholder(value: str) -> bool:
+    """Indica se o valor ainda é um placeholder do template ([...])"""
+    return not value or value.startswith('[')
+
+
+def _check_file(check, path: Path, file: str, *args) -> List[Dict]:
+    """Lê o arquivo e aplica uma função de verificação sobre o seu conteúdo"""
+    return check(path.read_text(encoding="utf-8"), file, *args)
+
+
+def load_template_sections() -> List[str]:
+    """
+    Lê os títulos de nível 2 do spec-template.md do pacote
+
+    Returns:
+        Lista de títulos obrigatórios para spec.md
+    """
+    try:
+        from rpa_speckit import templates
+        template_text = (resource_files(templates) / "spec-template.md").read_text(encoding="utf-8")
+    except (ImportError, AttributeError, FileNotFoundError):
+        # Fallback: tentar caminho relativo (modo desenvolvimento)
+        template_path = Path(__file__).parent.parent / "templates" / "spec-template.md"
+        template_text = template_path.read_text(encoding="utf-8")
+    return [heading['title'] for heading in parse_headings(template_text) if heading['level'] == 2]
+
+
+def check_spec(text: str, file: str, required_sections: List[str]) -> List[Dict]:
+    """
+    Verifica se spec.md contém todas as seções do template e menciona o T2C Framework
+
+    Args:
+        text: Conteúdo de spec.md
+        file: Caminho do arquivo (para o relatório)
+        required_sections: Títulos de nível 2 do spec-template.md
+
+    Returns:
+        Lista de problemas encontrados
+    """
+    issues = []
+    if len(text.strip()) < 100:
+        issues.append(_issue("T2C003", file, "spec.md (ARQUIVO PRINCIPAL) parece estar vazio ou incompleto"))
+    if 'T2C Framework' not in text:
+        issues.append(_issue("T2C003", file, "spec.md (ARQUIVO PRINCIPAL) não menciona T2C Framework"))
+
+    present = {section['key'] for section in parse_sections(text) if section['level'] == 2}
+    for title in required_sections:
+        if normalize_title(title) not in present:
+            issues.append(_issue("T2C002", file, f"Seção obrigatória ausente: '## {title}'"))
+    return issues
+
+
+def check_rules(text: str, file: str) -> List[Dict]:
+    """
+    Verifica a numeração das regras VAL*, COND* e EXC* de business-rules.md
+
+    Args:
+        text: Conteúdo de business-rules.md
+        file: Caminho do arquivo (para o relatório)
+
+    Returns:
+        Lista de problemas encontrados
+    """
+    issues = []
+    first_seen: Dict[str, int] = {}
+    numbers_by_prefix: Dict[str, List[int]] = {}
+    for rule in parse_rules(text):
+        if rule['id'] in first_seen:
+            issues.append(_issue(
+                "T2C004", file,
+                f"{rule['id']} duplicado (primeira ocorrência na linha {first_seen[rule['id']]})",
+                rule['line'],
+            ))
+            continue
+        first_seen[rule['id']] = rule['line']
+        numbers_by_prefix.setdefault(rule['prefix'], []).append(rule['number'])
+
+    for prefix, numbers in numbers_by_prefix.items():
+        expected = list(range(1, len(numbers) + 1))
+        if sorted(numbers) != expected:
+            missing = sorted(set(expected) - set(numbers))
+            detail = f"faltando {', '.join(f'{prefix}{n:03d}' for n in missing)}" if missing else "numeração não inicia em 001"
+            issues.append(_issue("T2C005", file, f"Regras {prefix}* fora de sequência: {detail}"))
+        elif numbers != expected:
+            issues.append(_issue("T2C005", file, f"Regras {prefix}* não estão em ordem crescente"))
+    return issues
+
+
+def check_tasks(text: str, file: str, robots: List[str]) -> List[Dict]:
+    """
+    Verifica a consistência entre fases e tasks de tasks.md
+
+    Args:
+        text: Conteúdo de tasks.md
+        file: Caminho do arquivo (para o relatório)
+        robots: Robôs existentes na spec (vazio se standalone)
+
+    Returns:
+        Lista de problemas encontrados
+    """
+    issues = []
+    parsed = parse_tasks(text)
+    seen: Dict[Tuple[str, str], int] = {}
+    minors_by_phase: Dict[int, List[int]] = {}
+    phases_with_tasks = set()
+
+    for task in parsed['tasks']:
+        robot = task['fields'].get('Robô', '')
+        robot = '' if _is_placeholder(robot) else robot.split()[0].strip('`*').lower()
+        key = (task['id'], robot)
+        if key in seen:
+            issues.append(_issue(
+                "T2C007", file,
+                f"Task {task['id']} duplicada (primeira ocorrência na linha {seen[key]})",
+                task['line'],
+            ))
+            continue
+        seen[key] = task['line']
+        phases_with_tasks.add(task['phase'])
+
+        if task['phase'] is None or task['phase'] != task['major']:
+            issues.append(_issue(
+                "T2C006", file,
+                f"Task {task['id']} está fora da Fase {task['major']}",
+                task['line'],
+            ))
+        minors_by_phase.setdefault(task['major'], []).append(task['minor'])
+
+        if robots and robot and robot not in robots and robot != 'raiz':
+            issues.append(_issue(
+                "T2C013", file,
+                f"Task {task['id']} atribuída a '{robot}', robôs disponíveis: {', '.join(robots)}",
+                task['line'],
+            ))
+
+    for phase in parsed['phases']:
+        if phase['number'] not in phases_with_tasks:
+            issues.append(_issue("T2C009", file, f"Fase {phase['number']} não possui tasks", phase['line']))
+
+    # Em múltiplos robôs a numeração recomeça por robô, então só verificamos lacunas
+    for major, minors in minors_by_phase.items():
+        missing = sorted(set(range(1, max(minors) + 1)) - set(minors))
+        if missing:
+            issues.append(_issue(
+                "T2C008", file,
+                f"Fase {major}: faltando {', '.join(f'Task {major}.{n}' for n in missing)}",
+            ))
+    return issues
+
+
+def check_selectors(text: str, file: str) -> List[Dict]:
+    """
+    Verifica o catálogo de seletores: nomes duplicados e locators repetidos
+
+    Args:
+        text: Conteúdo de selectors.md
+        file: Caminho do arquivo (para o relatório)
+
+    Returns:
+        Lista de problemas encontrados
+    """
+    rules = {'duplicate': "T2C014", 'conflict': "T2C015"}
+    return [_issue(rules[issue['kind']], file, issue['message'], issue['line'])
+            for issue in SelectorCatalog(text).issues]
+
+
+def check_references(spec_text: str, spec_file: str, selectors_text: Optional[str],
+                     rules_text: Optional[str]) -> List[Dict]:
+    """
+    Verifica referências cruzadas entre spec.md, selectors.md e business-rules.md
+
+    Args:
+        spec_text: Conteúdo de spec.md
+        spec_file: Caminho de spec.md (para o relatório)
+        selectors_text: Conteúdo de selectors.md (None se ausente)
+        rules_text: Conteúdo de business-rules.md (None se ausente)
+
+    Returns:
+        Lista de problemas encontrados
+    """
+    issues = []
+    spec_lines = spec_text.splitlines()
+
+    def links_to(filename: str):
+        pattern = re.compile(_LINK_PATTERN.format(filename=re.escape(filename)))
+        for line_number, line in enumerate(spec_lines, 1):
+            # O mesmo link costuma aparecer duas vezes na linha ([texto](destino))
+            for anchor in dict.fromkeys(anchor.lower() for anchor in pattern.findall(line)):
+                if not anchor.startswith('['):
+                    yield line_number, anchor
+
+    if selectors_text is not None:
+        anchors = {slugify(heading['title']) for heading in parse_headings(selectors_text)}
+        linked = set()
+        for line_number, anchor in links_to('selectors.md'):
+            linked.add(anchor)
+            if anchor not in anchors:
+                issues.append(_issue("T2C011", spec_file, f"selectors.md#{anchor} não existe", line_number))
+
+        spec_lower = spec_text.lower()
+        for selector in parse_selectors(selectors_text):
+            if _is_placeholder(selector['name']):
+                continue
+            folder_anchor = slugify(f"Pasta: {selector['folder']}")
+            referenced = (
+                selector['anchor'] in linked
+                or folder_anchor in linked
+                or slugify(selector['folder']) in linked
+                or selector['name'].lower() in spec_lower
+            )
+            if not referenced:
+                issues.append(_issue(
+                    "T2C010", spec_file,
+                    f"Seletor '{selector['folder']}.{selector['name']}' não é referenciado em spec.md",
+                ))
+
+    if rules_text is not None:
+        rule_anchors = {slugify(heading['title']) for heading in parse_headings(rules_text)}
+        rule_anchors.update(rule['id'].lower() for rule in parse_rules(rules_text))
+        for line_number, anchor in links_to('business-rules.md'):
+            if anchor not in rule_anchors:
+                issues.append(_issue("T2C012", spec_file, f"business-rules.md#{anchor} não existe", line_number))
+    return issues
+
+
+class SpecValidator:
+    """Classe para validar todas as specs de um projeto em paralelo, com cache por hash"""
+
+    def __init__(self, root: Path, use_cache: bool = True, max_workers: Optional[int] = None):
+        """
+        Inicializa o validador
+
+        Args:
+            root: Raiz do projeto (com specs/) ou diretório de uma spec (specs/001-[nome]/)
+            use_cache: Se False, ignora e não grava o cache em .specify/cache/
+            max_workers: Número de threads (None para o padrão do ThreadPoolExecutor)
+        """
+        self.root = Path(root).resolve()
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.project_root = self._find_project_root()
+        self.cache_path = self.project_root / ".specify" / "cache" / CACHE_FILE
+        self._cache: Dict = {'version': VALIDATOR_VERSION, 'files': {}, 'results': {}}
+        self._hashes: Dict[str, str] = {}
+
+    def _find_project_root(self) -> Path:
+        """Procura o diretório com .specify/ ou specs/ a partir da raiz informada"""
+        for candidate in [self.root, *self.root.parents]:
+            if (candidate / ".specify").is_dir() or (candidate / "specs").is_dir():
+                return candidate
+        return self.root
+
+    def discover_spec_dirs(self) -> List[Path]:
+        """
+        Lista os diretórios de spec a validar
+
+        Returns:
+            Diretórios specs/NNN-*/ (ou apenas a raiz, se ela já for uma spec)
+        """
+        specs_root = self.root / "specs"
+        if specs_root.is_dir():
+            return sorted(entry for entry in specs_root.iterdir() if entry.is_dir())
+        return [self.root]
+
+    def discover_units(self) -> List[Dict]:
+        """
+        Lista as unidades de validação (uma por robô, ou uma por spec standalone)
+
+        Returns:
+            Lista com spec_dir, robot, robots e base_dir de cada unidade
+        """
+        units = []
+        for spec_dir in self.discover_spec_dirs():
+            robots = sorted(
+                (entry.name for entry in spec_dir.iterdir()
+                 if entry.is_dir() and entry.name.startswith("robot") and entry.name[5:].isdigit()),
+                key=lambda name: int(name[5:]),
+            )
+            if robots:
+                for robot in robots:
+                    units.append({'spec_dir': spec_dir, 'robot': robot, 'robots': robots,
+                                  'base_dir': spec_dir / robot})
+            else:
+                units.append({'spec_dir': spec_dir, 'robot': None, 'robots': [], 'base_dir': spec_dir})
+        return units
+
+    def _relative(self, path: Path) -> str:
+        """Caminho relativo à raiz do projeto, em formato posix"""
+        try:
+            return path.resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _file_hash(self, path: Path) -> Optional[str]:
+        """
+        Calcula o hash do arquivo, reaproveitando o cache quando mtime e tamanho não mudaram
+
+        Returns:
+            SHA-256 do conteúdo ou None se o arquivo não existir
+        """
+        key = self._relative(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        cached = self._cache['files'].get(key)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['sha256']
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._cache['files'][key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+        return digest
+
+    def _load_cache(self):
+        """Carrega o cache do disco (descartando-o se for de outra versão)"""
+        if not self.use_cache or not self.cache_path.exists():
+            return
+        try:
+            cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if cache.get('version') == VALIDATOR_VERSION:
+            self._cache = cache
+
+    def _save_cache(self, used_keys: set):
+        """Grava o cache no disco mantendo apenas os resultados usados nesta execução"""
+        if not self.use_cache:
+            return
+        self._cache['results'] = {key: value for key, value in self._cache['results'].items() if key in used_keys}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self._cache), encoding="utf-8")
+
+    def _plan_checks(self, unit: Dict, required_sections: List[str], template_hash: str) -> List[Tuple]:
+        """
+        Monta as verificações de uma unidade com suas chaves de cache
+
+        Returns:
+            Lista de tuplas (chave de cache, função, argumentos)
+        """
+        base_dir = unit['base_dir']
+        paths = {key: base_dir / filename for key, filename in SPEC_FILES.items()}
+        paths['tasks'] = unit['spec_dir'] / 'tasks.md'
+        hashes = {key: self._file_hash(path) for key, path in paths.items()}
+        rel = {key: self._relative(path) for key, path in paths.items()}
+        present = ','.join(sorted(key for key, value in hashes.items() if value))
+
+        checks = [(f"files:{rel['spec']}:{present}", self._check_files, (paths, hashes))]
+        if hashes['spec']:
+            checks.append((f"spec:{rel['spec']}:{hashes['spec']}:{template_hash}",
+                           _check_file, (check_spec, paths['spec'], rel['spec'], required_sections)))
+            checks.append((f"refs:{rel['spec']}:{hashes['spec']}:{hashes['selectors']}:{hashes['business_rules']}",
+                           self._check_references, (paths, hashes, rel)))
+        if hashes['selectors']:
+            checks.append((f"selectors:{rel['selectors']}:{hashes['selectors']}",
+                           _check_file, (check_selectors, paths['selectors'], rel['selectors'])))
+        if hashes['business_rules']:
+            checks.append((f"rules:{rel['business_rules']}:{hashes['business_rules']}",
+                           _check_file, (check_rules, paths['business_rules'], rel['business_rules'])))
+        # tasks.md é compartilhado entre robôs: verificar uma única vez por spec
+        if hashes['tasks'] and (unit['robot'] is None or unit['robot'] == unit['robots'][0]):
+            checks.append((f"tasks:{rel['tasks']}:{hashes['tasks']}:{','.join(unit['robots'])}",
+                           _check_file, (check_tasks, paths['tasks'], rel['tasks'], unit['robots'])))
+        return checks
+
+    def _check_files(self, paths: Dict[str, Path], hashes: Dict[str, Optional[str]]) -> List[Dict]:
+        """Verifica se os arquivos obrigatórios da unidade existem"""
+        return [
+            _issue("T2C001", self._relative(paths[key]), f"Arquivo obrigatório não encontrado: {paths[key].name}")
+            for key in ('spec', 'selectors', 'business_rules', 'tests', 'tasks')
+            if hashes[key] is None
+        ]
+
+    def _check_references(self, paths: Dict[str, Path], hashes: Dict[str, Optional[str]], rel: Dict[str, str]) -> List[Dict]:
+        """Lê os arquivos da unidade e verifica referências cruzadas"""
+        def read(key):
+            return paths[key].read_text(encoding="utf-8") if hashes[key] else None
+        return check_references(read('spec'), rel['spec'], read('selectors'), read('business_rules'))
+
+    def validate(self) -> Dict:
+        """
+        Executa todas as verificações em paralelo
+
+        Returns:
+            Dicionário com issues, units, checks, cached e duration_ms
+        """
+        started = time.perf_counter()
+        self._load_cache()
+        required_sections = load_template_sections()
+        template_hash = hashlib.sha256("\n".join(required_sections).encode("utf-8")).hexdigest()[:16]
+        units = self.discover_units()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            planned = [
+                check
+                for checks in executor.map(lambda unit: self._plan_checks(unit, required_sections, template_hash), units)
+                for check in checks
+            ]
+            results = self._cache['results']
+            pending = [(key, func, args) for key, func, args in planned if key not in results]
+            for (key, _, _), issues in zip(pending, executor.map(lambda check: check[1](*check[2]), pending)):
+                results[key] = issues
+
+        issues = [issue for key, _, _ in planned for issue in results[key]]
+        issues.sort(key=lambda issue: (issue['file'], issue['line'], issue['rule']))
+        self._save_cache({key for key, _, _ in planned})
+
+        return {
+            'root': str(self.project_root),
+            'units': len(units),
+            'checks': len(planned),
+            'cached': len(planned) - len(pending),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'errors': sum(1 for issue in issues if issue['level'] == 'error'),
+            'warnings': sum(1 for issue in issues if issue['level'] == 'warning'),
+            'issues': issues,
+        }
+
+
+def to_json(result: Dict) -> str:
+    """Serializa o resultado da validação em JSON"""
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+def to_sarif(result: Dict) -> str:
+    """
+    Serializa o resultado da validação em SARIF 2.1.0
+
+    Args:
+        result: Resultado de SpecValidator.validate()
+
+    Returns:
+        Documento SARIF em JSON
+    """
+    from rpa_speckit import __version__
+
+    sarif = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "t2c-speckit",
+                    "version": __version__,
+                    "rules": [
+                        {
+                            "id": rule_id,
+                            "shortDescription": {"text": description},
+                            "defaultConfiguration": {"level": level},
+                        }
+                        for rule_id, (level, description) in RULES.items()
+                    ],
+                }
+            },
+            "results": [
+                {
+                    "ruleId": issue['rule'],
+                    "level": issue['level'],
+                    "message": {"text": issue['message']},
+                    "locations": [{
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": issue['file']},
+                            "region": {"startLine": issue['line']},
+                        }
+                    }],
+                }
+                for issue in result['issues']
+            ],
+        }],
+    }
+    return json.dumps(sarif, indent=2, ensure_ascii=False)
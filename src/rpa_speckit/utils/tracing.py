@@ -0,0 +1,232 @@
+"""
+Tracing - Spans e contadores de tempo do toolchain (init, extract, generate)
+
+Desligado por padrão: `span()` devolve um contexto vazio e `count()` retorna
+imediatamente, sem custo mensurável. Ligado pela opção global `t2c --trace out.json`,
+grava os eventos no formato Chrome Trace (abrir em chrome://tracing ou
+https://ui.perfetto.dev) ou em JSON lines se o arquivo terminar em `.jsonl`.
+
+Uso:
+    from rpa_speckit.utils import tracing
+
+    with tracing.span("generate_single_robot", robot="robot1"):
+        ...
+    tracing.count("arquivos_copiados", 17)
+
+    @tracing.traced("extract_ddp")
+    def extract_ddp(...): ...
+"""
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+
+class _NullSpan:
+    """Contexto vazio usado quando o tracing está desligado"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Span:
+    """Contexto que mede um trecho e registra um evento completo ("ph": "X")"""
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add_event({
+            'name': self.name,
+            'cat': 't2c',
+            'ph': 'X',
+            'ts': self.tracer.to_us(self.start),
+            'dur': round((end - self.start) * 1_000_000, 1),
+            'pid': self.tracer.pid,
+            'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+class Tracer:
+    """Coletor de spans e contadores (um por processo, ver `get_tracer`)"""
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.pid: int = os.getpid()
+        self.origin: float = time.perf_counter()
+        self.events: List[Dict] = []
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._null_span = _NullSpan()
+
+    def enable(self):
+        """Liga a coleta e zera os eventos anteriores"""
+        with self._lock:
+            self.enabled = True
+            self.origin = time.perf_counter()
+            self.events = []
+            self.counters = {}
+
+    def to_us(self, instant: float) -> float:
+        """Converte um instante de perf_counter em microssegundos desde `enable()`"""
+        return round((instant - self.origin) * 1_000_000, 1)
+
+    def add_event(self, event: Dict):
+        """Acrescenta um evento já montado (thread-safe)"""
+        with self._lock:
+            self.events.append(event)
+
+    def span(self, name: str, **args):
+        """
+        Retorna o contexto que mede um trecho
+
+        Args:
+            name: Nome do span (ex: "init_project", "download_framework")
+            **args: Atributos exibidos no evento (ex: robot="robot1")
+
+        Returns:
+            Contexto de medição (vazio se o tracing estiver desligado)
+        """
+        if not self.enabled:
+            return self._null_span
+        return _Span(self, name, args)
+
+    def count(self, name: str, value: float = 1):
+        """
+        Soma um valor a um contador e registra o total acumulado ("ph": "C")
+
+        Args:
+            name: Nome do contador (ex: "slides", "arquivos_copiados")
+            value: Incremento
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            total = self.counters.get(name, 0) + value
+            self.counters[name] = total
+            self.events.append({
+                'name': name,
+                'cat': 't2c',
+                'ph': 'C',
+                'ts': self.to_us(time.perf_counter()),
+                'pid': self.pid,
+                'tid': threading.get_ident(),
+                'args': {name: total},
+            })
+
+    def write(self, path: str) -> Path:
+        """
+        Grava os eventos coletados
+
+        Args:
+            path: Arquivo de saída (.jsonl para um evento por linha, senão Chrome Trace JSON)
+
+        Returns:
+            Caminho do arquivo gravado
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event['ts'])
+            counters = dict(self.counters)
+        if output.suffix == ".jsonl":
+            output.write_text("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events),
+                              encoding="utf-8")
+        else:
+            output.write_text(json.dumps({
+                'traceEvents': events,
+                'displayTimeUnit': 'ms',
+                'otherData': {'counters': counters},
+            }, ensure_ascii=False), encoding="utf-8")
+        return output
+
+    def summary(self) -> List[Dict]:
+        """
+        Soma a duração dos spans por nome
+
+        Returns:
+            Lista de {name, calls, total_ms} ordenada pelo maior total
+        """
+        totals: Dict[str, Dict] = {}
+        with self._lock:
+            for event in self.events:
+                if event['ph'] != 'X':
+                    continue
+                entry = totals.setdefault(event['name'], {'name': event['name'], 'calls': 0, 'total_ms': 0.0})
+                entry['calls'] += 1
+                entry['total_ms'] += event['dur'] / 1000
+        return sorted(totals.values(), key=lambda entry: entry['total_ms'], reverse=True)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Retorna o coletor do processo"""
+    return _tracer
+
+
+def enable():
+    """Liga o tracing do processo"""
+    _tracer.enable()
+
+
+def is_enabled() -> bool:
+    """Indica se o tracing está ligado"""
+    return _tracer.enabled
+
+
+def span(name: str, **args):
+    """Atalho para `get_tracer().span(...)`"""
+    return _tracer.span(name, **args)
+
+
+def count(name: str, value: float = 1):
+    """Atalho para `get_tracer().count(...)`"""
+    _tracer.count(name, value)
+
+
+def write(path: str) -> Path:
+    """Atalho para `get_tracer().write(...)`"""
+    return _tracer.write(path)
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator que mede cada chamada da função em um span
+
+    Args:
+        name: Nome do span
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
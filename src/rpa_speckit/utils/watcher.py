@@ -0,0 +1,159 @@
+"""
+Observador de arquivos - Eventos do sistema de arquivos com debounce
+
+Usa o watchdog (inotify no Linux, FSEvents no macOS, ReadDirectoryChangesW no
+Windows) quando instalado (`pip install t2c-speckit[watch]`); sem ele, compara
+snapshots de os.scandir (mtime e tamanho) a cada `poll_interval` segundos.
+Em ambos os casos, eventos próximos (salvar vários arquivos, editores que
+gravam em etapas) são agrupados até `debounce` segundos sem novas mudanças.
+"""
+import os
+import queue
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _QueueHandler(FileSystemEventHandler):
+    """Handler do watchdog que encaminha os caminhos alterados para uma fila"""
+
+    def __init__(self, events: "queue.Queue[str]"):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        self.events.put(event.src_path)
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            self.events.put(dest_path)
+
+
+class FileWatcher:
+    """Classe para observar diretórios e entregar lotes de arquivos alterados"""
+
+    def __init__(self, roots: Iterable[Path], suffixes: Tuple[str, ...] = (".md", ".pptx"),
+                 debounce: float = 0.5, poll_interval: float = 1.0, use_polling: bool = False):
+        """
+        Inicializa o observador
+
+        Args:
+            roots: Diretórios observados (recursivamente); os inexistentes são ignorados
+            suffixes: Extensões de arquivo relevantes
+            debounce: Segundos sem novas mudanças para fechar um lote
+            poll_interval: Intervalo entre snapshots no modo polling
+            use_polling: Força o modo polling mesmo com watchdog instalado
+        """
+        self.roots = [Path(root).resolve() for root in roots]
+        self.suffixes = tuple(suffix.lower() for suffix in suffixes)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.backend = "polling" if use_polling or Observer is None else "watchdog"
+        self._events: "queue.Queue[str]" = queue.Queue()
+        self._observer = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    def _relevant(self, path: str) -> bool:
+        """Filtra por extensão e descarta arquivos temporários (~$arquivo, .#arquivo)"""
+        name = os.path.basename(path)
+        return name.lower().endswith(self.suffixes) and not name.startswith(("~$", ".#"))
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Lista os arquivos relevantes com os.scandir
+
+        Returns:
+            Caminho -> (mtime_ns, tamanho)
+        """
+        files: Dict[str, Tuple[int, int]] = {}
+        pending = [str(root) for root in self.roots]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith((".", "__")):
+                                pending.append(entry.path)
+                        elif self._relevant(entry.name):
+                            stat = entry.stat()
+                            files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return files
+
+    def start(self):
+        """Começa a observar (no modo polling, registra o estado inicial)"""
+        if self.backend == "watchdog":
+            self._observer = Observer()
+            handler = _QueueHandler(self._events)
+            for root in self.roots:
+                if root.is_dir():
+                    self._observer.schedule(handler, str(root), recursive=True)
+            self._observer.start()
+        else:
+            self._snapshot = self.snapshot()
+
+    def stop(self):
+        """Para de observar"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _poll_changes(self) -> Set[str]:
+        """Compara um novo snapshot com o anterior"""
+        current = self.snapshot()
+        changed = {path for path, state in current.items() if self._snapshot.get(path) != state}
+        changed |= set(self._snapshot) - set(current)
+        self._snapshot = current
+        return changed
+
+    def _next_changes(self, timeout: float) -> Set[str]:
+        """Mudanças disponíveis em até `timeout` segundos (vazio se nenhuma)"""
+        if self.backend == "polling":
+            time.sleep(timeout)
+            return self._poll_changes()
+        changed = set()
+        try:
+            changed.add(self._events.get(timeout=timeout))
+            while True:
+                changed.add(self._events.get_nowait())
+        except queue.Empty:
+            pass
+        return {path for path in changed if self._relevant(path)}
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Bloqueia até um lote de mudanças (fechado após `debounce` segundos sem novas mudanças)
+
+        Args:
+            timeout: Máximo de segundos esperando a primeira mudança (None para sempre)
+
+        Returns:
+            Arquivos alterados, criados ou removidos (vazio se o timeout expirou)
+        """
+        started = time.monotonic()
+        interval = self.poll_interval if self.backend == "polling" else 0.5
+        changed: Set[str] = set()
+        while not changed:
+            if timeout is not None and time.monotonic() - started >= timeout:
+                return []
+            changed = self._next_changes(interval)
+
+        # Debounce: continuar coletando enquanto houver mudanças
+        quiet_interval = min(self.debounce, self.poll_interval) if self.backend == "polling" else self.debounce
+        while True:
+            more = self._next_changes(quiet_interval)
+            if not more:
+                break
+            changed |= more
+        return sorted(Path(path) for path in changed)